@@ -5,19 +5,40 @@ con Tkinter y coordina la lectura del Excel, la generación de turnos y la
 exportación del informe.
 
 La UI se organiza en tres áreas principales:
-- Barra de botones (cargar/generar/exportar)
-- Panel izquierdo (datos del Excel y demanda)
-- Panel derecho (turnos generados y resumen)
-- Sección inferior (horarios individuales por trabajador)
+- Barra de botones (cargar/generar/exportar), que actúa sobre la pestaña activa
+- Una pestaña por tienda cargada (ver `pestanas.py`), cada una con:
+    - Panel izquierdo (datos del Excel y demanda)
+    - Panel derecho (turnos generados y resumen)
+    - Sección inferior (horarios individuales por trabajador)
+    - Sección de normativa (incumplimientos de reglas laborales)
+    - Sección de riesgo (simulación de robustez ante variaciones de demanda)
+
+Solo las `PESTANAS_CONSTRUIDAS` pestañas usadas más recientemente tienen
+sus widgets creados; al superar ese número se liberan los de la pestaña
+menos reciente, que conserva sus datos.
+
+`python app.py --perfil muestreo` (o `determinista`) perfila toda la
+sesión y al cerrar la ventana guarda el perfil en
+`PERFILADO['directorio']` (ver `perfilado.py`).
 """
 
+import argparse
+import os
 import tkinter as tk
+from collections import OrderedDict
 from tkinter import ttk, filedialog, messagebox
 from leer_excel import leer_parametros
 from main import generar_asignacion
-from ui_components import DemandaTreeview, TurnosTreeview, HorarioTrabajadoresTreeview
-from config import COLORS, FONTS, WINDOW_SIZE, SHIFT_HORARIOS
+from modelo import VistaHorarios
+from pestanas import PestanaTienda
+from config import COLORS, FONTS, WINDOW_SIZE, DIAS_SEMANA, TURNOS, PESTANAS_CONSTRUIDAS, PERFILADO
 from exportar_excel import exportar_informe_completo
+from simulacion import simular_robustez
+from ediciones import EditorHorarios
+from importar_informe import leer_informe
+from diferencias import diferenciar
+from reglas_laborales import verificar_horarios
+from perfilado import MODOS, Perfilador, agregar_perfiles
 from datetime import datetime
 
 
@@ -25,33 +46,39 @@ class App:
     """Clase principal que crea y gestiona la ventana de la aplicación.
 
     Métodos principales:
-    - `_configurar_estilos`: ajustes visuales globales (ttk.Style)
-    - `_crear_interfaz`: construcción del layout y widgets
-    - `cargar_excel`: interacción para abrir un archivo y mostrar preview
+    - `_configurar_estilos`: ajustes visuales globales (ttk.Style), una sola vez
+    - `_crear_interfaz`: construcción del layout y del cuaderno de pestañas
+    - `cargar_excel`: abre uno o varios libros, cada uno en su pestaña
+    - `cargar_informe`: reabre un informe exportado con sus horarios
     - `generar_turnos`: ejecuta la lógica y actualiza las tablas
+    - `simular_riesgo`: evalúa la asignación ante demanda incierta
+    - `comparar_informe`: resalta los cambios respecto a un informe anterior
+    - `editar_turno` / `deshacer` / `rehacer`: cambios manuales en el horario
     - `exportar_informe`: guarda el resultado en un archivo .xlsx
+    - `cerrar_pestana`: descarta la tienda activa
     """
 
     def __init__(self, root):
         self.root = root
         self.root.title("Generador de Turnos - Cafetería ☕")
 
-        # Aplicar estilos y tamaño de ventana
+        # Aplicar estilos y tamaño de ventana (compartidos por todas las pestañas)
         self._configurar_estilos()
         self.root.configure(bg=COLORS['bg_main'])
         self.root.geometry(WINDOW_SIZE)
 
-        # Variables internas que almacenan el estado de la app
-        self.path_excel = None
-        self.parametros = None
-        self.demanda = None
-        self.matriz_turnos = None
-        self.descanso_sab = None
-        self.descanso_dom = None
-        self.horarios_trabajadores = None
+        # Pestañas abiertas ({id de pestaña: PestanaTienda}) y orden de uso de
+        # las que tienen widgets construidos (la más reciente al final)
+        self.pestanas = {}
+        self.construidas = OrderedDict()
 
         # Construir la interfaz visual
         self._crear_interfaz()
+        self.nueva_pestana()
+
+        # Atajos de teclado para deshacer / rehacer ediciones manuales
+        self.root.bind("<Control-z>", lambda e: self.deshacer())
+        self.root.bind("<Control-y>", lambda e: self.rehacer())
 
     def _configurar_estilos(self):
         """Configura estilos globales (tema, fuentes, colores) para ttk.
@@ -85,8 +112,8 @@ class App:
     def _crear_interfaz(self):
         """Construye el layout principal con un canvas que permite scroll vertical.
 
-        El canvas contiene un `scrollable_frame` donde se colocan las secciones.
-        Esto facilita que toda la aplicación sea navegable en vertical.
+        El canvas contiene un `scrollable_frame` con la barra de botones y el
+        cuaderno de pestañas (una por tienda).
         """
         # Canvas y scrollbar para scroll vertical
         canvas = tk.Canvas(self.root, bg=COLORS['bg_main'], highlightthickness=0)
@@ -113,189 +140,311 @@ class App:
 
         # Crear secciones principales
         self._crear_botones(scrollable_frame)
-        self._crear_paneles(scrollable_frame)
-        self._crear_seccion_trabajadores(scrollable_frame)
+
+        self.notebook = ttk.Notebook(scrollable_frame)
+        self.notebook.pack(fill="both", expand=True)
+        self.notebook.bind("<<NotebookTabChanged>>", self._al_cambiar_pestana)
 
     def _crear_botones(self, parent):
-        """Crea los botones de acción (Cargar, Generar, Exportar)."""
+        """Crea los botones de acción (Cargar, Generar, Simular, Exportar)."""
         buttons_frame = ttk.Frame(parent)
         buttons_frame.pack(pady=10, anchor="center")
 
         ttk.Button(buttons_frame, text="📂 Cargar Excel", 
                   command=self.cargar_excel).pack(side="left", padx=5)
+        ttk.Button(buttons_frame, text="📄 Cargar Informe", 
+                  command=self.cargar_informe).pack(side="left", padx=5)
         ttk.Button(buttons_frame, text="⚙️ Generar Turnos", 
                   command=self.generar_turnos).pack(side="left", padx=5)
+        ttk.Button(buttons_frame, text="🎲 Simular Riesgo", 
+                  command=self.simular_riesgo).pack(side="left", padx=5)
+        ttk.Button(buttons_frame, text="🔍 Comparar", 
+                  command=self.comparar_informe).pack(side="left", padx=5)
         ttk.Button(buttons_frame, text="📥 Exportar a Excel", 
                   command=self.exportar_informe).pack(side="left", padx=5)
+        ttk.Button(buttons_frame, text="✖ Cerrar Pestaña", 
+                  command=self.cerrar_pestana).pack(side="left", padx=5)
+
+    # --- Gestión de pestañas ---
+
+    def nueva_pestana(self):
+        """Agrega una pestaña vacía (sin widgets hasta que se muestre)."""
+        pestana = PestanaTienda(self.notebook, self.editar_turno, self.deshacer, self.rehacer)
+        self.notebook.add(pestana.frame, text=pestana.titulo)
+        self.pestanas[str(pestana.frame)] = pestana
+        return pestana
+
+    def _pestana_actual(self):
+        """Pestaña seleccionada (None si no hay ninguna)."""
+        seleccion = self.notebook.select()
+        return self.pestanas.get(seleccion) if seleccion else None
+
+    def _pestana_para_cargar(self):
+        """Reutiliza la pestaña activa si está vacía; si no, crea una nueva."""
+        pestana = self._pestana_actual()
+        return pestana if pestana and pestana.vacia else self.nueva_pestana()
+
+    def _al_cambiar_pestana(self, event=None):
+        """Construye la pestaña mostrada y libera las menos usadas."""
+        pestana = self._pestana_actual()
+        if pestana is None:
+            return
+        clave = str(pestana.frame)
+        pestana.construir()
+        self.construidas[clave] = pestana
+        self.construidas.move_to_end(clave)
+
+        while len(self.construidas) > PESTANAS_CONSTRUIDAS:
+            _, antigua = self.construidas.popitem(last=False)
+            antigua.liberar()
+
+    def _mostrar_pestana(self, pestana):
+        """Actualiza el título y selecciona la pestaña (construyéndola si hace falta)."""
+        self.notebook.tab(pestana.frame, text=pestana.titulo)
+        if self.notebook.select() != str(pestana.frame):
+            self.notebook.select(pestana.frame)  # dispara <<NotebookTabChanged>>
+        elif pestana.construida:
+            pestana.refrescar()
+        else:
+            self._al_cambiar_pestana()
+
+    def cerrar_pestana(self):
+        """Cierra la pestaña activa y descarta sus datos."""
+        pestana = self._pestana_actual()
+        if pestana is None:
+            return
+        if pestana.horarios_trabajadores and not messagebox.askyesno(
+                "Cerrar pestaña", f"¿Cerrar «{pestana.titulo}»? Los cambios no exportados se perderán."):
+            return
+
+        clave = str(pestana.frame)
+        self.construidas.pop(clave, None)
+        del self.pestanas[clave]
+        self.notebook.forget(pestana.frame)
+        pestana.frame.destroy()
 
-    def _crear_paneles(self, parent):
-        """Crea los paneles izquierdo (datos) y derecho (resultado)."""
-        # Frame contenedor centrado
-        outer = ttk.Frame(parent)
-        outer.pack(fill="x", pady=10)
-
-        container = ttk.Frame(outer)
-        container.pack(anchor="center", padx=50)
-
-        # Panel izquierdo: datos del Excel y tabla de demanda
-        left_frame = ttk.Frame(container)
-        left_frame.pack(side="left", fill="both", expand=True, padx=(0, 5))
-        self._crear_panel_izquierdo(left_frame)
-
-        # Panel derecho: turnos generados y resumen
-        right_frame = ttk.Frame(container)
-        right_frame.pack(side="right", fill="both", expand=True, padx=(5, 0))
-        self._crear_panel_derecho(right_frame)
-
-    def _crear_panel_izquierdo(self, parent):
-        """Sección para mostrar parámetros cargados y la demanda por día."""
-        ttk.Label(parent, text="📊 Datos del Excel", 
-                 style="Title.TLabel").pack(pady=(0, 5))
-
-        # Labels que muestran los parámetros leídos
-        params_frame = ttk.Frame(parent)
-        params_frame.pack(fill="x", pady=(0, 10))
-
-        self.label_fulltime = ttk.Label(params_frame, text="Full-time: -")
-        self.label_fulltime.pack(anchor="w", padx=10, pady=2)
-
-        self.label_parttime = ttk.Label(params_frame, text="Part-time: -")
-        self.label_parttime.pack(anchor="w", padx=10, pady=2)
-
-        self.label_turno = ttk.Label(params_frame, text="Turno: -")
-        self.label_turno.pack(anchor="w", padx=10, pady=2)
-
-        ttk.Separator(parent, orient="horizontal").pack(fill="x", pady=5)
-
-        # Demanda: tabla con scrollbar (componente reutilizable)
-        ttk.Label(parent, text="Demanda por Día:", 
-                 style="Title.TLabel").pack(pady=(5, 5))
-
-        self.demanda_tree = DemandaTreeview(parent)
-        self.demanda_tree.frame.pack(fill="both", expand=True)
-
-    def _crear_panel_derecho(self, parent):
-        """Sección para mostrar los turnos generados y datos de descanso."""
-        ttk.Label(parent, text="⚙️ Turnos Generados", 
-                 style="Title.TLabel").pack(pady=(0, 5))
-
-        self.turnos_tree = TurnosTreeview(parent)
-        self.turnos_tree.frame.pack(fill="both", expand=True)
-
-        # Información adicional sobre descansos en fin de semana
-        info_frame = ttk.Frame(parent)
-        info_frame.pack(fill="x", pady=(10, 0))
-
-        self.label_descanso_sab = ttk.Label(info_frame, text="Descansan Sábado: -")
-        self.label_descanso_sab.pack(anchor="w", padx=10, pady=2)
-
-        self.label_descanso_dom = ttk.Label(info_frame, text="Descansan Domingo: -")
-        self.label_descanso_dom.pack(anchor="w", padx=10, pady=2)
-
-    def _crear_seccion_trabajadores(self, parent):
-        """Sección inferior que muestra el horario semanal por trabajador."""
-        ttk.Separator(parent, orient="horizontal").pack(fill="x", pady=20)
-
-        # Contenedor centrado para el título y la tabla
-        outer = ttk.Frame(parent)
-        outer.pack(fill="x")
-
-        container = ttk.Frame(outer)
-        container.pack(anchor="center", padx=50)
-
-        ttk.Label(container, text="📅 Horario Semanal de Trabajadores", 
-                 style="Title.TLabel").pack(pady=(0, 10))
-        
-        # Frame con los horarios de turnos en dos columnas
-        horarios_frame = ttk.Frame(container)
-        horarios_frame.pack(pady=(0, 10))
-        
-        # Columna izquierda
-        col_izq = ttk.Frame(horarios_frame)
-        col_izq.pack(side="left", padx=15)
-        ttk.Label(col_izq, text=f"Mañana: {SHIFT_HORARIOS['Mañana']}").pack(anchor="w")
-        ttk.Label(col_izq, text=f"Tarde: {SHIFT_HORARIOS['Tarde']}").pack(anchor="w")
-        
-        # Columna derecha
-        col_der = ttk.Frame(horarios_frame)
-        col_der.pack(side="right", padx=15)
-        ttk.Label(col_der, text=f"Intermedio: {SHIFT_HORARIOS['Intermedio']}").pack(anchor="w")
-        ttk.Label(col_der, text=f"Part-Time: {SHIFT_HORARIOS['Part-Time']}").pack(anchor="w")
-
-        self.horario_trabajadores_tree = HorarioTrabajadoresTreeview(container)
-        self.horario_trabajadores_tree.frame.pack(fill="both", expand=True, pady=10)
+        if not self.pestanas:
+            self.nueva_pestana()
+
+    # --- Acciones sobre la pestaña activa ---
 
     def cargar_excel(self):
-        """Diálogo para seleccionar un archivo Excel y leer sus datos.
+        """Diálogo para seleccionar uno o varios Excel; cada uno abre su pestaña.
+
+        Usa `leer_parametros` de `leer_excel.py`. Los widgets de las pestañas
+        nuevas no se crean hasta que se muestran.
+        """
+        rutas = filedialog.askopenfilenames(
+            title="Selecciona tus archivos Excel",
+            filetypes=[("Excel files", "*.xlsx")]
+        )
+
+        if not rutas:
+            return
+
+        errores = []
+        ultima = None
+        for ruta in rutas:
+            try:
+                full, part, turno, demanda = leer_parametros(ruta)
+            except Exception as e:
+                errores.append(f"{ruta}: {e}")
+                continue
+
+            pestana = self._pestana_para_cargar()
+            pestana.path_excel = ruta
+            pestana.parametros = (full, part, turno)
+            pestana.demanda = demanda
+            self.notebook.tab(pestana.frame, text=pestana.titulo)
+            ultima = pestana
+
+        if ultima:
+            self._mostrar_pestana(ultima)
+        if errores:
+            messagebox.showerror("Error", "No se pudieron leer:\n" + "\n".join(errores))
+        elif ultima:
+            messagebox.showinfo("Éxito", 
+                f"✔️ {len(rutas)} archivo(s) cargado(s) correctamente.\n"
+                "Presiona «Generar Turnos» para continuar.")
 
-        Usa `leer_parametros` de `leer_excel.py` y muestra un preview.
+    def generar_turnos(self):
+        """Ejecuta la lógica de asignación y actualiza las tablas de resultado.
+
+        Verifica que primero se haya cargado un Excel en la pestaña activa.
+        """
+        pestana = self._pestana_actual()
+        if not pestana or not pestana.parametros or not pestana.demanda:
+            messagebox.showwarning("Advertencia", "Primero carga un Excel.")
+            return
+
+        full, part, turno = pestana.parametros
+        matriz, descanso_sab, descanso_dom, horarios_trabajadores = generar_asignacion(
+            full, part, turno, pestana.demanda
+        )
+        self._mostrar_resultado(pestana, matriz, descanso_sab, descanso_dom, horarios_trabajadores)
+
+        messagebox.showinfo("Éxito", "✔️ Turnos generados correctamente.")
+
+    def _mostrar_resultado(self, pestana, matriz, descanso_sab, descanso_dom, horarios_trabajadores):
+        """Guarda un resultado (generado o importado) y actualiza las tablas."""
+        # El editor modifica los horarios: se trabaja sobre una copia editable
+        if isinstance(horarios_trabajadores, VistaHorarios):
+            horarios_trabajadores = horarios_trabajadores.a_diccionario()
+
+        # Guardar datos para permitir la exportación posterior
+        pestana.matriz_turnos = matriz
+        pestana.descanso_sab = descanso_sab
+        pestana.descanso_dom = descanso_dom
+        pestana.horarios_trabajadores = horarios_trabajadores
+        pestana.riesgo = None  # La simulación anterior ya no corresponde
+        pestana.cambios = None
+        pestana.editor = EditorHorarios(horarios_trabajadores, matriz)
+
+        # Verificación de reglas laborales en cada generación/carga
+        pestana.incumplimientos = verificar_horarios(horarios_trabajadores)
+
+        # Los widgets se recrean para descartar resaltados y riesgo anteriores
+        pestana.liberar()
+        self._mostrar_pestana(pestana)
+
+    def cargar_informe(self):
+        """Reabre un informe exportado en una pestaña para revisarlo, editarlo o reexportarlo.
+
+        Usa `leer_informe` de `importar_informe.py`: se restauran parámetros,
+        demanda, matriz de turnos, descansos y horarios sin volver a generar.
         """
         ruta = filedialog.askopenfilename(
-            title="Selecciona tu archivo Excel",
+            title="Selecciona un informe exportado",
             filetypes=[("Excel files", "*.xlsx")]
         )
 
         if not ruta:
             return
 
-        self.path_excel = ruta
-
         try:
-            full, part, turno, demanda = leer_parametros(ruta)
-            self.parametros = (full, part, turno)
-            self.demanda = demanda
-            self._mostrar_preview(full, part, turno, demanda)
+            parametros, demanda, matriz, descanso_sab, descanso_dom, horarios = leer_informe(ruta)
         except Exception as e:
-            messagebox.showerror("Error", f"No se pudo leer el archivo:\n{e}")
-
-    def _mostrar_preview(self, ft, pt, turno, demanda):
-        """Actualiza la UI con los parámetros leídos y muestra la demanda."""
-        self.label_fulltime.config(text=f"Full-time: {ft}")
-        self.label_parttime.config(text=f"Part-time: {pt}")
-        self.label_turno.config(text=f"Turno: {turno}")
+            messagebox.showerror("Error", f"No se pudo leer el informe:\n{e}")
+            return
 
-        # Rellenar tabla de demanda
-        self.demanda_tree.actualizar(demanda)
+        pestana = self._pestana_para_cargar()
+        pestana.path_excel = ruta
+        pestana.parametros = parametros
+        pestana.demanda = demanda
+        self._mostrar_resultado(pestana, matriz, descanso_sab, descanso_dom, horarios)
 
-        messagebox.showinfo("Éxito", 
-            "✔️ Datos cargados correctamente.\nPresiona «Generar Turnos» para continuar.")
+        messagebox.showinfo("Éxito", "✔️ Informe cargado correctamente.")
 
-    def generar_turnos(self):
-        """Ejecuta la lógica de asignación y actualiza las tablas de resultado.
+    def editar_turno(self, trabajador, dia, turno):
+        """Aplica un cambio manual de turno y revisa la cobertura de ese día."""
+        pestana = self._pestana_actual()
+        try:
+            deficit = pestana.editor.editar(trabajador, dia, turno)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
 
-        Verifica que primero se haya cargado un Excel.
+        if deficit is not None:
+            self._reflejar_edicion(pestana, trabajador, dia, turno)
+
+    def deshacer(self):
+        """Revierte la última edición manual de la pestaña activa."""
+        pestana = self._pestana_actual()
+        if pestana and pestana.editor:
+            cambio = pestana.editor.deshacer()
+            if cambio:
+                self._reflejar_edicion(pestana, *cambio)
+
+    def rehacer(self):
+        """Vuelve a aplicar la última edición deshecha de la pestaña activa."""
+        pestana = self._pestana_actual()
+        if pestana and pestana.editor:
+            cambio = pestana.editor.rehacer()
+            if cambio:
+                self._reflejar_edicion(pestana, *cambio)
+
+    def _reflejar_edicion(self, pestana, trabajador, dia, turno):
+        """Actualiza la celda editada, la matriz de turnos y la cobertura del día."""
+        if pestana.cambios is not None:
+            # La comparación anterior ya no corresponde: se restauran las celdas
+            pestana.horario_trabajadores_tree.limpiar_cambios(pestana.horarios_trabajadores)
+        pestana.horario_trabajadores_tree.actualizar_celda(trabajador, dia, turno)
+
+        pestana.matriz_turnos = pestana.editor.matriz_efectiva()
+        pestana.turnos_tree.actualizar(pestana.matriz_turnos)
+        pestana.limpiar_riesgo()  # La simulación anterior ya no corresponde
+        pestana.cambios = None
+
+        # Reverificar la normativa solo para el trabajador editado
+        nuevos = verificar_horarios({trabajador: pestana.horarios_trabajadores[trabajador]})
+        pestana.incumplimientos = [fila for fila in pestana.incumplimientos if fila[0] != trabajador] + nuevos
+        pestana.normativa_tree.actualizar_trabajador(trabajador, nuevos)
+        pestana.mostrar_total_normativa()
+
+        deficit = pestana.editor.deficit_dia(DIAS_SEMANA.index(dia))
+        if deficit.any():
+            faltan = ", ".join(f"{n} {t}" for n, t in zip(deficit, TURNOS) if n)
+            pestana.label_cobertura.config(text=f"⚠️ {dia}: faltan {faltan}")
+        else:
+            pestana.label_cobertura.config(text=f"✅ {dia}: cobertura completa")
+
+    def comparar_informe(self):
+        """Compara los horarios actuales con los de un informe publicado antes.
+
+        Las celdas que cambiaron se resaltan en la tabla de horarios y la
+        comparación se incluye como hoja "Cambios" al exportar.
         """
-        if not self.parametros or not self.demanda:
-            messagebox.showwarning("Advertencia", "Primero carga un Excel.")
+        pestana = self._pestana_actual()
+        if not pestana or not pestana.horarios_trabajadores:
+            messagebox.showwarning("Advertencia", "Primero genera o carga los turnos.")
             return
 
-        full, part, turno = self.parametros
-        matriz, descanso_sab, descanso_dom, horarios_trabajadores = generar_asignacion(
-            full, part, turno, self.demanda
+        ruta = filedialog.askopenfilename(
+            title="Selecciona el informe con el que comparar",
+            filetypes=[("Excel files", "*.xlsx")]
         )
 
-        # Guardar datos para permitir la exportación posterior
-        self.matriz_turnos = matriz
-        self.descanso_sab = descanso_sab
-        self.descanso_dom = descanso_dom
-        self.horarios_trabajadores = horarios_trabajadores
+        if not ruta:
+            return
 
-        # Actualizar componentes visuales con los resultados
-        self.turnos_tree.actualizar(matriz)
-        self.horario_trabajadores_tree.actualizar(horarios_trabajadores)
+        try:
+            horarios_anteriores = leer_informe(ruta)[5]
+            cambios = diferenciar(horarios_anteriores, pestana.horarios_trabajadores)
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo comparar el informe:\n{e}")
+            return
 
-        self.label_descanso_sab.config(text=f"✅ Descansan Sábado: {descanso_sab}")
-        self.label_descanso_dom.config(text=f"✅ Descansan Domingo: {descanso_dom}")
+        pestana.cambios = cambios
+        pestana.horario_trabajadores_tree.resaltar_cambios(cambios, pestana.horarios_trabajadores)
 
-        messagebox.showinfo("Éxito", "✔️ Turnos generados correctamente.")
+        n_trabajadores = len(pestana.cambios['cambios_por_trabajador'])
+        n_celdas = len(pestana.cambios['celdas'])
+        pestana.label_cobertura.config(
+            text=f"🔍 {n_trabajadores} trabajadores con cambios ({n_celdas} celdas)")
+
+    def simular_riesgo(self):
+        """Simula la asignación actual frente a muestras aleatorias de demanda.
+
+        Usa `simular_robustez` con los valores por defecto de `SIMULACION`
+        (semilla fija, por lo que dos ejecuciones dan el mismo resultado);
+        entre los percentiles calculados siempre está `SIMULACION['percentil']`.
+        """
+        pestana = self._pestana_actual()
+        if not pestana or pestana.matriz_turnos is None:
+            messagebox.showwarning("Advertencia", "Primero genera los turnos.")
+            return
+
+        pestana.riesgo = simular_robustez(pestana.matriz_turnos, pestana.demanda)
+        pestana.mostrar_riesgo()
 
     def exportar_informe(self):
-        """Permite al usuario guardar el informe completo en un .xlsx.
+        """Permite al usuario guardar el informe completo de la pestaña activa en un .xlsx.
 
         Abre un diálogo para seleccionar la ruta y delega la creación del
         archivo en `exportar_informe_completo`.
         """
-        if not self.horarios_trabajadores:
+        pestana = self._pestana_actual()
+        if not pestana or not pestana.horarios_trabajadores:
             messagebox.showwarning("Advertencia", 
                 "Primero debes generar los turnos antes de exportar.")
             return
@@ -317,12 +466,15 @@ class App:
         try:
             exportar_informe_completo(
                 ruta,
-                self.parametros,
-                self.demanda,
-                self.matriz_turnos,
-                self.descanso_sab,
-                self.descanso_dom,
-                self.horarios_trabajadores
+                pestana.parametros,
+                pestana.demanda,
+                pestana.matriz_turnos,
+                pestana.descanso_sab,
+                pestana.descanso_dom,
+                pestana.horarios_trabajadores,
+                riesgo=pestana.riesgo,
+                cambios=pestana.cambios,
+                incumplimientos=pestana.incumplimientos
             )
             messagebox.showinfo("Éxito", 
                 f"✔️ Informe exportado correctamente a:\n{ruta}")
@@ -332,7 +484,25 @@ class App:
 
 
 
-if __name__ == "__main__":
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Generador de turnos")
+    parser.add_argument("--perfil", "--profile", choices=MODOS,
+                        help="Perfilar la sesión y guardar el perfil al cerrar la ventana")
+    args = parser.parse_args(argv)
+
     root = tk.Tk()
-    app = App(root)
-    root.mainloop()
+    App(root)
+    if not args.perfil:
+        root.mainloop()
+        return
+
+    with Perfilador(args.perfil) as perfilador:
+        root.mainloop()
+    directorio = os.path.join(PERFILADO['directorio'], f"sesion_{datetime.now():%Y%m%d_%H%M%S}")
+    perfilador.guardar(os.path.join(directorio, "app"))
+    agregar_perfiles(directorio, modo=args.perfil)
+    print(f"Perfil guardado en {directorio}")
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,452 @@
+"""Archivo anual por tienda: un libro por año con dos hojas por semana.
+
+Cada semana agrega las hojas "SNN Resumen" y "SNN Horario" (mismo
+contenido y celdas que "Resumen General" y "Horario Semanal" de
+`exportar_informe_completo`), sin abrir ni reescribir el libro completo:
+
+- El libro lo escribe este módulo a mano como paquete xlsx mínimo: estilos
+  fijos en `xl/styles.xml` (los índices de `cellXfs` se conocen de
+  antemano) y hojas con cadenas en línea (`inlineStr`), de modo que una
+  hoja nueva no necesita tocar `sharedStrings.xml` ni el resto de hojas.
+- Para anexar se abre el zip en modo 'a': las hojas nuevas se escriben al
+  final y solo se reemplazan los manifiestos pequeños (`xl/workbook.xml`,
+  `xl/_rels/workbook.xml.rels` y `[Content_Types].xml`). Las versiones
+  anteriores de esos manifiestos se quitan del directorio central del zip,
+  así que quedan solo como bytes sin referencia; `compactar_archivo` los
+  elimina (p. ej. al cerrar el año).
+
+El costo de anexar depende solo del tamaño de la semana nueva y de la
+cantidad de hojas (los manifiestos), no de los datos ya archivados.
+
+Uso:
+    python archivo_anual.py entradas/ archivo/ --semana 42
+    python archivo_anual.py informes/ archivo/ --semana 42 --anio 2026 --informes
+"""
+
+import argparse
+import math
+import numbers
+import os
+import re
+import shutil
+import zipfile
+from datetime import date, datetime
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape, quoteattr
+
+from openpyxl.utils import get_column_letter
+from config import DIAS_SEMANA, TURNOS, CODIGOS_TURNO
+from diferencias import matriz_codigos
+
+_NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NS_RELS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_TIPO_HOJA = _NS_R + "/worksheet"
+_CT_HOJA = "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+
+_WORKBOOK = "xl/workbook.xml"
+_WORKBOOK_RELS = "xl/_rels/workbook.xml.rels"
+_CONTENT_TYPES = "[Content_Types].xml"
+
+# --- Estilos (índices de cellXfs en `_estilos_xml`) ---
+TITULO, ENCABEZADO, ENCABEZADO_TABLA, SUBENCABEZADO, DERECHA, BORDE = 1, 2, 3, 4, 5, 6
+_TURNO = 7  # + código de turno (ver `CODIGOS_TURNO`)
+_COLORES_TURNO = {"Libre": "F2F2F2", "Mañana": "FFF2CC", "Intermedio": "E2EFDA",
+                  "Tarde": "FCE4D6", "Part-Time": "DDEBF7"}
+
+
+def _relleno(color):
+    return (f'<fill><patternFill patternType="solid"><fgColor rgb="FF{color}"/>'
+            f'<bgColor rgb="FF{color}"/></patternFill></fill>')
+
+
+def _estilos_xml():
+    """styles.xml con los estilos del informe en posiciones fijas."""
+    rellenos = ['<fill><patternFill patternType="none"/></fill>',
+                '<fill><patternFill patternType="gray125"/></fill>',
+                _relleno("2E75B6"), _relleno("4472C4"), _relleno("D9E1F2")]
+    relleno_turno = {}
+    for turno, color in _COLORES_TURNO.items():
+        relleno_turno[turno] = len(rellenos)
+        rellenos.append(_relleno(color))
+
+    centro = '<alignment horizontal="center" vertical="center"/>'
+    xfs = [
+        '<xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>',
+        ('<xf numFmtId="0" fontId="1" fillId="2" borderId="0" '
+         f'applyFont="1" applyFill="1" applyAlignment="1">{centro}</xf>'),
+        '<xf numFmtId="0" fontId="2" fillId="3" borderId="0" applyFont="1" applyFill="1"/>',
+        ('<xf numFmtId="0" fontId="2" fillId="3" borderId="1" '
+         f'applyFont="1" applyFill="1" applyBorder="1" applyAlignment="1">{centro}</xf>'),
+        ('<xf numFmtId="0" fontId="3" fillId="4" borderId="0" '
+         f'applyFont="1" applyFill="1" applyAlignment="1">{centro}</xf>'),
+        ('<xf numFmtId="0" fontId="0" fillId="0" borderId="0" applyAlignment="1">'
+         '<alignment horizontal="right" vertical="center"/></xf>'),
+        '<xf numFmtId="0" fontId="0" fillId="0" borderId="1" applyBorder="1"/>',
+    ]
+    for turno in CODIGOS_TURNO:
+        xfs.append(f'<xf numFmtId="0" fontId="0" fillId="{relleno_turno.get(turno, 0)}" borderId="1" '
+                   f'applyFill="1" applyBorder="1" applyAlignment="1">{centro}</xf>')
+
+    lado = '<{0} style="thin"><color indexed="64"/></{0}>'
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<styleSheet xmlns="{_NS_MAIN}">'
+        '<fonts count="4">'
+        '<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+        '<font><b/><sz val="14"/><color rgb="FFFFFFFF"/><name val="Arial"/><family val="2"/></font>'
+        '<font><b/><sz val="12"/><color rgb="FFFFFFFF"/><name val="Arial"/><family val="2"/></font>'
+        '<font><b/><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+        '</fonts>'
+        f'<fills count="{len(rellenos)}">{"".join(rellenos)}</fills>'
+        '<borders count="2"><border><left/><right/><top/><bottom/><diagonal/></border>'
+        f'<border>{"".join(lado.format(l) for l in ("left", "right", "top", "bottom"))}<diagonal/></border>'
+        '</borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        f'<cellXfs count="{len(xfs)}">{"".join(xfs)}</cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>'
+    )
+
+
+_ESQUELETO = {
+    _CONTENT_TYPES: (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<Relationships xmlns="{_NS_RELS}">'
+        f'<Relationship Id="rId1" Type="{_NS_R}/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    _WORKBOOK: (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<workbook xmlns="{_NS_MAIN}" xmlns:r="{_NS_R}"><sheets></sheets></workbook>'
+    ),
+    _WORKBOOK_RELS: (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<Relationships xmlns="{_NS_RELS}">'
+        f'<Relationship Id="rId1" Type="{_NS_R}/styles" Target="styles.xml"/>'
+        '</Relationships>'
+    ),
+    "xl/styles.xml": _estilos_xml(),
+}
+_ESTILOS_NECESARIOS = _TURNO + len(CODIGOS_TURNO)
+
+
+# --- Hojas ---
+
+_CARACTERES_INVALIDOS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _celda(ref, valor, estilo):
+    s = f' s="{estilo}"' if estilo else ""
+    if valor is None:
+        return f'<c r="{ref}"{s}/>'
+    if isinstance(valor, numbers.Number) and not isinstance(valor, bool):
+        valor = int(valor) if isinstance(valor, numbers.Integral) else float(valor)
+        # Excel no acepta NaN ni infinitos en <v>: la celda queda vacía
+        if not math.isfinite(valor):
+            return f'<c r="{ref}"{s}/>'
+        return f'<c r="{ref}"{s}><v>{valor!r}</v></c>'
+    texto = escape(_CARACTERES_INVALIDOS.sub("", str(valor)))
+    return f'<c r="{ref}"{s} t="inlineStr"><is><t xml:space="preserve">{texto}</t></is></c>'
+
+
+def hoja_xml(filas, anchos=None, combinadas=()):
+    """XML de una hoja con cadenas en línea.
+
+    Args:
+        filas (list): una lista por fila; cada celda es None (vacía) o una
+            tupla (valor, estilo) con el índice de `cellXfs`
+        anchos (dict, opcional): {letra de columna: ancho}
+        combinadas (iterable): rangos combinados, p. ej. "A1:E1"
+    """
+    partes = ['<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+              f'<worksheet xmlns="{_NS_MAIN}" xmlns:r="{_NS_R}">']
+    if anchos:
+        partes.append("<cols>")
+        for letra, ancho in sorted(anchos.items(), key=lambda x: (len(x[0]), x[0])):
+            k = sum((ord(ch) - 64) * 26 ** e for e, ch in enumerate(reversed(letra)))
+            partes.append(f'<col min="{k}" max="{k}" width="{ancho}" customWidth="1"/>')
+        partes.append("</cols>")
+
+    partes.append("<sheetData>")
+    for r, fila in enumerate(filas, start=1):
+        celdas = [_celda(f"{get_column_letter(c)}{r}", *celda)
+                  for c, celda in enumerate(fila, start=1) if celda is not None]
+        if celdas:
+            partes.append(f'<row r="{r}">{"".join(celdas)}</row>')
+    partes.append("</sheetData>")
+
+    combinadas = list(combinadas)
+    if combinadas:
+        partes.append(f'<mergeCells count="{len(combinadas)}">')
+        partes.extend(f'<mergeCell ref="{rango}"/>' for rango in combinadas)
+        partes.append("</mergeCells>")
+    partes.append("</worksheet>")
+    return "".join(partes)
+
+
+def filas_resumen(semana, parametros, demanda, matriz_turnos, descanso_sab, descanso_dom):
+    """Filas de "Resumen General" (mismas celdas que el informe individual)."""
+    full_time, part_time, tipo = parametros
+    filas = [
+        [("INFORME DE TURNOS - CAFETERÍA", TITULO)],
+        [(f"Semana {semana} — Generado: {datetime.now().strftime('%d/%m/%Y %H:%M')}", 0)],
+        [],
+        [("PARÁMETROS", ENCABEZADO), None, None, ("DEMANDA SEMANAL", ENCABEZADO),
+         None, None, None, None, ("AFLUENCIA ESTIMADA", ENCABEZADO)],
+    ]
+    encabezados = [(t, SUBENCABEZADO) for t in ["Día", *TURNOS]]
+    filas.append([("Trabajadores Full-Time:", 0), (full_time, 0), None, *encabezados, None, *encabezados])
+
+    etiquetas = [("Trabajadores Part-Time:", part_time, 0), ("Tipo de Turno:", tipo, DERECHA),
+                 ("Descansan Sábado:", descanso_sab, 0), ("Descansan Domingo:", descanso_dom, 0)]
+    for i, dia in enumerate(DIAS_SEMANA):
+        fila = [None, None, None]
+        if i < len(etiquetas):
+            texto, valor, estilo = etiquetas[i]
+            fila = [(texto, 0), (valor, estilo), None]
+        fila += [(dia, 0), *((int(v), 0) for v in matriz_turnos[i]), None,
+                 (dia, 0), *((demanda[dia][t], 0) for t in TURNOS)]
+        filas.append(fila)
+    return filas
+
+
+def filas_horario(horarios_trabajadores):
+    """Filas de "Horario Semanal": FT primero, luego PT, cada celda con el color de su turno."""
+    trabajadores, codigos = matriz_codigos(horarios_trabajadores)
+    orden = sorted(range(len(trabajadores)),
+                   key=lambda k: (not trabajadores[k].startswith("Trabajador"), trabajadores[k]))
+
+    filas = [[("HORARIO SEMANAL POR TRABAJADOR", TITULO)], [],
+             [(t, ENCABEZADO_TABLA) for t in ["Trabajador", *DIAS_SEMANA]]]
+    # La última entrada corresponde a `SIN_REGISTRO` (-1): turno desconocido
+    celdas = [(turno, _TURNO + k) for k, turno in enumerate(CODIGOS_TURNO)]
+    celdas.append(("(sin registro)", BORDE))
+    for k in orden:
+        filas.append([(trabajadores[k], BORDE), *(celdas[c] for c in codigos[k].tolist())])
+    return filas
+
+
+_ANCHOS_RESUMEN = {'A': 25, 'B': 15, 'D': 15, 'E': 12, 'F': 12, 'G': 12, 'I': 15, 'J': 12, 'K': 12, 'L': 12}
+_ANCHOS_HORARIO = {'A': 20, **{get_column_letter(i): 14 for i in range(2, 9)}}
+
+
+# --- Paquete ---
+
+def nombres_hojas(semana):
+    """Nombres de las hojas (resumen, horario) de una semana."""
+    return f"S{semana:02d} Resumen", f"S{semana:02d} Horario"
+
+
+def ruta_archivo(directorio, tienda, anio=None):
+    """Ruta del archivo anual de una tienda."""
+    return os.path.join(directorio, f"Archivo_{tienda}_{anio or date.today().year}.xlsx")
+
+
+def _hojas_existentes(workbook_xml):
+    raiz = ElementTree.fromstring(workbook_xml)
+    return [(h.get("name"), int(h.get("sheetId"))) for h in raiz.iter(f"{{{_NS_MAIN}}}sheet")]
+
+
+def semanas_archivadas(ruta):
+    """Semanas presentes en un archivo anual (según los nombres de sus hojas)."""
+    if not os.path.exists(ruta):
+        return []
+    with zipfile.ZipFile(ruta) as zf:
+        nombres = [n for n, _ in _hojas_existentes(zf.read(_WORKBOOK))]
+    return sorted({int(m.group(1)) for m in map(re.compile(r"S(\d+) Resumen$").match, nombres) if m})
+
+
+def _insertar_antes(xml, cierre, fragmento):
+    """Inserta `fragmento` antes de la etiqueta de cierre `cierre` (o la expande si está vacía)."""
+    k = xml.rfind(cierre)
+    if k < 0:
+        vacia = cierre.replace("</", "<").replace(">", "/>")
+        k = xml.rfind(vacia)
+        if k < 0:
+            raise ValueError(f"Manifiesto del archivo sin {cierre}.")
+        return xml[:k] + vacia[:-2] + ">" + fragmento + cierre + xml[k + len(vacia):]
+    return xml[:k] + fragmento + xml[k:]
+
+
+def _reemplazar(zf, nombre, contenido):
+    """Escribe una nueva versión de `nombre`, quitando la anterior del directorio central."""
+    anterior = zf.NameToInfo.pop(nombre, None)
+    if anterior is not None:
+        zf.filelist.remove(anterior)
+    zf.writestr(nombre, contenido)
+
+
+def _crear(ruta):
+    with zipfile.ZipFile(ruta, "w", zipfile.ZIP_DEFLATED) as zf:
+        for nombre, contenido in _ESQUELETO.items():
+            zf.writestr(nombre, contenido)
+
+
+def anexar_hojas(ruta, hojas):
+    """Agrega hojas a un archivo creado por este módulo sin reescribir las existentes.
+
+    Args:
+        ruta (str): archivo .xlsx (se crea si no existe)
+        hojas (list): tuplas (nombre, xml de la hoja)
+
+    Raises:
+        ValueError: si alguna hoja ya existe o el libro no tiene los estilos
+            de este módulo (p. ej. no fue creado por `archivo_anual`).
+    """
+    nuevo = not os.path.exists(ruta)
+    if nuevo:
+        _crear(ruta)
+
+    tamano = os.path.getsize(ruta)
+    with open(ruta, "rb") as f:
+        # Directorio central original: el modo 'a' escribe encima de él
+        with zipfile.ZipFile(f) as zf:
+            inicio = zf.start_dir
+        f.seek(inicio)
+        cola = f.read()
+
+    try:
+        with zipfile.ZipFile(ruta, "a", zipfile.ZIP_DEFLATED) as zf:
+            estilos = ElementTree.fromstring(zf.read("xl/styles.xml"))
+            xfs = estilos.find(f"{{{_NS_MAIN}}}cellXfs")
+            if xfs is None or len(xfs) < _ESTILOS_NECESARIOS:
+                raise ValueError(f"{ruta} no es un archivo anual (estilos desconocidos).")
+
+            workbook = zf.read(_WORKBOOK).decode("utf-8")
+            rels = zf.read(_WORKBOOK_RELS).decode("utf-8")
+            tipos = zf.read(_CONTENT_TYPES).decode("utf-8")
+
+            existentes = _hojas_existentes(workbook)
+            usados = {n.lower() for n, _ in existentes}
+            for nombre, _ in hojas:
+                if len(nombre) > 31 or nombre.lower() in usados:
+                    raise ValueError(f"La hoja '{nombre}' ya existe en {ruta} o su nombre no es válido.")
+                usados.add(nombre.lower())
+
+            ids_rel = [int(m) for m in re.findall(r'Id="rId(\d+)"', rels)]
+            siguiente_rel = max(ids_rel, default=0) + 1
+            siguiente_hoja = max((i for _, i in existentes), default=0) + 1
+            partes = set(zf.NameToInfo)
+            parte = 1
+
+            nuevas_hojas, nuevas_rels, nuevos_tipos = [], [], []
+            for nombre, xml in hojas:
+                while f"xl/worksheets/sheet{parte}.xml" in partes:
+                    parte += 1
+                destino = f"xl/worksheets/sheet{parte}.xml"
+                partes.add(destino)
+                zf.writestr(destino, xml)
+
+                rid = f"rId{siguiente_rel}"
+                nuevas_hojas.append(f'<sheet name={quoteattr(nombre)} '
+                                    f'sheetId="{siguiente_hoja}" r:id="{rid}"/>')
+                nuevas_rels.append(f'<Relationship Id="{rid}" Type="{_TIPO_HOJA}" '
+                                   f'Target="worksheets/sheet{parte}.xml"/>')
+                nuevos_tipos.append(f'<Override PartName="/{destino}" ContentType="{_CT_HOJA}"/>')
+                siguiente_rel += 1
+                siguiente_hoja += 1
+
+            _reemplazar(zf, _WORKBOOK, _insertar_antes(workbook, "</sheets>", "".join(nuevas_hojas)))
+            _reemplazar(zf, _WORKBOOK_RELS, _insertar_antes(rels, "</Relationships>", "".join(nuevas_rels)))
+            _reemplazar(zf, _CONTENT_TYPES, _insertar_antes(tipos, "</Types>", "".join(nuevos_tipos)))
+    except BaseException:
+        # Restaurar el directorio central original: el archivo vuelve a su estado previo
+        if nuevo:
+            os.remove(ruta)
+        else:
+            with open(ruta, "r+b") as f:
+                f.seek(inicio)
+                f.write(cola)
+                f.truncate(tamano)
+        raise
+
+
+def anexar_semana(ruta, semana, parametros, demanda, matriz_turnos, descanso_sab, descanso_dom,
+                  horarios_trabajadores):
+    """Agrega las hojas de resumen y horario de una semana al archivo anual.
+
+    Args:
+        ruta (str): archivo anual (se crea si no existe)
+        semana (int): semana ISO (1-53)
+        parametros, demanda, matriz_turnos, descanso_sab, descanso_dom,
+        horarios_trabajadores: los mismos datos de `exportar_informe_completo`
+
+    Returns:
+        tuple: nombres de las hojas agregadas
+    """
+    semana = int(semana)
+    if not 1 <= semana <= 53:
+        raise ValueError(f"Semana fuera de rango: {semana}")
+    hoja_resumen, hoja_horario = nombres_hojas(semana)
+    anexar_hojas(ruta, [
+        (hoja_resumen, hoja_xml(
+            filas_resumen(semana, parametros, demanda, matriz_turnos, descanso_sab, descanso_dom),
+            _ANCHOS_RESUMEN, ["A1:E1", "A2:E2", "A4:B4", "D4:G4", "I4:L4"])),
+        (hoja_horario, hoja_xml(filas_horario(horarios_trabajadores), _ANCHOS_HORARIO, ["A1:H1"])),
+    ])
+    return hoja_resumen, hoja_horario
+
+
+def leer_semana(ruta, semana):
+    """Lee una semana archivada (misma tupla que `importar_informe.leer_informe`)."""
+    from importar_informe import leer_informe
+    return leer_informe(ruta, *nombres_hojas(int(semana)))
+
+
+def compactar_archivo(ruta):
+    """Reescribe el archivo sin las versiones viejas de los manifiestos.
+
+    Copia solo las entradas del directorio central a un temporal y lo
+    reemplaza con `os.replace`; un corte durante la compactación deja
+    intacto el original.
+    """
+    temporal = ruta + ".tmp"
+    with zipfile.ZipFile(ruta) as origen, zipfile.ZipFile(temporal, "w") as destino:
+        for info in origen.infolist():
+            with origen.open(info) as entrada, destino.open(info, "w") as salida:
+                shutil.copyfileobj(entrada, salida)
+    os.replace(temporal, ruta)
+
+
+def main_cli(argv=None):
+    from exportar_consolidado import resultados_desde_directorio
+
+    parser = argparse.ArgumentParser(description="Agrega una semana al archivo anual de cada tienda")
+    parser.add_argument("entrada", help="Directorio con un libro por tienda")
+    parser.add_argument("directorio", help="Directorio de los archivos anuales")
+    parser.add_argument("--semana", type=int, default=date.today().isocalendar()[1])
+    parser.add_argument("--anio", type=int, default=date.today().year)
+    parser.add_argument("--informes", action="store_true",
+                        help="La entrada contiene informes exportados en vez de libros de parámetros")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.directorio, exist_ok=True)
+    total, fallidos = 0, []
+    for nombre, parametros, demanda, matriz, sab, dom, horarios in \
+            resultados_desde_directorio(args.entrada, args.informes, fallidos):
+        ruta = ruta_archivo(args.directorio, nombre, args.anio)
+        try:
+            anexar_semana(ruta, args.semana, parametros, demanda, matriz, sab, dom, horarios)
+        except ValueError as e:
+            print(f"✘ {nombre}: {e}")
+            continue
+        total += 1
+    for ruta, error in fallidos:
+        print(f"✘ {ruta} omitido: {error}")
+    print(f"✔️ Semana {args.semana} agregada a {total} archivos en {args.directorio}")
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,470 @@
+"""Banco de pruebas para comparar estrategias y rutas de ejecución.
+
+Ejecuta todas las combinaciones de estrategias registradas (reparto x
+horario, ver `estrategias.py`) sobre el mismo conjunto de escenarios y
+muestra, lado a lado:
+- tiempo de ejecución (mediana por escenario, en ms)
+- memoria máxima reservada durante la ejecución (tracemalloc, en KB)
+- calidad de la cobertura:
+    * `sin_cubrir`: cupos de la matriz que el horario no logró llenar
+    * `desviacion`: diferencia absoluta entre el personal realmente
+      asignado y el requerimiento ideal (afluencia escalada a la capacidad),
+      como porcentaje del requerimiento total
+    * `incumplimientos`: incumplimientos de `reglas_laborales` en los
+      horarios resultantes (el reparto "optimo" no modela el descanso
+      entre jornadas)
+
+El subcomando `escalamiento` mide, para plantillas de tamaño creciente,
+el tiempo de cada estrategia de reparto (sola y con el pipeline completo)
+y su calidad; sirve para comparar el reparto exacto ("optimo") con el
+heurístico ("proporcional").
+
+El subcomando `exportacion` compara, en filas por segundo (una fila por
+trabajador y día), el informe xlsx contra la exportación columnar
+(`exportar_columnar.py`) en cada formato disponible.
+
+El subcomando `asignaciones` compara la representación anterior de los
+resultados (tuplas con diccionarios de demanda y horarios) con el modelo
+inmutable de `modelo.py`: tiempo del pipeline, memoria retenida al
+conservar todos los resultados, bloques de memoria reservados y tamaño
+serializado con pickle (lo que viaja entre procesos en `lote.py`).
+
+El subcomando `archivo` anexa semanas a un archivo anual y mide el
+tiempo de cada anexión a medida que el archivo crece: `archivo_anual.py`
+(anexión a nivel de zip) frente a cargar el libro con openpyxl, agregar
+las hojas y guardarlo completo.
+
+Uso:
+    python benchmark.py estrategias --escenarios 30 --semilla 1
+    python benchmark.py estrategias --directorio historico/   # escenarios desde Excel
+    python benchmark.py escalamiento --tamanos 10 100 1000 5000
+    python benchmark.py exportacion --escenarios 20
+    python benchmark.py asignaciones --escenarios 30
+    python benchmark.py archivo --semanas 20 --full-time 300
+"""
+
+import argparse
+import glob
+import os
+import pickle
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from main import (  # importar `main` registra las estrategias por defecto
+    generar_asignacion, resolver, afluencias_desde_demanda, requerimiento_personal, contar_turnos,
+    repartir_proporcional, horario_primer_ajuste_clasico,
+)
+from modelo import Escenario
+from estrategias import ESTRATEGIAS_REPARTO, ESTRATEGIAS_HORARIO
+from patrones_descanso import patrones_fin_de_semana, disponibilidad_por_dia, descansos_por_dia
+from leer_excel import leer_parametros
+from reglas_laborales import verificar_horarios
+from pronostico import a_demanda
+from exportar_excel import exportar_informe_completo
+from exportar_columnar import EscritorColumnar, FORMATOS, pa
+import archivo_anual
+import openpyxl
+
+# Perfil de afluencia del libro de ejemplo (filas: días, columnas: turnos)
+PERFIL_DEMANDA = np.array([
+    [80, 120, 150], [70, 110, 140], [200, 160, 90], [200, 50, 220],
+    [100, 100, 100], [400, 200, 500], [400, 400, 100],
+], dtype=float)
+
+
+def generar_escenarios(cantidad=30, semilla=0, max_ft=2000, max_pt=200):
+    """Crea escenarios sintéticos variando plantilla y demanda.
+
+    La demanda parte del perfil del libro de ejemplo y se perturba celda a
+    celda, de modo que todos los escenarios son realistas pero distintos.
+
+    Returns:
+        list: tuplas (full_time, part_time, tipo, demanda)
+    """
+    rng = np.random.default_rng(semilla)
+    perfil = PERFIL_DEMANDA
+
+    # Plantillas en escala logarítmica para cubrir tiendas pequeñas y grandes
+    full_time = np.unique(np.geomspace(5, max_ft, cantidad).astype(int))
+    escenarios = []
+    for ft in full_time:
+        pt = int(rng.integers(0, max(1, min(max_pt, ft // 2)) + 1))
+        tipo = "A" if rng.random() < 0.5 else "B"
+        demanda = a_demanda(perfil * rng.uniform(0.5, 1.5, perfil.shape) * ft / 20 + 1)
+        escenarios.append((int(ft), pt, tipo, demanda))
+    return escenarios
+
+
+def escenarios_desde_directorio(directorio):
+    """Lee como escenarios todos los libros de parámetros de un directorio."""
+    return [leer_parametros(ruta) for ruta in sorted(glob.glob(os.path.join(directorio, "*.xlsx")))]
+
+
+def calidad_cobertura(escenario, resultado):
+    """Mide qué tan bien cubre un resultado la demanda del escenario.
+
+    Los PT se cuentan como "Part-Time" sin turno; para evaluarlos se asignan
+    a Intermedio o Tarde según dónde falte más personal ese día.
+
+    Returns:
+        tuple: (cupos_sin_cubrir, desviacion_porcentual)
+    """
+    _, _, _, demanda = escenario
+    matriz, _, _, horarios = resultado
+
+    conteo = contar_turnos(horarios)
+    realizado = conteo[:, :3].astype(float)
+    capacidad = conteo.sum()
+    ideal = requerimiento_personal(afluencias_desde_demanda(demanda), capacidad)
+
+    for i in np.flatnonzero(conteo[:, 3]):
+        for _ in range(conteo[i, 3]):
+            j = 1 + int(np.argmax(ideal[i, 1:] - realizado[i, 1:]))
+            realizado[i, j] += 1
+
+    sin_cubrir = int(np.asarray(matriz).sum() - capacidad)
+    desviacion = np.abs(realizado - ideal).sum() / max(ideal.sum(), 1) * 100
+    return sin_cubrir, float(desviacion)
+
+
+def medir(funcion, *args, **kwargs):
+    """Ejecuta `funcion` midiendo tiempo (s) y memoria máxima (bytes).
+
+    La memoria se mide en una segunda ejecución para que tracemalloc no
+    distorsione el tiempo.
+    """
+    inicio = time.perf_counter()
+    resultado = funcion(*args, **kwargs)
+    tiempo = time.perf_counter() - inicio
+
+    tracemalloc.start()
+    funcion(*args, **kwargs)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, tiempo, pico
+
+
+def comparar_estrategias(escenarios, repartos=None, horarios=None):
+    """Ejecuta cada combinación de estrategias sobre todos los escenarios.
+
+    Returns:
+        list: un dict por combinación con las métricas agregadas
+    """
+    repartos = repartos or sorted(ESTRATEGIAS_REPARTO)
+    horarios = horarios or sorted(ESTRATEGIAS_HORARIO)
+    filas = []
+
+    for reparto in repartos:
+        for horario in horarios:
+            tiempos, picos, sin_cubrir, desviaciones, incumplimientos, errores = [], [], [], [], [], 0
+            for escenario in escenarios:
+                full_time, part_time, tipo, demanda = escenario
+                try:
+                    resultado, tiempo, pico = medir(
+                        generar_asignacion, full_time, part_time, tipo, demanda,
+                        reparto=reparto, horario=horario
+                    )
+                except ValueError:
+                    errores += 1
+                    continue
+                faltan, desviacion = calidad_cobertura(escenario, resultado)
+                tiempos.append(tiempo)
+                picos.append(pico)
+                sin_cubrir.append(faltan)
+                desviaciones.append(desviacion)
+                incumplimientos.append(len(verificar_horarios(resultado.horarios)))
+
+            filas.append({
+                'reparto': reparto,
+                'horario': horario,
+                'escenarios': len(tiempos),
+                'errores': errores,
+                'tiempo_ms': float(np.median(tiempos) * 1000) if tiempos else float('nan'),
+                'tiempo_total_s': float(np.sum(tiempos)),
+                'memoria_kb': float(np.max(picos) / 1024) if picos else float('nan'),
+                'sin_cubrir': int(np.sum(sin_cubrir)),
+                'desviacion': float(np.mean(desviaciones)) if desviaciones else float('nan'),
+                'incumplimientos': int(np.sum(incumplimientos)),
+            })
+    return filas
+
+
+def comparar_escalamiento(tamanos, repartos=None, semilla=0):
+    """Mide cómo escala cada estrategia de reparto con el tamaño de la plantilla.
+
+    Para cada tamaño (FT; los PT son la quinta parte) se cronometra la
+    etapa de reparto sola y `generar_asignacion` completo, y se mide la
+    calidad de la cobertura.
+
+    Returns:
+        list: un dict por (tamaño, reparto)
+    """
+    repartos = repartos or sorted(ESTRATEGIAS_REPARTO)
+    rng = np.random.default_rng(semilla)
+    filas = []
+    for ft in tamanos:
+        pt = ft // 5
+        escenario = (ft, pt, "A", a_demanda(PERFIL_DEMANDA * rng.uniform(0.5, 1.5, PERFIL_DEMANDA.shape)))
+        afluencias = afluencias_desde_demanda(escenario[3])
+        ft_por_dia = disponibilidad_por_dia(patrones_fin_de_semana(ft, "A"))
+
+        for reparto in repartos:
+            funcion = ESTRATEGIAS_REPARTO[reparto]
+            inicio = time.perf_counter()
+            funcion(afluencias, ft_por_dia, pt)
+            tiempo_reparto = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            resultado = generar_asignacion(*escenario, reparto=reparto)
+            tiempo_total = time.perf_counter() - inicio
+            sin_cubrir, desviacion = calidad_cobertura(escenario, resultado)
+
+            filas.append({
+                'full_time': ft,
+                'reparto': reparto,
+                'reparto_ms': tiempo_reparto * 1000,
+                'total_ms': tiempo_total * 1000,
+                'sin_cubrir': sin_cubrir,
+                'desviacion': desviacion,
+                'pt_usados': int(contar_turnos(resultado.horarios)[:, 3].sum()),
+            })
+    return filas
+
+
+def comparar_exportacion(escenarios):
+    """Mide filas/segundo del informe xlsx frente a la exportación columnar.
+
+    Las asignaciones se generan antes de medir, de modo que solo se
+    cronometra la escritura.
+
+    Returns:
+        list: un dict por formato
+    """
+    resultados = []
+    for full_time, part_time, tipo, demanda in escenarios:
+        resultados.append(((full_time, part_time, tipo), demanda,
+                           *generar_asignacion(full_time, part_time, tipo, demanda)))
+    filas_totales = sum(len(r[5]) * 7 for r in resultados)
+
+    formatos = [f for f in FORMATOS if f != "parquet" or pa is not None]
+    filas = []
+    with tempfile.TemporaryDirectory() as directorio:
+        inicio = time.perf_counter()
+        for k, (parametros, demanda, matriz, sab, dom, horarios) in enumerate(resultados):
+            exportar_informe_completo(os.path.join(directorio, f"tienda_{k}.xlsx"),
+                                      parametros, demanda, matriz, sab, dom, horarios)
+        filas.append(('xlsx', time.perf_counter() - inicio, directorio, "*.xlsx"))
+
+        for formato in formatos:
+            destino = os.path.join(directorio, formato)
+            inicio = time.perf_counter()
+            with EscritorColumnar(destino, formato) as escritor:
+                for k, (_, _, matriz, _, _, horarios) in enumerate(resultados):
+                    escritor.agregar(f"tienda_{k}", matriz, horarios)
+            filas.append((formato, time.perf_counter() - inicio, destino, "*"))
+
+        tabla = []
+        for formato, tiempo, ruta, patron in filas:
+            tamano = sum(os.path.getsize(a) for a in glob.glob(os.path.join(ruta, patron))
+                         if os.path.isfile(a))
+            tabla.append({
+                'formato': formato,
+                'filas': filas_totales,
+                'tiempo_s': tiempo,
+                'filas_por_s': filas_totales / tiempo if tiempo else float('nan'),
+                'tamano_kb': tamano / 1024,
+            })
+    return tabla
+
+
+def _asignacion_diccionarios(full_time, part_time, tipo, demanda):
+    """Pipeline con la representación anterior: demanda y horarios como diccionarios."""
+    patrones = patrones_fin_de_semana(full_time, tipo)
+    descansos = descansos_por_dia(patrones)
+    asignacion_ft, refuerzo_pt = repartir_proporcional(
+        afluencias_desde_demanda(demanda), disponibilidad_por_dia(patrones), part_time)
+    asignacion = asignacion_ft + refuerzo_pt
+    horarios = horario_primer_ajuste_clasico(asignacion, full_time, part_time, patrones)
+    return asignacion, int(descansos[5]), int(descansos[6]), horarios
+
+
+def comparar_asignaciones(escenarios):
+    """Compara la representación anterior de los resultados con `modelo.py`.
+
+    Cada ruta parte de lo que entrega la lectura (tuplas con la demanda
+    como diccionario, o `Escenario`) y conserva todos los resultados en
+    memoria, como hace la interfaz con sus pestañas.
+
+    Returns:
+        list: un dict por representación
+    """
+    rutas = [
+        ("diccionarios", list(escenarios), lambda e: (e, _asignacion_diccionarios(*e))),
+        ("modelo", [Escenario.desde_demanda(*e) for e in escenarios], lambda e: (e, resolver(e))),
+    ]
+    filas = []
+    for nombre, entradas, funcion in rutas:
+        inicio = time.perf_counter()
+        for entrada in entradas:
+            funcion(entrada)
+        tiempo = time.perf_counter() - inicio
+
+        tracemalloc.start()
+        resultados = [funcion(entrada) for entrada in entradas]
+        retenido, pico = tracemalloc.get_traced_memory()
+        bloques = sum(e.count for e in tracemalloc.take_snapshot().statistics("filename"))
+        tracemalloc.stop()
+
+        filas.append({
+            'representacion': nombre,
+            'escenarios': len(resultados),
+            'tiempo_ms': tiempo * 1000,
+            'retenido_kb': retenido / 1024,
+            'bloques': bloques,
+            'pico_kb': pico / 1024,
+            'pickle_kb': sum(len(pickle.dumps(r)) for r in resultados) / 1024,
+        })
+        del resultados
+    return filas
+
+
+def _anexar_openpyxl(ruta, semana, parametros, demanda, matriz, sab, dom, horarios):
+    """Anexión tradicional: cargar el libro completo, agregar las hojas y guardarlo."""
+    if os.path.exists(ruta):
+        wb = openpyxl.load_workbook(ruta)
+    else:
+        wb = openpyxl.Workbook()
+        wb.remove(wb.active)
+    filas = [archivo_anual.filas_resumen(semana, parametros, demanda, matriz, sab, dom),
+             archivo_anual.filas_horario(horarios)]
+    for nombre, contenido in zip(archivo_anual.nombres_hojas(semana), filas):
+        ws = wb.create_sheet(nombre)
+        for fila in contenido:
+            ws.append([None if celda is None else celda[0] for celda in fila])
+    wb.save(ruta)
+
+
+def comparar_archivo(semanas=20, full_time=300, semilla=0):
+    """Mide el tiempo de anexar cada semana a un archivo anual que crece.
+
+    Returns:
+        list: un dict por semana con el tiempo (ms) y el tamaño del archivo de cada método
+    """
+    rng = np.random.default_rng(semilla)
+    metodos = [("zip", archivo_anual.anexar_semana), ("openpyxl", _anexar_openpyxl)]
+    filas = []
+    with tempfile.TemporaryDirectory() as directorio:
+        for semana in range(1, semanas + 1):
+            demanda = a_demanda(PERFIL_DEMANDA * rng.uniform(0.5, 1.5, PERFIL_DEMANDA.shape))
+            escenario = Escenario.desde_demanda(full_time, full_time // 5, "A", demanda)
+            resultado = resolver(escenario)
+            fila = {'semana': semana}
+            for nombre, funcion in metodos:
+                ruta = os.path.join(directorio, f"archivo_{nombre}.xlsx")
+                inicio = time.perf_counter()
+                funcion(ruta, semana, escenario.parametros, escenario.demanda, *resultado)
+                fila[f'{nombre}_ms'] = (time.perf_counter() - inicio) * 1000
+                fila[f'{nombre}_kb'] = os.path.getsize(ruta) / 1024
+            filas.append(fila)
+    return filas
+
+
+def imprimir_tabla(filas, columnas):
+    """Imprime una lista de dicts como tabla de texto alineada."""
+    textos = [[f"{fila[c]:.2f}" if isinstance(fila[c], float) else str(fila[c]) for c in columnas]
+              for fila in filas]
+    anchos = [max(len(c), *(len(t[k]) for t in textos)) for k, c in enumerate(columnas)]
+    print("  ".join(c.ljust(a) for c, a in zip(columnas, anchos)))
+    for t in textos:
+        print("  ".join(v.ljust(a) for v, a in zip(t, anchos)))
+
+
+def _cmd_estrategias(args):
+    if args.directorio:
+        escenarios = escenarios_desde_directorio(args.directorio)
+    else:
+        escenarios = generar_escenarios(args.escenarios, args.semilla)
+    print(f"{len(escenarios)} escenarios\n")
+    filas = comparar_estrategias(escenarios)
+    imprimir_tabla(filas, ['reparto', 'horario', 'escenarios', 'errores', 'tiempo_ms',
+                           'tiempo_total_s', 'memoria_kb', 'sin_cubrir', 'desviacion',
+                           'incumplimientos'])
+
+
+def _cmd_escalamiento(args):
+    filas = comparar_escalamiento(args.tamanos, semilla=args.semilla)
+    imprimir_tabla(filas, ['full_time', 'reparto', 'reparto_ms', 'total_ms',
+                           'sin_cubrir', 'desviacion', 'pt_usados'])
+
+
+def _cmd_exportacion(args):
+    if args.directorio:
+        escenarios = escenarios_desde_directorio(args.directorio)
+    else:
+        escenarios = generar_escenarios(args.escenarios, args.semilla, max_ft=args.max_ft)
+    print(f"{len(escenarios)} escenarios\n")
+    filas = comparar_exportacion(escenarios)
+    imprimir_tabla(filas, ['formato', 'filas', 'tiempo_s', 'filas_por_s', 'tamano_kb'])
+
+
+def _cmd_asignaciones(args):
+    if args.directorio:
+        escenarios = [(e.full_time, e.part_time, e.tipo, {dia: dict(v) for dia, v in e.demanda.items()})
+                      for e in escenarios_desde_directorio(args.directorio)]
+    else:
+        escenarios = generar_escenarios(args.escenarios, args.semilla, max_ft=args.max_ft)
+    print(f"{len(escenarios)} escenarios\n")
+    filas = comparar_asignaciones(escenarios)
+    imprimir_tabla(filas, ['representacion', 'escenarios', 'tiempo_ms', 'retenido_kb',
+                           'bloques', 'pico_kb', 'pickle_kb'])
+
+
+def _cmd_archivo(args):
+    filas = comparar_archivo(args.semanas, args.full_time, args.semilla)
+    imprimir_tabla(filas, ['semana', 'zip_ms', 'zip_kb', 'openpyxl_ms', 'openpyxl_kb'])
+
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Bancos de prueba del generador de turnos")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p = sub.add_parser("estrategias", help="Comparar estrategias de reparto/horario")
+    p.add_argument("--escenarios", type=int, default=30)
+    p.add_argument("--semilla", type=int, default=0)
+    p.add_argument("--directorio", help="Usar los libros de parámetros de este directorio")
+    p.set_defaults(funcion=_cmd_estrategias)
+
+    p = sub.add_parser("escalamiento", help="Tiempo y calidad de cada reparto según el tamaño")
+    p.add_argument("--tamanos", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    p.add_argument("--semilla", type=int, default=0)
+    p.set_defaults(funcion=_cmd_escalamiento)
+
+    p = sub.add_parser("exportacion", help="Filas/segundo del xlsx frente a la exportación columnar")
+    p.add_argument("--escenarios", type=int, default=20)
+    p.add_argument("--semilla", type=int, default=0)
+    p.add_argument("--max-ft", type=int, default=500)
+    p.add_argument("--directorio", help="Usar los libros de parámetros de este directorio")
+    p.set_defaults(funcion=_cmd_exportacion)
+
+    p = sub.add_parser("asignaciones", help="Memoria y tiempo del modelo inmutable frente a diccionarios")
+    p.add_argument("--escenarios", type=int, default=30)
+    p.add_argument("--semilla", type=int, default=0)
+    p.add_argument("--max-ft", type=int, default=2000)
+    p.add_argument("--directorio", help="Usar los libros de parámetros de este directorio")
+    p.set_defaults(funcion=_cmd_asignaciones)
+
+    p = sub.add_parser("archivo", help="Costo de anexar semanas a un archivo anual que crece")
+    p.add_argument("--semanas", type=int, default=20)
+    p.add_argument("--full-time", type=int, default=300)
+    p.add_argument("--semilla", type=int, default=0)
+    p.set_defaults(funcion=_cmd_archivo)
+
+    args = parser.parse_args(argv)
+    args.funcion(args)
+
+
+if __name__ == "__main__":
+    main_cli()
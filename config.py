@@ -17,13 +17,15 @@ para facilitar cambios posteriores (tema, tamaño de ventana, etc.).
 # - `fg_normal`: color de texto normal
 # - `fg_heading`: color de los encabezados
 # - `border`: color de los bordes y separadores
+# - `bg_cambio`: fondo de las filas con cambios respecto a otra ejecución
 COLORS = {
     'bg_main': '#2b2b2b',
     'bg_frame': '#2d2d2d',
     'bg_tree': '#1e1e1e',
     'fg_normal': '#e6e6e6',
     'fg_heading': '#ffffff',
-    'border': '#444444'
+    'border': '#444444',
+    'bg_cambio': '#5c4a12'
 }
 
 # Fuentes centralizadas. Facilita ajustar el tamaño o la familia utilizada
@@ -38,6 +40,10 @@ FONTS = {
 WINDOW_SIZE = '1140x700'  # ancho x alto en píxeles
 ROW_HEIGHT = 32  # altura de fila utilizada en estilos Treeview
 
+# Pestañas de tiendas con widgets construidos a la vez. Las demás conservan
+# sus datos pero sin widgets; se reconstruyen al volver a mostrarlas.
+PESTANAS_CONSTRUIDAS = 5
+
 # Días de la semana: lista ordenada usada en tablas y generación de horarios.
 DIAS_SEMANA = [
     "Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"
@@ -55,3 +61,57 @@ SHIFT_HORARIOS = {
     "Tarde": "16 - 24 hrs",
     "Part-Time": "13 - 24 hrs"
 }
+
+# Parámetros por defecto de la simulación de robustez (Monte Carlo).
+# - `muestras`: cantidad de escenarios de demanda generados
+# - `ruido`: coeficiente de variación aplicado a cada celda de la demanda
+# - `semilla`: semilla del generador aleatorio para resultados reproducibles
+# - `percentil`: percentil de déficit mostrado en la UI
+SIMULACION = {
+    'muestras': 100_000,
+    'ruido': 0.15,
+    'semilla': 12345,
+    'percentil': 95
+}
+
+# Códigos numéricos de cada valor posible en un horario. Se usan para
+# representar los horarios como matrices compactas (int8) en ediciones,
+# comparaciones y validaciones.
+CODIGOS_TURNO = ["-", "Libre", "Mañana", "Intermedio", "Tarde", "Part-Time"]
+
+# Reglas laborales verificadas sobre los horarios generados. Ajustar los
+# valores a la normativa vigente de cada país / convenio.
+# - `horas_semanales_max`: horas máximas por semana de un Full-Time
+# - `pt_horas_semanales_max`: horas máximas por semana de un Part-Time
+# - `horas_diarias_max`: duración máxima de una jornada
+# - `descanso_minimo_horas`: horas mínimas entre el fin de una jornada y el
+#   inicio de la siguiente (p. ej. Tarde hasta las 24 y Mañana a las 08 = 8 h)
+# - `max_dias_consecutivos`: días seguidos máximos de trabajo
+# - `pt_max_dias_fin_semana`: días de fin de semana que puede trabajar un PT
+REGLAS_LABORALES = {
+    'horas_semanales_max': 48,
+    'pt_horas_semanales_max': 30,
+    'horas_diarias_max': 12,
+    'descanso_minimo_horas': 12,
+    'max_dias_consecutivos': 6,
+    'pt_max_dias_fin_semana': 2
+}
+
+# Pesos del motor de reparto exacto ("optimo", ver `optimizacion.py`).
+# - `peso_deficit`: costo por persona que falta respecto del requerimiento
+# - `peso_exceso`: costo por persona que sobra respecto del requerimiento
+# - `costo_pt`: costo por turno PT usado (los PT solo se usan si reducen la
+#   desviación más que este costo)
+OPTIMIZACION = {
+    'peso_deficit': 2.0,
+    'peso_exceso': 1.0,
+    'costo_pt': 0.05
+}
+
+# Perfilado (`--perfil` en app.py y lote.py, ver `perfilado.py`).
+# - `intervalo_muestreo`: segundos entre muestras del modo "muestreo"
+# - `directorio`: carpeta por defecto de los perfiles de la interfaz
+PERFILADO = {
+    'intervalo_muestreo': 0.005,
+    'directorio': 'perfiles'
+}
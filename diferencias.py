@@ -0,0 +1,123 @@
+"""Comparación entre dos ejecuciones de horarios (p. ej. semana anterior vs actual).
+
+Los horarios (`{trabajador: {dia: turno}}`) se convierten a matrices de
+códigos int8 de forma (trabajadores, 7) usando `CODIGOS_TURNO`, alineadas
+por nombre de trabajador. La comparación completa es una sola operación
+vectorizada (`anterior != nuevo`), por lo que es instantánea incluso con
+decenas de miles de trabajadores.
+
+Los trabajadores que solo existen en una de las dos ejecuciones se
+representan con el código -1 ("sin registro") en la otra.
+"""
+
+from itertools import repeat
+from operator import itemgetter
+
+import numpy as np
+from config import DIAS_SEMANA, CODIGOS_TURNO
+
+SIN_REGISTRO = -1
+_CODIGO = {turno: k for k, turno in enumerate(CODIGOS_TURNO)}
+_CODIGO["(sin registro)"] = SIN_REGISTRO
+_VACIO = {dia: "(sin registro)" for dia in DIAS_SEMANA}
+
+
+def etiqueta_codigo(codigo):
+    """Texto de un código de turno (incluye "(sin registro)" para -1)."""
+    return "(sin registro)" if codigo == SIN_REGISTRO else CODIGOS_TURNO[codigo]
+
+
+def matriz_codigos(horarios_trabajadores, trabajadores=None):
+    """Convierte horarios a una matriz de códigos (trabajadores x 7).
+
+    Los turnos desconocidos (p. ej. un informe editado a mano) y los días
+    que falten en el horario de un trabajador quedan con `SIN_REGISTRO`.
+
+    Args:
+        horarios_trabajadores (dict): horarios por trabajador
+        trabajadores (list, opcional): orden de filas deseado. Los nombres
+            que no estén en `horarios_trabajadores` quedan con `SIN_REGISTRO`.
+
+    Returns:
+        tuple: (trabajadores, matriz int8)
+    """
+    if trabajadores is None:
+        # Horarios ya codificados (`modelo.VistaHorarios`): sin conversión
+        codigos = getattr(horarios_trabajadores, "codigos", None)
+        if codigos is not None:
+            return list(horarios_trabajadores.trabajadores), codigos
+        trabajadores = list(horarios_trabajadores)
+
+    # Se aplanan los valores con `itemgetter` y se traducen con un solo `map`,
+    # evitando bucles anidados por trabajador y día
+    por_dias = itemgetter(*DIAS_SEMANA)
+    planos = []
+    for t in trabajadores:
+        horario = horarios_trabajadores.get(t) or _VACIO
+        try:
+            planos.extend(por_dias(horario))
+        except KeyError:
+            planos.extend(horario.get(dia, "(sin registro)") for dia in DIAS_SEMANA)
+    codigos = np.fromiter(map(_CODIGO.get, planos, repeat(SIN_REGISTRO)),
+                          dtype=np.int8, count=len(planos))
+    return trabajadores, codigos.reshape(-1, 7)
+
+
+def conteo_por_codigo(codigos):
+    """Cuenta personas por día y código (matriz 7 x len(CODIGOS_TURNO)).
+
+    Usa un único `bincount` sobre `codigo * 7 + dia`; los `SIN_REGISTRO`
+    se descartan.
+    """
+    dias = np.broadcast_to(np.arange(7), codigos.shape)
+    validos = codigos >= 0
+    claves = codigos[validos].astype(np.int64) * 7 + dias[validos]
+    conteo = np.bincount(claves, minlength=7 * len(CODIGOS_TURNO))
+    return conteo.reshape(len(CODIGOS_TURNO), 7).T
+
+
+def diferenciar(horarios_anterior, horarios_nuevo):
+    """Compara dos conjuntos de horarios alineándolos por trabajador.
+
+    Returns:
+        dict: {
+            'trabajadores': nombres alineados (primero los de `horarios_nuevo`),
+            'anterior', 'nuevo': matrices int8 (trabajadores x 7),
+            'cambios': máscara booleana de celdas distintas,
+            'cambios_por_trabajador': {trabajador: celdas cambiadas} (solo > 0),
+            'celdas': lista de (trabajador, dia, antes, despues),
+            'delta': matriz 7x4 (Mañana, Intermedio, Tarde, Part-Time) con
+                     la variación de personas por día y turno,
+            'altas': trabajadores nuevos, 'bajas': trabajadores que ya no están,
+        }
+    """
+    trabajadores = list(horarios_nuevo)
+    trabajadores += [t for t in horarios_anterior if t not in horarios_nuevo]
+
+    _, anterior = matriz_codigos(horarios_anterior, trabajadores)
+    _, nuevo = matriz_codigos(horarios_nuevo, trabajadores)
+
+    cambios = anterior != nuevo
+    por_trabajador = cambios.sum(axis=1)
+    filas, columnas = np.nonzero(cambios)
+
+    # Columnas 2..5 de CODIGOS_TURNO: Mañana, Intermedio, Tarde, Part-Time
+    delta = (conteo_por_codigo(nuevo) - conteo_por_codigo(anterior))[:, 2:6]
+
+    return {
+        'trabajadores': trabajadores,
+        'anterior': anterior,
+        'nuevo': nuevo,
+        'cambios': cambios,
+        'cambios_por_trabajador': {
+            trabajadores[k]: int(por_trabajador[k]) for k in np.flatnonzero(por_trabajador)
+        },
+        'celdas': [
+            (trabajadores[k], DIAS_SEMANA[i],
+             etiqueta_codigo(anterior[k, i]), etiqueta_codigo(nuevo[k, i]))
+            for k, i in zip(filas.tolist(), columnas.tolist())
+        ],
+        'delta': delta,
+        'altas': [t for t in horarios_nuevo if t not in horarios_anterior],
+        'bajas': [t for t in horarios_anterior if t not in horarios_nuevo],
+    }
@@ -0,0 +1,167 @@
+"""Edición manual de horarios con recuento incremental y deshacer/rehacer.
+
+Después de generar los turnos, el encargado puede cambiar a mano el turno
+de un trabajador en un día. `EditorHorarios` mantiene una matriz 7x4 con
+el número de personas por día y turno (Mañana, Intermedio, Tarde y
+Part-Time) que se actualiza en O(1) en cada edición: se resta el turno
+anterior y se suma el nuevo. Así, la cobertura de un día se vuelve a
+comprobar sin recorrer a todos los trabajadores.
+
+El historial de ediciones se guarda en dos arreglos compactos de enteros
+(`array('i')`, 4 enteros por edición: trabajador, día, turno anterior y
+turno nuevo) para que deshacer/rehacer no dependa del tamaño de la
+plantilla.
+"""
+
+from array import array
+
+import numpy as np
+from config import DIAS_SEMANA, CODIGOS_TURNO
+from main import contar_turnos
+
+# Columna de la matriz de conteo para cada código de turno (-1 = no cuenta)
+_COLUMNA_CONTEO = np.array([-1, -1, 0, 1, 2, 3])
+
+
+def opciones_turno(trabajador, dia):
+    """Valores válidos para una celda según el tipo de trabajador y el día."""
+    if trabajador.startswith("Part-Time"):
+        return ["Part-Time", "Libre"] if dia in DIAS_SEMANA[5:] else ["-"]
+    return ["Mañana", "Intermedio", "Tarde", "Libre"]
+
+
+class EditorHorarios:
+    """Aplica ediciones sobre `horarios_trabajadores` manteniendo los conteos.
+
+    El diccionario de horarios se modifica en el lugar, de modo que la
+    exportación posterior refleja los cambios.
+    """
+
+    def __init__(self, horarios_trabajadores, matriz_turnos):
+        self.horarios = horarios_trabajadores
+        self.matriz_base = np.array(matriz_turnos, dtype=int)
+        self.trabajadores = list(horarios_trabajadores)
+        self._indice = {nombre: k for k, nombre in enumerate(self.trabajadores)}
+
+        # Único recuento completo; desde aquí todo es incremental
+        self.conteo = contar_turnos(horarios_trabajadores)
+        self._conteo_inicial = self.conteo.copy()
+
+        self._deshacer = array('i')
+        self._rehacer = array('i')
+
+    @property
+    def puede_deshacer(self):
+        return len(self._deshacer) > 0
+
+    @property
+    def puede_rehacer(self):
+        return len(self._rehacer) > 0
+
+    def _aplicar(self, k, i, anterior, nuevo):
+        """Cambia la celda (trabajador k, día i) y actualiza el conteo en O(1)."""
+        col = _COLUMNA_CONTEO[anterior]
+        if col >= 0:
+            self.conteo[i, col] -= 1
+        col = _COLUMNA_CONTEO[nuevo]
+        if col >= 0:
+            self.conteo[i, col] += 1
+        self.horarios[self.trabajadores[k]][DIAS_SEMANA[i]] = CODIGOS_TURNO[nuevo]
+
+    def editar(self, trabajador, dia, turno):
+        """Asigna `turno` al `trabajador` en `dia`.
+
+        Returns:
+            np.ndarray | None: déficit del día tras la edición (ver
+            `deficit_dia`), o None si el valor no cambió.
+
+        Raises:
+            ValueError: si el turno no es válido para ese trabajador/día o si
+                el turno actual de la celda no es un código conocido (p. ej.
+                un informe importado con una etiqueta ajena).
+        """
+        if turno not in opciones_turno(trabajador, dia):
+            raise ValueError(f"Turno no válido para {trabajador} el {dia}: {turno}")
+
+        actual = self.horarios[trabajador][dia]
+        if actual not in CODIGOS_TURNO:
+            raise ValueError(f"Turno desconocido para {trabajador} el {dia}: {actual!r} "
+                             f"(válidos: {', '.join(CODIGOS_TURNO)})")
+
+        k = self._indice[trabajador]
+        i = DIAS_SEMANA.index(dia)
+        anterior = CODIGOS_TURNO.index(actual)
+        nuevo = CODIGOS_TURNO.index(turno)
+        if anterior == nuevo:
+            return None
+
+        self._aplicar(k, i, anterior, nuevo)
+        self._deshacer.extend((k, i, anterior, nuevo))
+        del self._rehacer[:]
+        return self.deficit_dia(i)
+
+    def deshacer(self):
+        """Revierte la última edición.
+
+        Returns:
+            tuple | None: (trabajador, dia, valor_restaurado) o None si no hay historial
+        """
+        if not self._deshacer:
+            return None
+        k, i, anterior, nuevo = self._deshacer[-4:]
+        del self._deshacer[-4:]
+        self._aplicar(k, i, nuevo, anterior)
+        self._rehacer.extend((k, i, anterior, nuevo))
+        return self.trabajadores[k], DIAS_SEMANA[i], CODIGOS_TURNO[anterior]
+
+    def rehacer(self):
+        """Vuelve a aplicar la última edición deshecha."""
+        if not self._rehacer:
+            return None
+        k, i, anterior, nuevo = self._rehacer[-4:]
+        del self._rehacer[-4:]
+        self._aplicar(k, i, anterior, nuevo)
+        self._deshacer.extend((k, i, anterior, nuevo))
+        return self.trabajadores[k], DIAS_SEMANA[i], CODIGOS_TURNO[nuevo]
+
+    def deficit_dia(self, i):
+        """Personas que faltan en cada turno del día `i` respecto al horario generado.
+
+        La referencia es el recuento por persona al crear el editor y no
+        `matriz_base`: en fin de semana la matriz suma `total_pt` tanto a
+        Intermedio como a Tarde, aunque cada PT cubre un solo turno.
+
+        Los Part-Time pueden cubrir Intermedio o Tarde: los PT de más se
+        descuentan del déficit de esos dos turnos (primero Intermedio), y
+        los PT que faltan pueden suplirse con FT de más en esos turnos; si
+        no alcanzan, se cuentan como déficit de Intermedio.
+
+        Returns:
+            np.ndarray: vector de 3 enteros (Mañana, Intermedio, Tarde)
+        """
+        extra = self.conteo[i, :3] - self._conteo_inicial[i, :3]
+        deficit = np.maximum(-extra, 0)
+        pt_extra = int(self.conteo[i, 3] - self._conteo_inicial[i, 3])
+
+        if pt_extra > 0:
+            for j in (1, 2):
+                cubre = min(pt_extra, deficit[j])
+                deficit[j] -= cubre
+                pt_extra -= cubre
+        elif pt_extra < 0:
+            ft_extra = int(np.maximum(extra[1:], 0).sum())
+            deficit[1] += max(-pt_extra - ft_extra, 0)
+        return deficit
+
+    def matriz_efectiva(self):
+        """Matriz 7x3 de turnos que refleja las ediciones.
+
+        Parte de la matriz generada (la misma que muestra la tabla de
+        turnos) y suma la diferencia de conteos. Los cambios de Part-Time se
+        atribuyen a Intermedio, que es el primer turno que cubren al generar
+        los horarios. Para medir cobertura usar `deficit_dia`.
+        """
+        delta = self.conteo - self._conteo_inicial
+        matriz = self.matriz_base + delta[:, :3]
+        matriz[:, 1] += delta[:, 3]
+        return matriz
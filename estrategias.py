@@ -0,0 +1,71 @@
+"""Registro de estrategias intercambiables para la asignación de turnos.
+
+`generar_asignacion` se divide en dos etapas, cada una con su propio
+registro de estrategias:
+
+- Reparto ("apportion"): decide cuántas personas trabajan en cada
+  día/turno. Firma:
+
+      reparto(afluencias, ft_por_dia, total_pt) -> (asignacion_ft, refuerzo_pt)
+
+  donde `afluencias` es la matriz 7x3 de demanda, `ft_por_dia` el vector de
+  FT disponibles por día y el resultado son dos matrices 7x3 de enteros:
+  los FT asignados y los cupos adicionales que cubrirán los PT. Si la
+  estrategia asigna en algún día más FT de los disponibles,
+  `generar_asignacion` lo detecta con `verificar_cobertura` y lanza
+  `ValueError` antes de construir los horarios.
+
+- Horario ("schedule"): convierte la matriz total en horarios
+  individuales. Firma:
+
+      horario(matriz_turnos, total_ft, total_pt, patrones) -> dict | VistaHorarios
+
+  con el mismo formato de `generar_horario_por_trabajador`, o bien una
+  `modelo.VistaHorarios` sobre una matriz de códigos, que se usa sin
+  conversión.
+
+Las estrategias por defecto ("proporcional" y "primer_ajuste") se
+registran en `main.py`; el reparto exacto "optimo" en `optimizacion.py`.
+Para añadir una nueva basta con decorarla:
+
+    @registrar_reparto("mi_reparto")
+    def mi_reparto(afluencias, ft_por_dia, total_pt):
+        ...
+"""
+
+ESTRATEGIAS_REPARTO = {}
+ESTRATEGIAS_HORARIO = {}
+
+
+def _registrar(registro, nombre):
+    def decorador(funcion):
+        registro[nombre] = funcion
+        return funcion
+    return decorador
+
+
+def registrar_reparto(nombre):
+    """Decorador que registra una estrategia de reparto con `nombre`."""
+    return _registrar(ESTRATEGIAS_REPARTO, nombre)
+
+
+def registrar_horario(nombre):
+    """Decorador que registra una estrategia de horario con `nombre`."""
+    return _registrar(ESTRATEGIAS_HORARIO, nombre)
+
+
+def _obtener(registro, nombre, etapa):
+    if nombre not in registro:
+        disponibles = ", ".join(sorted(registro)) or "ninguna"
+        raise ValueError(f"Estrategia de {etapa} desconocida: {nombre} (disponibles: {disponibles})")
+    return registro[nombre]
+
+
+def obtener_reparto(nombre):
+    """Devuelve la estrategia de reparto registrada como `nombre`."""
+    return _obtener(ESTRATEGIAS_REPARTO, nombre, "reparto")
+
+
+def obtener_horario(nombre):
+    """Devuelve la estrategia de horario registrada como `nombre`."""
+    return _obtener(ESTRATEGIAS_HORARIO, nombre, "horario")
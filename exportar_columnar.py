@@ -0,0 +1,360 @@
+"""Exportación en formato largo y columnar para herramientas de BI.
+
+En lugar del informe con estilos, escribe dos tablas "largas":
+- `horarios`: una fila por tienda, semana, trabajador y día con su turno
+- `matriz`: una fila por tienda, semana, día y turno con las personas asignadas
+
+Las columnas de texto se guardan codificadas con diccionario: la tabla
+solo contiene enteros y los textos están en archivos `diccionario_*.csv`
+(`id,nombre`). Los diccionarios de tiendas y trabajadores crecen entre
+ejecuciones sin cambiar los ids ya asignados, por lo que cada corrida de un
+lote solo anexa datos nuevos.
+
+Formatos:
+- "csv": un archivo por tabla (`horarios.csv`), escrito por bloques y
+  anexado en cada corrida
+- "npz": un archivo comprimido por bloque (`horarios_parte_00001.npz`)
+- "parquet": un archivo por bloque, con columnas de tipo diccionario
+  (requiere pyarrow)
+
+Cada par (tienda, semana) se escribe una sola vez por tabla: los pares ya
+escritos quedan en `escritos_<tabla>.csv` y `agregar` los omite, de modo
+que reanudar un lote no duplica filas. Para corregir una semana ya
+exportada hay que borrar sus filas (o el directorio) y volver a exportarla.
+
+Un directorio de salida debe tener un solo escritor a la vez.
+
+Uso:
+    python exportar_columnar.py entradas/ bi/ --formato npz --semana 202642
+"""
+
+import argparse
+import csv
+import glob
+import os
+from datetime import date
+
+import numpy as np
+from config import DIAS_SEMANA, TURNOS, CODIGOS_TURNO
+from diferencias import matriz_codigos, SIN_REGISTRO
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet es opcional
+    pa = pq = None
+
+FORMATOS = ("csv", "npz", "parquet")
+
+COLUMNAS = {
+    'horarios': ("tienda", "semana", "trabajador", "dia", "turno"),
+    'matriz': ("tienda", "semana", "dia", "turno", "personas"),
+}
+
+# Diccionario de la columna "turno" en cada tabla
+_TURNOS_TABLA = {'horarios': CODIGOS_TURNO, 'matriz': TURNOS}
+
+
+def semana_actual():
+    """Semana ISO de hoy como entero AAAASS (p. ej. 202642)."""
+    anio, semana, _ = date.today().isocalendar()
+    return anio * 100 + semana
+
+
+class Diccionario:
+    """Codificación texto -> id persistida en `diccionario_<nombre>.csv`.
+
+    Los ids existentes se cargan al abrir y los nuevos se anexan al
+    guardar, de modo que un mismo texto conserva su id entre ejecuciones.
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self.ids = {}
+        self._nuevos = []
+        if os.path.exists(ruta):
+            with open(ruta, newline="", encoding="utf-8") as f:
+                for fila in csv.DictReader(f):
+                    self.ids[fila["nombre"]] = int(fila["id"])
+
+    def codificar(self, textos):
+        """Devuelve un arreglo int32 con el id de cada texto (asignando ids nuevos)."""
+        ids = self.ids
+        for texto in textos:
+            if texto not in ids:
+                ids[texto] = len(ids)
+                self._nuevos.append(texto)
+        return np.fromiter(map(ids.__getitem__, textos), dtype=np.int32, count=len(textos))
+
+    def valores(self):
+        """Lista de textos ordenada por id."""
+        return sorted(self.ids, key=self.ids.__getitem__)
+
+    def guardar(self):
+        if not self._nuevos:
+            return
+        nuevo_archivo = not os.path.exists(self.ruta)
+        with open(self.ruta, "a", newline="", encoding="utf-8") as f:
+            escritor = csv.writer(f)
+            if nuevo_archivo:
+                escritor.writerow(["id", "nombre"])
+            escritor.writerows((self.ids[t], t) for t in self._nuevos)
+        self._nuevos = []
+
+
+def tablas_largas(id_tienda, semana, matriz_turnos, ids_trabajadores, codigos):
+    """Arma las columnas de ambas tablas para una tienda.
+
+    Args:
+        id_tienda (int): id de la tienda en el diccionario
+        semana (int): semana AAAASS
+        matriz_turnos: matriz 7x3 de personas por día y turno
+        ids_trabajadores (ndarray): id de cada trabajador (filas de `codigos`)
+        codigos (ndarray): matriz int8 (trabajadores x 7) con índices de CODIGOS_TURNO
+            (`SIN_REGISTRO` = -1 para turnos desconocidos)
+
+    Returns:
+        dict: {'horarios': {columna: arreglo}, 'matriz': {columna: arreglo}}
+    """
+    n = len(ids_trabajadores)
+    horarios = {
+        "tienda": np.full(n * 7, id_tienda, dtype=np.int32),
+        "semana": np.full(n * 7, semana, dtype=np.int32),
+        "trabajador": np.repeat(ids_trabajadores.astype(np.int32), 7),
+        "dia": np.tile(np.arange(7, dtype=np.int8), n),
+        "turno": codigos.reshape(-1).astype(np.int8),
+    }
+    matriz = {
+        "tienda": np.full(21, id_tienda, dtype=np.int32),
+        "semana": np.full(21, semana, dtype=np.int32),
+        "dia": np.repeat(np.arange(7, dtype=np.int8), 3),
+        "turno": np.tile(np.arange(3, dtype=np.int8), 7),
+        "personas": np.asarray(matriz_turnos, dtype=np.int32).reshape(-1),
+    }
+    return {'horarios': horarios, 'matriz': matriz}
+
+
+class EscritorColumnar:
+    """Acumula tiendas en memoria y las escribe por bloques.
+
+    Los pares (tienda, semana) ya escritos en el directorio (en esta u
+    otra ejecución) se omiten.
+
+    Uso:
+        with EscritorColumnar("bi/", formato="npz") as escritor:
+            for nombre, matriz, horarios in resultados:
+                escritor.agregar(nombre, matriz, horarios)
+    """
+
+    def __init__(self, directorio, formato="csv", filas_por_bloque=200_000, semana=None):
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato '{formato}' no válido. Disponibles: {', '.join(FORMATOS)}")
+        if formato == "parquet" and pa is None:
+            raise ValueError("El formato 'parquet' requiere tener instalado pyarrow.")
+
+        os.makedirs(directorio, exist_ok=True)
+        self.directorio = directorio
+        self.formato = formato
+        self.filas_por_bloque = filas_por_bloque
+        self.semana = semana or semana_actual()
+        self.filas_escritas = {'horarios': 0, 'matriz': 0}
+
+        self.tiendas = Diccionario(os.path.join(directorio, "diccionario_tiendas.csv"))
+        self.trabajadores = Diccionario(os.path.join(directorio, "diccionario_trabajadores.csv"))
+        self._escribir_diccionarios_fijos()
+
+        self._pendientes = {'horarios': [], 'matriz': []}
+        self._filas_pendientes = {'horarios': 0, 'matriz': 0}
+        self._escritos = {tabla: self._leer_escritos(tabla) for tabla in COLUMNAS}
+        self._pares_pendientes = {'horarios': [], 'matriz': []}
+        self._siguiente_parte = self._ultima_parte() + 1
+
+    def _escribir_diccionarios_fijos(self):
+        fijos = {"dias": DIAS_SEMANA, "turnos": CODIGOS_TURNO, "turnos_matriz": TURNOS}
+        for nombre, valores in fijos.items():
+            ruta = os.path.join(self.directorio, f"diccionario_{nombre}.csv")
+            if not os.path.exists(ruta):
+                with open(ruta, "w", newline="", encoding="utf-8") as f:
+                    escritor = csv.writer(f)
+                    escritor.writerow(["id", "nombre"])
+                    escritor.writerows(enumerate(valores))
+                    if nombre == "turnos":
+                        escritor.writerow([SIN_REGISTRO, "(sin registro)"])
+
+    def _ruta_escritos(self, tabla):
+        return os.path.join(self.directorio, f"escritos_{tabla}.csv")
+
+    def _leer_escritos(self, tabla):
+        """Pares (id de tienda, semana) ya escritos en una tabla."""
+        ruta = self._ruta_escritos(tabla)
+        if not os.path.exists(ruta):
+            return set()
+        with open(ruta, newline="", encoding="utf-8") as f:
+            return {(int(fila["tienda"]), int(fila["semana"])) for fila in csv.DictReader(f)}
+
+    def _ultima_parte(self):
+        """Mayor número de parte ya escrito (para anexar sin sobrescribir)."""
+        partes = glob.glob(os.path.join(self.directorio, f"*_parte_*.{self.formato}"))
+        return max((int(os.path.splitext(p)[0].rsplit("_", 1)[1]) for p in partes), default=0)
+
+    def agregar(self, tienda, matriz_turnos, horarios_trabajadores, semana=None):
+        """Agrega los resultados de una tienda.
+
+        Returns:
+            bool: False si la tienda ya estaba escrita para esa semana
+        """
+        semana = int(semana or self.semana)
+        id_tienda = int(self.tiendas.codificar([tienda])[0])
+        nuevas = [tabla for tabla in COLUMNAS if (id_tienda, semana) not in self._escritos[tabla]]
+        if not nuevas:
+            return False
+
+        trabajadores, codigos = matriz_codigos(horarios_trabajadores)
+        tablas = tablas_largas(id_tienda, semana, matriz_turnos,
+                               self.trabajadores.codificar(trabajadores), codigos)
+
+        for tabla in nuevas:
+            columnas = tablas[tabla]
+            self._escritos[tabla].add((id_tienda, semana))
+            self._pares_pendientes[tabla].append((id_tienda, semana))
+            self._pendientes[tabla].append(columnas)
+            self._filas_pendientes[tabla] += len(columnas["tienda"])
+            if self._filas_pendientes[tabla] >= self.filas_por_bloque:
+                self._vaciar(tabla)
+        return True
+
+    def _vaciar(self, tabla):
+        """Escribe el bloque pendiente de una tabla."""
+        if not self._pendientes[tabla]:
+            return
+        bloque = {
+            columna: np.concatenate([p[columna] for p in self._pendientes[tabla]])
+            for columna in COLUMNAS[tabla]
+        }
+        # Los diccionarios van antes que los datos: un corte nunca deja ids sin texto
+        self.tiendas.guardar()
+        self.trabajadores.guardar()
+        getattr(self, f"_escribir_{self.formato}")(tabla, bloque)
+        self._anexar_escritos(tabla)
+        self.filas_escritas[tabla] += self._filas_pendientes[tabla]
+        self._pendientes[tabla] = []
+        self._filas_pendientes[tabla] = 0
+
+    def _anexar_escritos(self, tabla):
+        """Registra los pares del bloque recién escrito (después de los datos)."""
+        ruta = self._ruta_escritos(tabla)
+        nuevo_archivo = not os.path.exists(ruta)
+        with open(ruta, "a", newline="", encoding="utf-8") as f:
+            escritor = csv.writer(f)
+            if nuevo_archivo:
+                escritor.writerow(["tienda", "semana"])
+            escritor.writerows(self._pares_pendientes[tabla])
+        self._pares_pendientes[tabla] = []
+
+    def _ruta_parte(self, tabla):
+        ruta = os.path.join(self.directorio, f"{tabla}_parte_{self._siguiente_parte:05d}.{self.formato}")
+        self._siguiente_parte += 1
+        return ruta
+
+    def _escribir_csv(self, tabla, bloque):
+        ruta = os.path.join(self.directorio, f"{tabla}.csv")
+        nuevo_archivo = not os.path.exists(ruta)
+        # Todas las columnas son enteras: una sola matriz y un solo savetxt
+        datos = np.column_stack([bloque[c] for c in COLUMNAS[tabla]])
+        with open(ruta, "a", newline="", encoding="utf-8") as f:
+            if nuevo_archivo:
+                f.write(",".join(COLUMNAS[tabla]) + "\n")
+            np.savetxt(f, datos, fmt="%d", delimiter=",")
+
+    def _escribir_npz(self, tabla, bloque):
+        np.savez_compressed(self._ruta_parte(tabla), **bloque)
+
+    def _escribir_parquet(self, tabla, bloque):
+        diccionarios = {
+            "tienda": self.tiendas.valores(),
+            "trabajador": self.trabajadores.valores(),
+            "dia": DIAS_SEMANA,
+            "turno": _TURNOS_TABLA[tabla],
+        }
+        arreglos = []
+        for columna in COLUMNAS[tabla]:
+            valores = bloque[columna]
+            if columna in diccionarios:
+                # Los turnos SIN_REGISTRO (-1) quedan como nulos
+                arreglos.append(pa.DictionaryArray.from_arrays(
+                    pa.array(valores.astype(np.int32), mask=valores < 0), pa.array(diccionarios[columna])))
+            else:
+                arreglos.append(pa.array(valores))
+        pq.write_table(pa.Table.from_arrays(arreglos, names=list(COLUMNAS[tabla])),
+                       self._ruta_parte(tabla))
+
+    def cerrar(self):
+        """Escribe los bloques pendientes y los diccionarios nuevos."""
+        for tabla in COLUMNAS:
+            self._vaciar(tabla)
+        self.tiendas.guardar()
+        self.trabajadores.guardar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+
+def leer_columnar(directorio, tabla="horarios"):
+    """Lee una tabla exportada (cualquier formato) como columnas NumPy.
+
+    Returns:
+        dict: {columna: arreglo} con los ids codificados
+    """
+    bloques = []
+    ruta_csv = os.path.join(directorio, f"{tabla}.csv")
+    if os.path.exists(ruta_csv):
+        datos = np.loadtxt(ruta_csv, delimiter=",", skiprows=1, dtype=np.int64, ndmin=2)
+        bloques.append({c: datos[:, k] for k, c in enumerate(COLUMNAS[tabla])})
+
+    for ruta in sorted(glob.glob(os.path.join(directorio, f"{tabla}_parte_*.npz"))):
+        with np.load(ruta) as npz:
+            bloques.append({c: npz[c] for c in COLUMNAS[tabla]})
+
+    if pq is not None:
+        for ruta in sorted(glob.glob(os.path.join(directorio, f"{tabla}_parte_*.parquet"))):
+            t = pq.read_table(ruta)
+            bloques.append({
+                c: (t[c].combine_chunks().indices if pa.types.is_dictionary(t[c].type) else t[c])
+                .to_numpy() for c in COLUMNAS[tabla]
+            })
+
+    if not bloques:
+        raise ValueError(f"No hay datos de la tabla '{tabla}' en {directorio}.")
+    return {c: np.concatenate([b[c] for b in bloques]) for c in COLUMNAS[tabla]}
+
+
+def main_cli(argv=None):
+    from exportar_consolidado import resultados_desde_directorio
+
+    parser = argparse.ArgumentParser(description="Exportación columnar para herramientas de BI")
+    parser.add_argument("entrada", help="Directorio con un libro por tienda")
+    parser.add_argument("salida", help="Directorio de salida (se anexa si ya existe)")
+    parser.add_argument("--formato", choices=FORMATOS, default="csv")
+    parser.add_argument("--semana", type=int, help="Semana AAAASS (por defecto la actual)")
+    parser.add_argument("--informes", action="store_true",
+                        help="La entrada contiene informes exportados en vez de libros de parámetros")
+    args = parser.parse_args(argv)
+
+    fallidos, repetidas = [], 0
+    with EscritorColumnar(args.salida, args.formato, semana=args.semana) as escritor:
+        for nombre, _, _, matriz, _, _, horarios in \
+                resultados_desde_directorio(args.entrada, args.informes, fallidos):
+            repetidas += not escritor.agregar(nombre, matriz, horarios)
+    for ruta, error in fallidos:
+        print(f"✘ {ruta} omitido: {error}")
+    if repetidas:
+        print(f"{repetidas} tiendas ya exportadas para la semana {escritor.semana} (omitidas)")
+    print(f"✔️ {escritor.filas_escritas['horarios']} filas de horarios y "
+          f"{escritor.filas_escritas['matriz']} de matriz escritas en {args.salida}")
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,270 @@
+"""Exportación consolidada de muchas tiendas en un solo libro.
+
+A diferencia de `exportar_informe_completo`, que crea un archivo por
+tienda, aquí se genera un único libro con:
+- "Resumen Regional": totales por día/turno de todas las tiendas,
+  descansos y una fila por tienda
+- una hoja por tienda con parámetros, matriz de turnos y horario semanal
+- "Leyenda", escrita una sola vez
+
+El libro se crea en modo `write_only`: cada fila se serializa al
+agregarla, así que la memoria no crece con la cantidad de tiendas. Los
+estilos se registran una sola vez como estilos con nombre y cada celda
+solo referencia el suyo por nombre.
+
+Uso:
+    python exportar_consolidado.py entradas/ Informe_Regional.xlsx
+    python exportar_consolidado.py informes/ Informe_Regional.xlsx --informes
+"""
+
+import argparse
+import glob
+import os
+import re
+import warnings
+from datetime import datetime
+
+import numpy as np
+import openpyxl
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import NamedStyle, Font, PatternFill, Alignment, Border, Side
+from config import DIAS_SEMANA, TURNOS, SHIFT_HORARIOS
+
+# Colores por valor de turno (los mismos del informe individual)
+COLORES_TURNO = {
+    "Mañana": "FFF2CC",
+    "Intermedio": "E2EFDA",
+    "Tarde": "FCE4D6",
+    "Part-Time": "DDEBF7",
+    "Libre": "F2F2F2",
+    "-": "FFFFFF",
+}
+
+
+def _registrar_estilos(wb):
+    """Registra en el libro la tabla de estilos compartida por todas las hojas."""
+    borde = Border(left=Side(style='thin'), right=Side(style='thin'),
+                   top=Side(style='thin'), bottom=Side(style='thin'))
+    centro = Alignment(horizontal='center', vertical='center')
+
+    estilos = [
+        NamedStyle(name="titulo", font=Font(name='Arial', size=14, bold=True, color='FFFFFF'),
+                   fill=PatternFill(start_color='2E75B6', end_color='2E75B6', fill_type='solid')),
+        NamedStyle(name="encabezado", font=Font(name='Arial', size=12, bold=True, color='FFFFFF'),
+                   fill=PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid'),
+                   alignment=centro, border=borde),
+        NamedStyle(name="subencabezado", font=Font(bold=True),
+                   fill=PatternFill(start_color='D9E1F2', end_color='D9E1F2', fill_type='solid'),
+                   alignment=centro),
+    ]
+    for turno, color in COLORES_TURNO.items():
+        estilos.append(NamedStyle(
+            name=f"turno {turno}", alignment=centro, border=borde,
+            fill=PatternFill(start_color=color, end_color=color, fill_type='solid')))
+
+    for estilo in estilos:
+        wb.add_named_style(estilo)
+
+
+class _Celdas:
+    """Fábrica de celdas con estilo para una hoja en modo write_only.
+
+    Las celdas usan los estilos con nombre registrados por
+    `_registrar_estilos`, asignados por nombre.
+    """
+
+    def __init__(self, ws):
+        self._ws = ws
+
+    def __call__(self, valor, estilo):
+        celda = WriteOnlyCell(self._ws, valor)
+        celda.style = estilo
+        return celda
+
+    def turno(self, valor):
+        """Celda coloreada según el turno (el valor coincide con el estilo)."""
+        return self(valor, f"turno {valor}" if valor in COLORES_TURNO else "turno -")
+
+
+def _nombre_hoja(nombre, usados):
+    """Nombre de hoja válido (máx. 31 caracteres, sin caracteres prohibidos) y único."""
+    base = re.sub(r'[\[\]:*?/\\]', '_', str(nombre))[:31] or "Tienda"
+    candidato, k = base, 2
+    while candidato.lower() in usados:
+        sufijo = f" ({k})"
+        candidato = base[:31 - len(sufijo)] + sufijo
+        k += 1
+    usados.add(candidato.lower())
+    return candidato
+
+
+def _escribir_tienda(ws, nombre, parametros, matriz_turnos, descanso_sab, descanso_dom,
+                     horarios_trabajadores):
+    """Escribe fila a fila la hoja de una tienda."""
+    celda = _Celdas(ws)
+    full_time, part_time, tipo = parametros
+
+    ws.column_dimensions['A'].width = 20
+    for i in range(2, 9):
+        ws.column_dimensions[openpyxl.utils.get_column_letter(i)].width = 14
+
+    ws.append([celda(f"TIENDA: {nombre}", "titulo")])
+    ws.append(["Full-Time:", full_time, "Part-Time:", part_time, "Tipo:", tipo])
+    ws.append(["Descansan Sábado:", descanso_sab, "Descansan Domingo:", descanso_dom])
+    ws.append([])
+
+    ws.append([celda(titulo, "subencabezado") for titulo in ["Día", *TURNOS]])
+    for i, dia in enumerate(DIAS_SEMANA):
+        ws.append([dia, *(int(v) for v in matriz_turnos[i])])
+    ws.append([])
+
+    ws.append([celda(titulo, "encabezado") for titulo in ["Trabajador", *DIAS_SEMANA]])
+    trabajadores = sorted(t for t in horarios_trabajadores if t.startswith("Trabajador"))
+    trabajadores += sorted(t for t in horarios_trabajadores if not t.startswith("Trabajador"))
+    for trabajador in trabajadores:
+        horario = horarios_trabajadores[trabajador]
+        ws.append([trabajador, *(celda.turno(horario[dia]) for dia in DIAS_SEMANA)])
+
+
+def _escribir_resumen(ws, nombres, filas_tienda, matrices, descansos):
+    """Escribe la hoja de resumen regional a partir de los datos apilados."""
+    celda = _Celdas(ws)
+    ws.column_dimensions['A'].width = 25
+    for col in "BCDEFG":
+        ws.column_dimensions[col].width = 14
+
+    ws.append([celda("RESUMEN REGIONAL", "titulo")])
+    ws.append([f"Generado: {datetime.now().strftime('%d/%m/%Y %H:%M')} — Tiendas: {len(nombres)}"])
+    ws.append([])
+
+    apiladas = np.stack(matrices) if matrices else np.zeros((0, 7, 3), dtype=int)
+    descansos = np.array(descansos, dtype=int).reshape(-1, 2)
+
+    bloques = [
+        ("TOTAL POR DÍA / TURNO", apiladas.sum(axis=0) if len(apiladas) else np.zeros((7, 3))),
+        ("PROMEDIO POR TIENDA", apiladas.mean(axis=0) if len(apiladas) else np.zeros((7, 3))),
+        ("MÍNIMO ENTRE TIENDAS", apiladas.min(axis=0) if len(apiladas) else np.zeros((7, 3))),
+        ("MÁXIMO ENTRE TIENDAS", apiladas.max(axis=0) if len(apiladas) else np.zeros((7, 3))),
+    ]
+    for titulo, matriz in bloques:
+        ws.append([celda(titulo, "encabezado")])
+        ws.append([celda(t, "subencabezado") for t in ["Día", *TURNOS, "Total"]])
+        for i, dia in enumerate(DIAS_SEMANA):
+            valores = [round(float(v), 2) for v in matriz[i]]
+            ws.append([dia, *valores, round(sum(valores), 2)])
+        ws.append([])
+
+    ws.append([celda("DESCANSOS", "encabezado")])
+    ws.append(["Descansan Sábado:", int(descansos[:, 0].sum())])
+    ws.append(["Descansan Domingo:", int(descansos[:, 1].sum())])
+    ws.append([])
+
+    ws.append([celda(t, "encabezado") for t in
+               ["Tienda", "Full-Time", "Part-Time", "Tipo", "Turnos semana", "Desc. Sábado", "Desc. Domingo"]])
+    for fila in filas_tienda:
+        ws.append(fila)
+
+
+def exportar_consolidado(ruta_archivo, tiendas):
+    """Genera el libro consolidado a partir de un iterable de resultados.
+
+    Args:
+        ruta_archivo (str): ruta destino del archivo .xlsx
+        tiendas (iterable): tuplas (nombre, parametros, demanda, matriz_turnos,
+            descanso_sab, descanso_dom, horarios_trabajadores). Puede ser un
+            generador: cada tienda se escribe y se descarta antes de pedir la
+            siguiente.
+
+    Returns:
+        int: cantidad de tiendas escritas
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    _registrar_estilos(wb)
+
+    # El resumen va primero en el libro, pero se rellena al final (cada hoja
+    # write_only escribe en su propio archivo temporal)
+    ws_resumen = wb.create_sheet("Resumen Regional")
+    usados = {"resumen regional", "leyenda"}
+
+    nombres, filas_tienda, matrices, descansos = [], [], [], []
+    for nombre, parametros, _, matriz, descanso_sab, descanso_dom, horarios in tiendas:
+        ws = wb.create_sheet(_nombre_hoja(nombre, usados))
+        _escribir_tienda(ws, nombre, parametros, matriz, descanso_sab, descanso_dom, horarios)
+
+        # Solo se conservan agregados pequeños (7x3 por tienda)
+        matriz = np.asarray(matriz, dtype=np.int32)
+        nombres.append(nombre)
+        matrices.append(matriz)
+        descansos.append((descanso_sab, descanso_dom))
+        filas_tienda.append([nombre, *parametros, int(matriz.sum()), descanso_sab, descanso_dom])
+
+    _escribir_resumen(ws_resumen, nombres, filas_tienda, matrices, descansos)
+
+    ws_leyenda = wb.create_sheet("Leyenda")
+    celda = _Celdas(ws_leyenda)
+    ws_leyenda.column_dimensions['A'].width = 15
+    ws_leyenda.column_dimensions['B'].width = 35
+    ws_leyenda.append([celda("LEYENDA DE COLORES", "titulo")])
+    ws_leyenda.append([])
+    for turno in COLORES_TURNO:
+        if turno == "-":
+            texto = "No trabaja (Part-Time días de semana)"
+        elif turno == "Libre":
+            texto = "Día de descanso"
+        else:
+            texto = f"Turno de {turno.lower()} ({SHIFT_HORARIOS[turno]})"
+        ws_leyenda.append([celda.turno(turno), texto])
+
+    wb.save(ruta_archivo)
+    return len(nombres)
+
+
+def resultados_desde_directorio(directorio, informes=False, fallidos=None):
+    """Genera (o lee) el resultado de cada libro del directorio, de a uno.
+
+    Un libro dañado no impide el consolidado: se omite y se informa en
+    `fallidos` como `(ruta, error)`, igual que `pronostico.cargar_historico`.
+    Si no se pasa la lista, los omitidos se informan con `warnings.warn`.
+    """
+    from leer_excel import leer_parametros
+    from main import resolver
+    from importar_informe import leer_informe
+
+    for ruta in sorted(glob.glob(os.path.join(directorio, "*.xlsx"))):
+        nombre = os.path.splitext(os.path.basename(ruta))[0]
+        if nombre.startswith("~$"):
+            continue
+        try:
+            if informes:
+                resultado = (nombre, *leer_informe(ruta))
+            else:
+                escenario = leer_parametros(ruta)
+                resultado = (nombre, escenario.parametros, escenario.demanda, *resolver(escenario))
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if fallidos is None:
+                warnings.warn(f"Libro omitido en el consolidado: {ruta}: {error}")
+            else:
+                fallidos.append((ruta, error))
+            continue
+        yield resultado
+
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Informe consolidado de varias tiendas")
+    parser.add_argument("entrada", help="Directorio con un libro por tienda")
+    parser.add_argument("salida", help="Archivo .xlsx consolidado")
+    parser.add_argument("--informes", action="store_true",
+                        help="La entrada contiene informes exportados en vez de libros de parámetros")
+    args = parser.parse_args(argv)
+
+    fallidos = []
+    total = exportar_consolidado(
+        args.salida, resultados_desde_directorio(args.entrada, args.informes, fallidos))
+    for ruta, error in fallidos:
+        print(f"✘ {ruta} omitido: {error}")
+    print(f"✔️ {total} tiendas exportadas a {args.salida}")
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -1,7 +1,10 @@
 """Exportación de informes en formato Excel (.xlsx).
 
 Contiene una función `exportar_informe_completo` que genera un libro
-con tres hojas: Resumen General, Horario Semanal y Leyenda.
+con tres hojas: Resumen General, Horario Semanal y Leyenda. Si se
+entrega el resultado de la simulación de robustez se añade además la
+hoja Riesgo; con una comparación con otra ejecución, la hoja Cambios; y
+con la lista de incumplimientos de reglas laborales, la hoja Normativa.
 
 La función aplica formatos básicos (fuentes, rellenos, bordes) para
 que el informe sea legible y fácil de interpretar.
@@ -11,11 +14,12 @@ import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 from datetime import datetime
-from config import SHIFT_HORARIOS
+from config import SHIFT_HORARIOS, TURNOS
 
 
 def exportar_informe_completo(ruta_archivo, parametros, demanda, matriz_turnos,
-                               descanso_sab, descanso_dom, horarios_trabajadores):
+                               descanso_sab, descanso_dom, horarios_trabajadores,
+                               riesgo=None, cambios=None, incumplimientos=None):
     """Crea y guarda un archivo Excel con el informe completo.
 
     Args:
@@ -26,6 +30,9 @@ def exportar_informe_completo(ruta_archivo, parametros, demanda, matriz_turnos,
         descanso_sab (int): FT que descansan sábado
         descanso_dom (int): FT que descansan domingo
         horarios_trabajadores (dict): horarios individuales por trabajador
+        riesgo (dict, opcional): resultado de `simular_robustez`
+        cambios (dict, opcional): resultado de `diferencias.diferenciar`
+        incumplimientos (list, opcional): resultado de `verificar_horarios`
     """
     # Nuevo libro y eliminación de la hoja por defecto
     wb = openpyxl.Workbook()
@@ -104,6 +111,30 @@ def exportar_informe_completo(ruta_archivo, parametros, demanda, matriz_turnos,
         ws_resumen[f'G{fila}'] = int(matriz_turnos[i][2])
         fila += 1
 
+    # Afluencia estimada de entrada (permite reconstruir la demanda desde el informe)
+    ws_resumen['I4'] = "AFLUENCIA ESTIMADA"
+    ws_resumen['I4'].font = header_font
+    ws_resumen['I4'].fill = header_fill
+    ws_resumen.merge_cells('I4:L4')
+
+    ws_resumen['I5'] = "Día"
+    ws_resumen['J5'] = "Mañana"
+    ws_resumen['K5'] = "Intermedio"
+    ws_resumen['L5'] = "Tarde"
+
+    for col in ['I', 'J', 'K', 'L']:
+        ws_resumen[f'{col}5'].font = Font(bold=True)
+        ws_resumen[f'{col}5'].fill = PatternFill(start_color='D9E1F2', end_color='D9E1F2', fill_type='solid')
+        ws_resumen[f'{col}5'].alignment = center_align
+
+    fila = 6
+    for dia in dias:
+        ws_resumen[f'I{fila}'] = dia
+        ws_resumen[f'J{fila}'] = demanda[dia]["Mañana"]
+        ws_resumen[f'K{fila}'] = demanda[dia]["Intermedio"]
+        ws_resumen[f'L{fila}'] = demanda[dia]["Tarde"]
+        fila += 1
+
     # Ajustes visuales de columnas
     ws_resumen.column_dimensions['A'].width = 25
     ws_resumen.column_dimensions['B'].width = 15
@@ -111,6 +142,9 @@ def exportar_informe_completo(ruta_archivo, parametros, demanda, matriz_turnos,
     ws_resumen.column_dimensions['E'].width = 12
     ws_resumen.column_dimensions['F'].width = 12
     ws_resumen.column_dimensions['G'].width = 12
+    ws_resumen.column_dimensions['I'].width = 15
+    for col in ['J', 'K', 'L']:
+        ws_resumen.column_dimensions[col].width = 12
 
     # === HOJA 2: Horario por Trabajador ===
     ws_horarios = wb.create_sheet("Horario Semanal")
@@ -184,6 +218,157 @@ def exportar_informe_completo(ruta_archivo, parametros, demanda, matriz_turnos,
         col = get_column_letter(i)
         ws_horarios.column_dimensions[col].width = 14
 
+    # === HOJA OPCIONAL: Riesgo (simulación Monte Carlo) ===
+    if riesgo:
+        ws_riesgo = wb.create_sheet("Riesgo")
+
+        ws_riesgo['A1'] = "RIESGO ANTE VARIACIÓN DE DEMANDA"
+        ws_riesgo['A1'].font = titulo_font
+        ws_riesgo['A1'].fill = titulo_fill
+        ws_riesgo['A1'].alignment = center_align
+        ws_riesgo.merge_cells('A1:D1')
+
+        ws_riesgo['A2'] = f"Muestras: {riesgo['muestras']:,} — Semilla: {riesgo['semilla']}"
+        ws_riesgo.merge_cells('A2:D2')
+
+        # Un bloque por estadístico: probabilidad de déficit y cada percentil
+        bloques = [("Probabilidad de déficit", riesgo['prob_deficit'], '0%')]
+        for p, matriz in riesgo['percentiles'].items():
+            bloques.append((f"Déficit P{p} (personas)", matriz, '0.0'))
+
+        fila = 4
+        for titulo, matriz, formato in bloques:
+            ws_riesgo[f'A{fila}'] = titulo
+            ws_riesgo[f'A{fila}'].font = header_font
+            ws_riesgo[f'A{fila}'].fill = header_fill
+            ws_riesgo.merge_cells(f'A{fila}:D{fila}')
+            fila += 1
+
+            ws_riesgo[f'A{fila}'] = "Día"
+            for j, turno in enumerate(TURNOS):
+                ws_riesgo.cell(row=fila, column=j + 2, value=turno)
+            for col_idx in range(1, 5):
+                celda = ws_riesgo.cell(row=fila, column=col_idx)
+                celda.font = Font(bold=True)
+                celda.fill = PatternFill(start_color='D9E1F2', end_color='D9E1F2', fill_type='solid')
+                celda.alignment = center_align
+            fila += 1
+
+            for i, dia in enumerate(dias):
+                ws_riesgo[f'A{fila}'] = dia
+                for j in range(len(TURNOS)):
+                    celda = ws_riesgo.cell(row=fila, column=j + 2, value=float(matriz[i][j]))
+                    celda.number_format = formato
+                    celda.alignment = center_align
+                fila += 1
+            fila += 1
+
+        ws_riesgo[f'A{fila}'] = "Déficit semanal total"
+        ws_riesgo[f'A{fila}'].font = Font(bold=True)
+        fila += 1
+        for p, valor in riesgo['deficit_semanal'].items():
+            ws_riesgo[f'A{fila}'] = f"P{p}"
+            ws_riesgo[f'B{fila}'] = round(valor, 1)
+            fila += 1
+
+        ws_riesgo.column_dimensions['A'].width = 25
+        for col in ['B', 'C', 'D']:
+            ws_riesgo.column_dimensions[col].width = 14
+
+    # === HOJA OPCIONAL: Cambios respecto a otra ejecución ===
+    if cambios:
+        ws_cambios = wb.create_sheet("Cambios")
+        cambio_fill = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
+
+        ws_cambios['A1'] = "CAMBIOS RESPECTO AL HORARIO ANTERIOR"
+        ws_cambios['A1'].font = titulo_font
+        ws_cambios['A1'].fill = titulo_fill
+        ws_cambios['A1'].alignment = center_align
+        ws_cambios.merge_cells('A1:D1')
+
+        ws_cambios['A2'] = (f"{len(cambios['cambios_por_trabajador'])} trabajadores con cambios, "
+                            f"{len(cambios['celdas'])} celdas modificadas")
+        ws_cambios.merge_cells('A2:D2')
+
+        # Variación de personas por día/turno
+        ws_cambios['F4'] = "VARIACIÓN POR DÍA"
+        ws_cambios['F4'].font = header_font
+        ws_cambios['F4'].fill = header_fill
+        ws_cambios.merge_cells('F4:J4')
+        for j, titulo in enumerate(["Día", *TURNOS, "Part-Time"]):
+            celda = ws_cambios.cell(row=5, column=6 + j, value=titulo)
+            celda.font = Font(bold=True)
+            celda.alignment = center_align
+            celda.border = border
+        for i, dia in enumerate(dias):
+            ws_cambios.cell(row=6 + i, column=6, value=dia).border = border
+            for j in range(4):
+                celda = ws_cambios.cell(row=6 + i, column=7 + j, value=int(cambios['delta'][i][j]))
+                celda.number_format = '+0;-0;0'
+                celda.alignment = center_align
+                celda.border = border
+
+        # Detalle celda a celda
+        for col_idx, titulo in enumerate(["Trabajador", "Día", "Antes", "Después"], start=1):
+            celda = ws_cambios.cell(row=4, column=col_idx, value=titulo)
+            celda.font = header_font
+            celda.fill = header_fill
+            celda.alignment = center_align
+            celda.border = border
+
+        fila = 5
+        for trabajador, dia, antes, despues in cambios['celdas']:
+            ws_cambios[f'A{fila}'] = trabajador
+            ws_cambios[f'B{fila}'] = dia
+            ws_cambios[f'C{fila}'] = antes
+            ws_cambios[f'D{fila}'] = despues
+            ws_cambios[f'D{fila}'].fill = cambio_fill
+            for col in ['A', 'B', 'C', 'D']:
+                ws_cambios[f'{col}{fila}'].border = border
+            fila += 1
+
+        ws_cambios.column_dimensions['A'].width = 20
+        for col in ['B', 'C', 'D', 'F']:
+            ws_cambios.column_dimensions[col].width = 15
+        for col in ['G', 'H', 'I', 'J']:
+            ws_cambios.column_dimensions[col].width = 12
+
+    # === HOJA OPCIONAL: Normativa laboral ===
+    if incumplimientos is not None:
+        ws_normativa = wb.create_sheet("Normativa")
+        alerta_fill = PatternFill(start_color='F8CBAD', end_color='F8CBAD', fill_type='solid')
+
+        ws_normativa['A1'] = "VERIFICACIÓN DE NORMATIVA LABORAL"
+        ws_normativa['A1'].font = titulo_font
+        ws_normativa['A1'].fill = titulo_fill
+        ws_normativa['A1'].alignment = center_align
+        ws_normativa.merge_cells('A1:C1')
+
+        ws_normativa['A2'] = (f"{len(incumplimientos)} incumplimientos" if incumplimientos
+                              else "Sin incumplimientos")
+        ws_normativa.merge_cells('A2:C2')
+
+        for col_idx, titulo in enumerate(["Trabajador", "Regla", "Detalle"], start=1):
+            celda = ws_normativa.cell(row=4, column=col_idx, value=titulo)
+            celda.font = header_font
+            celda.fill = header_fill
+            celda.alignment = center_align
+            celda.border = border
+
+        fila = 5
+        for trabajador, regla, detalle in incumplimientos:
+            ws_normativa[f'A{fila}'] = trabajador
+            ws_normativa[f'B{fila}'] = regla
+            ws_normativa[f'C{fila}'] = detalle
+            for col in ['A', 'B', 'C']:
+                ws_normativa[f'{col}{fila}'].border = border
+            ws_normativa[f'B{fila}'].fill = alerta_fill
+            fila += 1
+
+        ws_normativa.column_dimensions['A'].width = 20
+        ws_normativa.column_dimensions['B'].width = 28
+        ws_normativa.column_dimensions['C'].width = 25
+
     # === HOJA 3: Leyenda ===
     ws_leyenda = wb.create_sheet("Leyenda")
 
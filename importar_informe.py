@@ -0,0 +1,139 @@
+"""Lectura de informes exportados (`Informe_Turnos_*.xlsx`).
+
+Hace el camino inverso de `exportar_informe_completo`: a partir de las
+hojas "Resumen General" y "Horario Semanal" reconstruye los parámetros,
+la demanda, la matriz de turnos, los descansos y los horarios por
+trabajador, con el mismo orden de valores que recibe el exportador:
+
+    parametros, demanda, matriz, sab, dom, horarios = leer_informe(ruta)
+    exportar_informe_completo(destino, parametros, demanda, matriz, sab, dom, horarios)
+
+Los libros se abren en modo `read_only`, que recorre las filas de forma
+secuencial sin cargar la hoja completa en memoria, por lo que informes con
+miles de trabajadores se leen rápido. `escanear_informes` permite procesar
+archivos completos de informes en paralelo.
+"""
+
+import os
+import glob
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from openpyxl import load_workbook
+from config import DIAS_SEMANA, TURNOS
+
+
+def _numero(valor):
+    """Convierte a int los valores enteros (80.0 -> 80) y deja el resto como float."""
+    valor = float(valor)
+    return int(valor) if valor.is_integer() else valor
+
+
+def _leer_resumen(ws):
+    """Extrae parámetros, matriz, descansos y demanda de "Resumen General"."""
+    filas = list(ws.iter_rows(min_row=5, max_row=12, max_col=12, values_only=True))
+    filas += [(None,) * 12] * (8 - len(filas))
+    filas = [tuple(fila) + (None,) * (12 - len(fila)) for fila in filas]
+
+    # Columna B, filas 5-9: FT, PT, tipo, descanso sábado, descanso domingo
+    full_time, part_time, tipo, descanso_sab, descanso_dom = (filas[k][1] for k in range(5))
+    if full_time is None or part_time is None or tipo is None:
+        raise ValueError("La hoja 'Resumen General' no tiene los parámetros esperados.")
+    parametros = (int(full_time), int(part_time), str(tipo).strip().upper())
+
+    # Filas 6-12: matriz de turnos en E:G y afluencia estimada en J:L
+    matriz = np.zeros((7, 3), dtype=int)
+    afluencia = np.zeros((7, 3), dtype=float)
+    tiene_afluencia = False
+    for i, fila in enumerate(filas[1:8]):
+        for j in range(3):
+            matriz[i, j] = fila[4 + j] or 0
+            if fila[9 + j] is not None:
+                tiene_afluencia = True
+                afluencia[i, j] = fila[9 + j]
+
+    # Informes antiguos sin afluencia: se usa la matriz como demanda
+    origen = afluencia if tiene_afluencia else matriz
+    demanda = {
+        dia: {turno: _numero(origen[i, j]) for j, turno in enumerate(TURNOS)}
+        for i, dia in enumerate(DIAS_SEMANA)
+    }
+
+    return parametros, demanda, matriz, int(descanso_sab or 0), int(descanso_dom or 0)
+
+
+def _leer_horarios(ws):
+    """Extrae los horarios por trabajador de "Horario Semanal" (desde la fila 4)."""
+    horarios = {}
+    for fila in ws.iter_rows(min_row=4, max_col=8, values_only=True):
+        trabajador = fila[0]
+        if not trabajador:
+            break
+        horarios[str(trabajador)] = {
+            dia: (fila[i + 1] if fila[i + 1] is not None else "-")
+            for i, dia in enumerate(DIAS_SEMANA)
+        }
+    return horarios
+
+
+def leer_informe(ruta, hoja_resumen="Resumen General", hoja_horario="Horario Semanal"):
+    """Lee un informe exportado y devuelve sus datos.
+
+    Args:
+        ruta (str): archivo .xlsx generado por `exportar_informe_completo`
+        hoja_resumen, hoja_horario (str): nombres de las hojas a leer (p. ej.
+            las de una semana de `archivo_anual.py`)
+
+    Returns:
+        tuple: (parametros, demanda, matriz_turnos, descanso_sab, descanso_dom,
+        horarios_trabajadores)
+
+    Raises:
+        ValueError: si el archivo no tiene las hojas de un informe.
+    """
+    wb = load_workbook(ruta, read_only=True, data_only=True)
+    try:
+        if hoja_resumen not in wb.sheetnames or hoja_horario not in wb.sheetnames:
+            raise ValueError("El archivo no es un informe de turnos exportado.")
+        parametros, demanda, matriz, descanso_sab, descanso_dom = _leer_resumen(wb[hoja_resumen])
+        horarios = _leer_horarios(wb[hoja_horario])
+    finally:
+        wb.close()
+
+    return parametros, demanda, matriz, descanso_sab, descanso_dom, horarios
+
+
+def _leer_seguro(ruta):
+    """Versión de `leer_informe` que devuelve el error en lugar de lanzarlo."""
+    try:
+        return ruta, leer_informe(ruta), None
+    except Exception as e:
+        return ruta, None, e
+
+
+def escanear_informes(origen, patron="Informe_Turnos_*.xlsx", procesos=None):
+    """Lee en bloque muchos informes, en paralelo.
+
+    Args:
+        origen (str | list): directorio a recorrer o lista de rutas
+        patron (str): patrón glob usado cuando `origen` es un directorio
+        procesos (int | None): procesos a usar (None = todos los núcleos, 1 = secuencial)
+
+    Yields:
+        tuple: (ruta, resultado, error). `resultado` es la tupla de
+        `leer_informe` o None si el archivo no pudo leerse; en ese caso
+        `error` contiene la excepción.
+    """
+    if isinstance(origen, str):
+        rutas = sorted(glob.glob(os.path.join(origen, patron)))
+    else:
+        rutas = list(origen)
+
+    if procesos == 1 or len(rutas) < 2:
+        yield from map(_leer_seguro, rutas)
+        return
+
+    procesos = procesos or os.cpu_count() or 1
+    tam_bloque = max(1, len(rutas) // (procesos * 4))
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        yield from pool.map(_leer_seguro, rutas, chunksize=tam_bloque)
@@ -7,11 +7,14 @@ de entrada que contiene:
 - Tipo de turno (A o B) en la celda C5
 - Demanda semanal en las filas 8 a 14 (columnas C, D, E)
 
-La función principal `leer_parametros` devuelve una tupla con los
-valores leídos y un diccionario con la demanda por día.
+La función principal `leer_parametros` devuelve un `modelo.Escenario`
+con los valores leídos y la demanda por día como matriz 7x3 (se puede
+desempaquetar como la tupla `(full_time, part_time, turno, demanda)`).
 """
 
+import numpy as np
 from openpyxl import load_workbook
+from modelo import Escenario
 
 
 def leer_parametros(path):
@@ -21,7 +24,7 @@ def leer_parametros(path):
         path (str): Ruta al archivo .xlsx con los parámetros.
 
     Returns:
-        tuple: (full_time, part_time, turno, demanda)
+        Escenario: se desempaqueta como (full_time, part_time, turno, demanda)
 
     Raises:
         ValueError: Si las celdas C3/C4/C5 no contienen datos válidos.
@@ -39,24 +42,12 @@ def leer_parametros(path):
     if full_time is None or part_time is None or turno not in ["A", "B"]:
         raise ValueError("El Excel no contiene valores válidos en C3, C4 o C5.")
 
-    # Construir diccionario de demanda por día leyendo filas consecutivas
-    demanda = {}
-    dias = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
-
-    # Las filas donde se espera la demanda comienzan en la fila 8
-    fila_inicio = 8
-    for i, dia in enumerate(dias):
-        fila = fila_inicio + i
-        # Columnas C/D/E contienen Mañana/Intermedio/Tarde
-        mañana = ws[f"C{fila}"].value
-        inter = ws[f"D{fila}"].value
-        tarde = ws[f"E{fila}"].value
-
+    # Demanda: filas 8 a 14 (Lunes a Domingo), columnas C/D/E
+    # (Mañana/Intermedio/Tarde), leída directamente a la matriz 7x3
+    afluencias = np.zeros((7, 3))
+    filas = ws.iter_rows(min_row=8, max_row=14, min_col=3, max_col=5, values_only=True)
+    for i, fila in enumerate(filas):
         # Normalizar valores nulos a 0 para evitar errores posteriores
-        demanda[dia] = {
-            "Mañana": mañana if mañana else 0,
-            "Intermedio": inter if inter else 0,
-            "Tarde": tarde if tarde else 0,
-        }
+        afluencias[i] = [valor or 0 for valor in fila]
 
-    return full_time, part_time, turno, demanda
+    return Escenario(full_time, part_time, turno, afluencias, _copiar=False)
@@ -0,0 +1,351 @@
+"""Procesamiento por lotes de muchos libros de parámetros, reanudable.
+
+Para cada libro de entrada ejecuta leer -> generar -> exportar y guarda el
+informe en el directorio de salida. El avance se registra en un
+manifiesto (`manifiesto.jsonl`) de solo anexado: una línea JSON por
+evento con la entrada (ruta absoluta), el hash de su contenido, la etapa alcanzada
+("pendiente", "leido", "generado" o "exportado"), el estado ("en_curso",
+"completado" o "fallido") y la ruta de salida. El último registro de cada
+entrada es el que vale. Cada etapa alcanzada se anexa como "en_curso" al
+momento, antes de empezar la siguiente; así, si el proceso muere durante la
+exportación, el manifiesto muestra que el libro ya estaba "generado".
+
+Si el lote se interrumpe (archivo dañado, falta de memoria, reinicio), al
+volver a ejecutarlo se saltan las entradas completadas cuyo contenido no
+cambió y solo se procesan las pendientes o fallidas.
+
+Garantías de escritura:
+- Cada registro se añade con una única escritura en modo anexar seguida
+  de `fsync`; una línea final incompleta (corte a mitad de escritura) se
+  ignora al leer el manifiesto.
+- Los informes se escriben primero en un archivo temporal y se mueven con
+  `os.replace`, de modo que nunca queda un informe a medio escribir con
+  estado "completado".
+
+Con `--perfil determinista|muestreo` cada tarea se perfila en su proceso
+y al final los perfiles se combinan en `salidas/perfil/` (ver
+`perfilado.py`).
+
+Uso:
+    python lote.py procesar entradas/ salidas/ --procesos 4
+    python lote.py procesar entradas/ salidas/ --procesos 4 --perfil muestreo
+    python lote.py estado salidas/manifiesto.jsonl
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from leer_excel import leer_parametros
+from main import generar_asignacion
+from exportar_excel import exportar_informe_completo
+from reglas_laborales import verificar_horarios
+from perfilado import MODOS, Perfilador, agregar_perfiles
+
+MANIFIESTO = "manifiesto.jsonl"
+ETAPAS = ("pendiente", "leido", "generado", "exportado")
+DIRECTORIO_PERFIL = "perfil"
+
+
+def hash_archivo(ruta, bloque=1 << 20):
+    """SHA-256 del contenido de un archivo, leído por bloques."""
+    h = hashlib.sha256()
+    with open(ruta, "rb") as f:
+        while True:
+            datos = f.read(bloque)
+            if not datos:
+                break
+            h.update(datos)
+    return h.hexdigest()
+
+
+def anexar_registro(ruta_manifiesto, registro):
+    """Añade un registro al manifiesto con una sola escritura atómica."""
+    registro = dict(registro, ts=datetime.now().isoformat(timespec="seconds"))
+    linea = (json.dumps(registro, ensure_ascii=False) + "\n").encode("utf-8")
+    with open(ruta_manifiesto, "ab+") as f:
+        # Si una escritura anterior quedó cortada, cerrar esa línea primero
+        if f.seek(0, os.SEEK_END):
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                linea = b"\n" + linea
+        f.write(linea)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def leer_manifiesto(ruta_manifiesto):
+    """Devuelve el último registro de cada entrada del manifiesto.
+
+    Las líneas corruptas o incompletas (p. ej. por un corte de energía a
+    mitad de escritura) se ignoran. Las entradas se indexan por su ruta
+    absoluta, de modo que un mismo libro alcanzado por otra ruta relativa
+    (o registrado así por un manifiesto antiguo) no se procesa dos veces.
+
+    Returns:
+        dict: {ruta absoluta de la entrada: registro}
+    """
+    estado = {}
+    if not os.path.exists(ruta_manifiesto):
+        return estado
+    with open(ruta_manifiesto, "rb") as f:
+        for linea in f:
+            if not linea.endswith(b"\n"):
+                continue
+            try:
+                registro = json.loads(linea)
+            except ValueError:
+                continue
+            estado[os.path.abspath(registro["entrada"])] = registro
+    return estado
+
+
+def compactar_manifiesto(ruta_manifiesto):
+    """Reescribe el manifiesto dejando solo el último registro de cada entrada.
+
+    Se escribe en un temporal y se reemplaza con `os.replace`, por lo que un
+    corte durante la compactación deja intacto el manifiesto original.
+    """
+    estado = leer_manifiesto(ruta_manifiesto)
+    temporal = ruta_manifiesto + ".tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        for registro in estado.values():
+            f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporal, ruta_manifiesto)
+
+
+def ruta_salida(ruta_entrada, directorio_salida):
+    """Ruta del informe de salida para un libro de entrada."""
+    nombre = os.path.splitext(os.path.basename(ruta_entrada))[0]
+    return os.path.join(directorio_salida, f"Informe_Turnos_{nombre}.xlsx")
+
+
+def procesar_archivo(ruta_entrada, destino, manifiesto=None, digest=None):
+    """Ejecuta el pipeline completo para un libro.
+
+    Args:
+        manifiesto (str, opcional): si se indica, cada etapa intermedia se
+            anexa como registro "en_curso" (con `digest` como hash) antes de
+            pasar a la siguiente
+
+    Returns:
+        tuple: (etapa_alcanzada, error). `error` es None si terminó bien.
+    """
+    def avanzar(etapa):
+        if manifiesto:
+            anexar_registro(manifiesto, {"entrada": ruta_entrada, "hash": digest, "etapa": etapa,
+                                         "estado": "en_curso", "salida": destino})
+        return etapa
+
+    etapa = "pendiente"
+    try:
+        full, part, turno, demanda = leer_parametros(ruta_entrada)
+        etapa = avanzar("leido")
+
+        matriz, descanso_sab, descanso_dom, horarios = generar_asignacion(full, part, turno, demanda)
+        # Registro de inicio de la exportación, la etapa más larga
+        etapa = avanzar("generado")
+
+        temporal = destino + ".tmp"
+        exportar_informe_completo(temporal, (full, part, turno), demanda, matriz,
+                                  descanso_sab, descanso_dom, horarios,
+                                  incumplimientos=verificar_horarios(horarios))
+        os.replace(temporal, destino)
+        etapa = "exportado"
+    except Exception as e:
+        return etapa, f"{type(e).__name__}: {e}"
+    return etapa, None
+
+
+def procesar_archivo_perfilado(ruta_entrada, destino, manifiesto, digest, modo, directorio_perfil):
+    """`procesar_archivo` bajo el perfilador; guarda el perfil de la tarea en `directorio_perfil`."""
+    with Perfilador(modo) as perfilador:
+        resultado = procesar_archivo(ruta_entrada, destino, manifiesto, digest)
+    nombre = os.path.splitext(os.path.basename(ruta_entrada))[0]
+    perfilador.guardar(os.path.join(directorio_perfil, nombre))
+    return resultado
+
+
+def _pendientes(entradas, directorio_salida, estado, reintentar_fallidos):
+    """Filtra las entradas que hay que (re)procesar.
+
+    Returns:
+        list: tuplas (entrada, hash, destino)
+    """
+    trabajo = []
+    for entrada in entradas:
+        digest = hash_archivo(entrada)
+        destino = ruta_salida(entrada, directorio_salida)
+        previo = estado.get(entrada)
+        if previo and previo["hash"] == digest:
+            if previo["estado"] == "completado" and os.path.exists(previo["salida"]):
+                continue
+            if previo["estado"] == "fallido" and not reintentar_fallidos:
+                continue
+        trabajo.append((entrada, digest, destino))
+    return trabajo
+
+
+def procesar_lote(directorio_entrada, directorio_salida, manifiesto=None, patron="*.xlsx",
+                  procesos=1, reintentar_fallidos=True, al_terminar=None, perfil=None):
+    """Procesa todos los libros de un directorio, reanudando desde el manifiesto.
+
+    Args:
+        directorio_entrada (str): carpeta con los libros de parámetros
+        directorio_salida (str): carpeta donde se guardan los informes
+        manifiesto (str, opcional): ruta del manifiesto (por defecto en la salida)
+        patron (str): patrón glob de los libros de entrada
+        procesos (int): procesos en paralelo (1 = secuencial)
+        reintentar_fallidos (bool): volver a intentar entradas que fallaron
+        al_terminar (callable, opcional): se llama con cada registro final
+        perfil (str, opcional): modo de perfilado ("determinista" o
+            "muestreo"). Los perfiles de cada tarea y el informe agregado se
+            guardan en `directorio_salida/perfil/`; los de una ejecución
+            anterior se descartan.
+
+    Returns:
+        Counter: cantidad de entradas por estado final en esta ejecución
+            (incluye "omitido" para las ya completadas)
+    """
+    os.makedirs(directorio_salida, exist_ok=True)
+    manifiesto = manifiesto or os.path.join(directorio_salida, MANIFIESTO)
+
+    entradas = sorted(
+        os.path.abspath(r) for r in glob.glob(os.path.join(directorio_entrada, patron))
+        if not os.path.basename(r).startswith("~$")
+    )
+    trabajo = _pendientes(entradas, directorio_salida, leer_manifiesto(manifiesto),
+                          reintentar_fallidos)
+    conteo = Counter(omitido=len(entradas) - len(trabajo))
+
+    # Marcar el trabajo como en curso: si el proceso muere, quedan pendientes
+    for entrada, digest, destino in trabajo:
+        anexar_registro(manifiesto, {"entrada": entrada, "hash": digest, "etapa": "pendiente",
+                                     "estado": "en_curso", "salida": destino})
+
+    tarea, extra = procesar_archivo, ()
+    if perfil:
+        directorio_perfil = os.path.join(directorio_salida, DIRECTORIO_PERFIL)
+        os.makedirs(directorio_perfil, exist_ok=True)
+        for anterior in glob.glob(os.path.join(directorio_perfil, "*.folded")) + \
+                glob.glob(os.path.join(directorio_perfil, "*.pstats")):
+            os.remove(anterior)
+        tarea, extra = procesar_archivo_perfilado, (perfil, directorio_perfil)
+
+    def registrar(entrada, digest, destino, etapa, error):
+        registro = {"entrada": entrada, "hash": digest, "etapa": etapa,
+                    "estado": "fallido" if error else "completado", "salida": destino}
+        if error:
+            registro["error"] = error
+        anexar_registro(manifiesto, registro)
+        conteo[registro["estado"]] += 1
+        if al_terminar:
+            al_terminar(registro)
+
+    if procesos == 1:
+        for entrada, digest, destino in trabajo:
+            registrar(entrada, digest, destino, *tarea(entrada, destino, manifiesto, digest, *extra))
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            futuros = {pool.submit(tarea, entrada, destino, manifiesto, digest, *extra):
+                       (entrada, digest, destino)
+                       for entrada, digest, destino in trabajo}
+            for futuro in as_completed(futuros):
+                entrada, digest, destino = futuros[futuro]
+                try:
+                    etapa, error = futuro.result()
+                except Exception as e:  # p. ej. el proceso hijo murió (OOM)
+                    etapa, error = "pendiente", f"{type(e).__name__}: {e}"
+                registrar(entrada, digest, destino, etapa, error)
+
+    if perfil:
+        agregar_perfiles(directorio_perfil, modo=perfil)
+    return conteo
+
+
+def resumen_manifiesto(ruta_manifiesto):
+    """Resume el avance de un lote leyendo solo el manifiesto.
+
+    Returns:
+        dict: {'total', 'por_estado', 'por_etapa', 'fallidos', 'ultima_actualizacion'}
+    """
+    estado = leer_manifiesto(ruta_manifiesto)
+    registros = list(estado.values())
+    return {
+        'total': len(registros),
+        'por_estado': Counter(r["estado"] for r in registros),
+        'por_etapa': Counter(r["etapa"] for r in registros),
+        'fallidos': [(r["entrada"], r["etapa"], r.get("error", "")) for r in registros
+                     if r["estado"] == "fallido"],
+        'ultima_actualizacion': max((r["ts"] for r in registros), default=None),
+    }
+
+
+def _cmd_procesar(args):
+    def mostrar(registro):
+        marca = "✔" if registro["estado"] == "completado" else "✘"
+        print(f"{marca} {registro['entrada']} ({registro['etapa']})"
+              + (f": {registro['error']}" if "error" in registro else ""))
+
+    conteo = procesar_lote(args.entrada, args.salida, args.manifiesto, args.patron,
+                           args.procesos, not args.sin_reintentos, mostrar, args.perfil)
+    print(f"\nCompletados: {conteo['completado']}  Fallidos: {conteo['fallido']}  "
+          f"Omitidos (ya completados): {conteo['omitido']}")
+    if args.perfil:
+        directorio = os.path.join(args.salida, DIRECTORIO_PERFIL)
+        with open(os.path.join(directorio, "perfil.txt"), encoding="utf-8") as f:
+            print("\n" + f.read())
+        print(f"Perfiles en {directorio} (perfil.folded"
+              + (", perfil.pstats)" if args.perfil == "determinista" else ")"))
+
+
+def _cmd_estado(args):
+    resumen = resumen_manifiesto(args.manifiesto)
+    print(f"Entradas registradas: {resumen['total']}")
+    print(f"Última actualización: {resumen['ultima_actualizacion'] or '-'}")
+    for estado, cantidad in sorted(resumen['por_estado'].items()):
+        print(f"  {estado:<12} {cantidad}")
+    # Etapa alcanzada: muestra dónde se detuvo cada entrada no completada
+    print("\nPor etapa:")
+    for etapa in ETAPAS:
+        if resumen['por_etapa'][etapa]:
+            print(f"  {etapa:<12} {resumen['por_etapa'][etapa]}")
+    if resumen['fallidos']:
+        print("\nFallidos:")
+        for entrada, etapa, error in resumen['fallidos']:
+            print(f"  {entrada} (etapa: {etapa}) {error}")
+
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Procesamiento por lotes de libros de turnos")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p = sub.add_parser("procesar", help="Procesar (o reanudar) un lote")
+    p.add_argument("entrada", help="Directorio con los libros de parámetros")
+    p.add_argument("salida", help="Directorio donde guardar los informes")
+    p.add_argument("--manifiesto", help=f"Ruta del manifiesto (por defecto salida/{MANIFIESTO})")
+    p.add_argument("--patron", default="*.xlsx")
+    p.add_argument("--procesos", type=int, default=1)
+    p.add_argument("--sin-reintentos", action="store_true",
+                   help="No volver a intentar las entradas que ya fallaron")
+    p.add_argument("--perfil", "--profile", choices=MODOS,
+                   help="Perfilar cada tarea y agregar los perfiles en salida/perfil/")
+    p.set_defaults(funcion=_cmd_procesar)
+
+    p = sub.add_parser("estado", help="Resumir el avance sin leer las entradas")
+    p.add_argument("manifiesto")
+    p.set_defaults(funcion=_cmd_estado)
+
+    args = parser.parse_args(argv)
+    args.funcion(args)
+
+
+if __name__ == "__main__":
+    main_cli()
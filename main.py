@@ -7,15 +7,35 @@ los horarios individuales por trabajador.
 Conceptos clave:
 - FT (Full-Time): trabajan de lunes a viernes y parte del fin de semana
 - PT (Part-Time): trabajan únicamente fines de semana
-- Se calculan cuántos FT descansan el sábado y cuántos el domingo
-  según el tipo (A/B) y la división de la plantilla.
+- `generar_asignacion` se compone de dos etapas intercambiables (reparto y
+  horario) registradas en `estrategias.py`; las de este módulo son las
+  estrategias por defecto. `optimizacion.py` agrega el reparto exacto
+  "optimo" (flujo de costo mínimo).
+- Los datos viajan por el pipeline como objetos inmutables de `modelo.py`:
+  `leer_parametros` devuelve un `Escenario` y `generar_asignacion` un
+  `ResultadoAsignacion` (ambos se pueden desempaquetar como tuplas).
+- Cada FT tiene un patrón de descanso (máscara de 7 bits, ver
+  `patrones_descanso.py`). Por defecto la plantilla se divide en dos
+  mitades que descansan sábado o domingo según el tipo (A/B).
 """
 
 import numpy as np
 from leer_excel import leer_parametros
-
-
-def generar_horario_por_trabajador(matriz_turnos, total_ft, total_pt, descanso_sab, descanso_dom):
+from patrones_descanso import (
+    patrones_fin_de_semana, descansos_por_dia, disponibilidad_por_dia,
+    verificar_cobertura,
+)
+from estrategias import (
+    registrar_reparto, registrar_horario, obtener_reparto, obtener_horario,
+)
+from modelo import Escenario, ResultadoAsignacion, VistaDemanda, VistaHorarios
+from diferencias import conteo_por_codigo
+from config import CODIGOS_TURNO, DIAS_SEMANA, TURNOS
+import optimizacion  # noqa: F401  (registra la estrategia de reparto "optimo")
+
+
+def generar_horario_por_trabajador(matriz_turnos, total_ft, total_pt, descanso_sab, descanso_dom,
+                                   patrones=None):
     """Construye un diccionario con el horario semanal de cada trabajador.
 
     La función distribuye primero a los trabajadores Full-Time (FT) entre
@@ -28,6 +48,9 @@ def generar_horario_por_trabajador(matriz_turnos, total_ft, total_pt, descanso_s
         total_pt (int): número total de PT
         descanso_sab (int): número de FT que descansan el sábado
         descanso_dom (int): número de FT que descansan el domingo
+        patrones (array-like, opcional): máscara de descanso por FT. Si no se
+            indica, los primeros `descanso_sab` FT descansan el sábado y el
+            resto el domingo.
 
     Returns:
         dict: { 'Trabajador XX': { 'Lunes': 'Mañana', ... }, 'Part-Time XX': {...} }
@@ -50,10 +73,12 @@ def generar_horario_por_trabajador(matriz_turnos, total_ft, total_pt, descanso_s
             else:
                 horarios[nombre][dia] = "-"
 
-    # Determinar índices de FT que descansan cada día del fin de semana.
-    # La lógica actual reparte la plantilla en dos mitades.
-    trabajadores_descansan_sabado = set(range(1, descanso_sab + 1))
-    trabajadores_descansan_domingo = set(range(descanso_sab + 1, total_ft + 1))
+    # Patrones de descanso por FT. Sin patrones explícitos se usa la lógica
+    # clásica: la plantilla se reparte en dos mitades (sábado / domingo).
+    if patrones is None:
+        patrones = np.full(total_ft, 1 << 6, dtype=np.uint8)
+        patrones[:descanso_sab] = 1 << 5
+    patrones = np.asarray(patrones, dtype=np.uint8)
 
     # Asignar por cada día los turnos de Mañana, Intermedio y Tarde
     for i, dia in enumerate(dias):
@@ -61,15 +86,8 @@ def generar_horario_por_trabajador(matriz_turnos, total_ft, total_pt, descanso_s
         intermedio_count = int(matriz_turnos[i][1])
         tarde_count = int(matriz_turnos[i][2])
 
-        # Crear lista de trabajadores FT disponibles para este día
-        ft_disponibles = []
-        for idx in range(1, total_ft + 1):
-            # Saltar FT que descansan este día del fin de semana
-            if dia == "Sábado" and idx in trabajadores_descansan_sabado:
-                continue
-            if dia == "Domingo" and idx in trabajadores_descansan_domingo:
-                continue
-            ft_disponibles.append(idx)
+        # FT disponibles este día: los que no tienen el bit `i` activo
+        ft_disponibles = (np.flatnonzero(((patrones >> i) & 1) == 0) + 1).tolist()
 
         # -----------------
         # Asignar Mañana
@@ -131,48 +149,66 @@ def generar_horario_por_trabajador(matriz_turnos, total_ft, total_pt, descanso_s
     return horarios
 
 
-def generar_asignacion(TOTAL_FT, TOTAL_PT, tipo, demanda):
-    """Calcula la matriz de asignación por día/turno y genera horarios individuales.
+def afluencias_desde_demanda(demanda):
+    """Convierte la `demanda` en una matriz 7x3 de afluencias.
 
-    Pasos principales:
-    1. Convertir la `demanda` (diccionario) a una matriz NumPy de afluencias.
-    2. Determinar cuántos FT descansan el sábado y el domingo según `tipo`.
-    3. Distribuir los FT por turno cada día proporcionalmente a la afluencia.
-    4. Añadir PT a los turnos de fin de semana.
-    5. Llamar a `generar_horario_por_trabajador` para obtener los horarios por persona.
+    Acepta un `Escenario` o su `VistaDemanda` (se usa su matriz sin
+    copiarla), un diccionario `{dia: {turno: valor}}` o una matriz 7x3.
+    """
+    if isinstance(demanda, (Escenario, VistaDemanda)):
+        return demanda.afluencias
+    if isinstance(demanda, dict):
+        return np.array([[demanda[dia][turno] for turno in TURNOS] for dia in DIAS_SEMANA],
+                        dtype=float)
+    return np.asarray(demanda, dtype=float)
+
+
+def requerimiento_personal(afluencias, capacidad):
+    """Expresa la afluencia en personas repartiendo `capacidad` proporcionalmente.
+
+    La demanda del Excel son clientes estimados, no trabajadores. Para
+    comparar una asignación con la demanda se escala la afluencia de modo
+    que su total coincida con la capacidad de la semana (turnos FT
+    disponibles más turnos PT de fin de semana).
+
+    Returns:
+        np.ndarray: matriz float 7x3 con el personal "ideal" por día/turno
+    """
+    afluencias = np.asarray(afluencias, dtype=float)
+    total = afluencias.sum()
+    return afluencias * (capacidad / total) if total else np.zeros_like(afluencias)
+
+
+def contar_turnos(horarios_trabajadores):
+    """Cuenta cuántas personas hay en cada día y turno.
+
+    Returns:
+        np.ndarray: matriz 7x4 de enteros con columnas Mañana, Intermedio,
+        Tarde y Part-Time.
+    """
+    if isinstance(horarios_trabajadores, VistaHorarios):
+        # Los códigos 2..5 son Mañana, Intermedio, Tarde y Part-Time
+        return conteo_por_codigo(horarios_trabajadores.codigos)[:, 2:6]
+
+    columnas = {"Mañana": 0, "Intermedio": 1, "Tarde": 2, "Part-Time": 3}
+    dias = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
+    conteo = np.zeros((7, 4), dtype=int)
+    for horario in horarios_trabajadores.values():
+        for i, dia in enumerate(dias):
+            j = columnas.get(horario[dia])
+            if j is not None:
+                conteo[i, j] += 1
+    return conteo
+
+
+@registrar_reparto("proporcional")
+def repartir_proporcional(afluencias, ft_por_dia, total_pt):
+    """Reparto por defecto: FT proporcionales a la afluencia + PT en fin de semana.
+
+    Los FT de cada día se distribuyen proporcionalmente a la afluencia de
+    cada turno, repartiendo las unidades sobrantes por mayor parte decimal.
+    Los PT se suman a Intermedio y Tarde del sábado y domingo.
     """
-    # Convertimos la demanda del Excel a una matriz de afluencias
-    afluencias = []
-    for valores in demanda.values():
-        afluencias.append([
-            valores["Mañana"],
-            valores["Intermedio"],
-            valores["Tarde"]
-        ])
-    afluencias = np.array(afluencias, dtype=float)
-
-    # --- División de la plantilla FT en dos mitades para descanso fin de semana ---
-    if TOTAL_FT % 2 == 0:
-        mitad1 = mitad2 = TOTAL_FT // 2
-    else:
-        mitad1 = TOTAL_FT // 2
-        mitad2 = TOTAL_FT - mitad1
-
-    if tipo == "A":
-        descanso_sabado = mitad1
-        descanso_domingo = mitad2
-    else:
-        descanso_sabado = mitad2
-        descanso_domingo = mitad1
-
-    # --- Disponibilidad FT por día (restan los que descansan en finde) ---
-    ft_por_dia = np.array([
-        TOTAL_FT, TOTAL_FT, TOTAL_FT, TOTAL_FT, TOTAL_FT,
-        TOTAL_FT - descanso_sabado,
-        TOTAL_FT - descanso_domingo,
-    ])
-
-    # --- Distribución proporcional según afluencia por día ---
     proporciones = afluencias / afluencias.sum(axis=1, keepdims=True)
     asignacion = np.zeros((7, 3), dtype=int)
 
@@ -191,14 +227,129 @@ def generar_asignacion(TOTAL_FT, TOTAL_PT, tipo, demanda):
         asignacion[i] = base
 
     # --- Agregar PT a intermedio y tarde del fin de semana (lógica de negocio) ---
-    asignacion[5][1] += TOTAL_PT
-    asignacion[5][2] += TOTAL_PT
-    asignacion[6][1] += TOTAL_PT
-    asignacion[6][2] += TOTAL_PT
-
-    # Generar horarios por trabajador (FT y PT)
-    horarios_trabajadores = generar_horario_por_trabajador(
-        asignacion, TOTAL_FT, TOTAL_PT, descanso_sabado, descanso_domingo
+    refuerzo_pt = np.zeros((7, 3), dtype=int)
+    refuerzo_pt[5][1] += total_pt
+    refuerzo_pt[5][2] += total_pt
+    refuerzo_pt[6][1] += total_pt
+    refuerzo_pt[6][2] += total_pt
+
+    return asignacion, refuerzo_pt
+
+
+@registrar_horario("primer_ajuste")
+def horario_primer_ajuste(matriz_turnos, total_ft, total_pt, patrones):
+    """Horario por defecto: rellena cada turno con el primer trabajador libre.
+
+    Produce el mismo horario que `generar_horario_por_trabajador`, pero
+    directamente como matriz de códigos (ver `CODIGOS_TURNO`): cada día los
+    FT disponibles se toman en orden y se cortan en tramos de Mañana,
+    Intermedio y Tarde; lo que falte en fin de semana lo cubren los PT.
+
+    Returns:
+        VistaHorarios: horarios por trabajador sobre la matriz de códigos
+    """
+    patrones = np.asarray(patrones, dtype=np.uint8)
+    codigo = {turno: np.int8(k) for k, turno in enumerate(CODIGOS_TURNO)}
+
+    # FT 'Libre' por defecto; PT '-' entre semana y 'Libre' en fin de semana
+    codigos = np.full((total_ft + total_pt, 7), codigo["Libre"], dtype=np.int8)
+    codigos[total_ft:, :5] = codigo["-"]
+    disponibles = ((patrones[:, None] >> np.arange(7, dtype=np.uint8)) & 1) == 0
+
+    for i in range(7):
+        ft = np.flatnonzero(disponibles[:, i])
+        manana, intermedio, tarde = (int(v) for v in matriz_turnos[i])
+        a = min(manana, len(ft))
+        b = min(a + intermedio, len(ft))
+        c = min(b + tarde, len(ft))
+        codigos[ft[:a], i] = codigo["Mañana"]
+        codigos[ft[a:b], i] = codigo["Intermedio"]
+        codigos[ft[b:c], i] = codigo["Tarde"]
+
+        if i >= 5:
+            faltan = (intermedio - (b - a)) + (tarde - (c - b))
+            codigos[total_ft:total_ft + min(faltan, total_pt), i] = codigo["Part-Time"]
+
+    codigos.flags.writeable = False
+    trabajadores = ([f"Trabajador {i:02d}" for i in range(1, total_ft + 1)]
+                    + [f"Part-Time {i:02d}" for i in range(1, total_pt + 1)])
+    return VistaHorarios(tuple(trabajadores), codigos)
+
+
+@registrar_horario("primer_ajuste_clasico")
+def horario_primer_ajuste_clasico(matriz_turnos, total_ft, total_pt, patrones):
+    """Versión original de "primer_ajuste", construida como diccionario."""
+    descansos = descansos_por_dia(patrones)
+    return generar_horario_por_trabajador(
+        matriz_turnos, total_ft, total_pt, int(descansos[5]), int(descansos[6]), patrones
     )
 
-    return asignacion, descanso_sabado, descanso_domingo, horarios_trabajadores
+
+def generar_asignacion(TOTAL_FT, TOTAL_PT, tipo, demanda, patrones=None,
+                       reparto="proporcional", horario="primer_ajuste"):
+    """Calcula la matriz de asignación por día/turno y genera horarios individuales.
+
+    Pasos principales:
+    1. Convertir la `demanda` (diccionario o matriz) a una matriz NumPy de afluencias.
+    2. Obtener el patrón de descanso de cada FT (por defecto según `tipo`).
+    3. Etapa de reparto: FT por turno cada día y cupos adicionales para PT.
+    4. Verificar que los patrones de descanso pueden cubrir los FT repartidos.
+       Las estrategias incluidas respetan `ft_por_dia` por construcción; la
+       comprobación protege de estrategias registradas que no lo hagan.
+    5. Etapa de horario: obtener los horarios por persona.
+
+    Args:
+        patrones (array-like, opcional): máscaras de descanso (7 bits) de cada
+            FT. Si se omite se usa `patrones_fin_de_semana(TOTAL_FT, tipo)`.
+        reparto (str): nombre de la estrategia de reparto registrada
+        horario (str): nombre de la estrategia de horario registrada
+
+    Returns:
+        ResultadoAsignacion: se desempaqueta como
+        (matriz, descanso_sabado, descanso_domingo, horarios_trabajadores)
+    """
+    # Convertimos la demanda del Excel a una matriz de afluencias
+    afluencias = afluencias_desde_demanda(demanda)
+
+    # --- Patrones de descanso (por defecto: mitades sábado / domingo) ---
+    if patrones is None:
+        patrones = patrones_fin_de_semana(TOTAL_FT, tipo)
+    patrones = np.asarray(patrones, dtype=np.uint8)
+    if patrones.size != TOTAL_FT:
+        raise ValueError("Debe haber un patrón de descanso por cada trabajador Full-Time.")
+
+    descansos = descansos_por_dia(patrones)
+    descanso_sabado = int(descansos[5])
+    descanso_domingo = int(descansos[6])
+
+    # --- Disponibilidad FT por día (restan los que descansan ese día) ---
+    ft_por_dia = disponibilidad_por_dia(patrones)
+
+    # --- Etapa de reparto ---
+    asignacion_ft, refuerzo_pt = obtener_reparto(reparto)(afluencias, ft_por_dia, TOTAL_PT)
+
+    # Comprobación rápida antes de construir horarios individuales: la
+    # estrategia de reparto recibe `ft_por_dia`, pero nada la obliga a respetarlo
+    cubrible, faltantes = verificar_cobertura(patrones, asignacion_ft)
+    if not cubrible:
+        raise ValueError("Los patrones de descanso no cubren la asignación "
+                         f"(faltan por día: {faltantes.tolist()}).")
+
+    asignacion = asignacion_ft + refuerzo_pt
+
+    # --- Etapa de horario: horarios por trabajador (FT y PT) ---
+    horarios_trabajadores = obtener_horario(horario)(asignacion, TOTAL_FT, TOTAL_PT, patrones)
+
+    if isinstance(horarios_trabajadores, VistaHorarios):
+        return ResultadoAsignacion(asignacion, descanso_sabado, descanso_domingo,
+                                   horarios_trabajadores.trabajadores, horarios_trabajadores.codigos)
+    return ResultadoAsignacion.desde_horarios(asignacion, descanso_sabado, descanso_domingo,
+                                              horarios_trabajadores)
+
+
+def resolver(escenario, patrones=None, reparto="proporcional", horario="primer_ajuste"):
+    """`generar_asignacion` para un `Escenario` (usa su matriz de afluencias sin copiarla)."""
+    if not isinstance(escenario, Escenario):
+        escenario = Escenario.desde_demanda(*escenario)
+    return generar_asignacion(escenario.full_time, escenario.part_time, escenario.tipo,
+                              escenario.afluencias, patrones, reparto, horario)
@@ -0,0 +1,260 @@
+"""Modelo de datos compacto e inmutable compartido por todo el pipeline.
+
+- `Escenario`: parámetros de una tienda y su afluencia como matriz 7x3.
+- `ResultadoAsignacion`: matriz de turnos, descansos y horarios como
+  matriz de códigos int8 (trabajadores x 7, ver `CODIGOS_TURNO`).
+
+Ambos se crean una vez (al leer el Excel / al resolver) y se pasan tal
+cual a la UI y a los exportadores. Los datos viven en arreglos NumPy
+contiguos de solo lectura; `demanda` y `horarios` son vistas de tipo
+`Mapping` sobre esos arreglos (`demanda["Lunes"]["Mañana"]`,
+`horarios["Trabajador 01"]["Lunes"]`), por lo que el código que esperaba
+diccionarios funciona sin copiar nada.
+
+Son inmutables, usan `__slots__`, se comparan y se pueden usar como clave
+(`hash`) por contenido, y se serializan con pickle como arreglos (útil
+para `ProcessPoolExecutor`). Para mantener la compatibilidad con el código
+que desempaquetaba tuplas, iterarlos devuelve los mismos valores que antes:
+
+    full, part, turno, demanda = leer_parametros(ruta)
+    matriz, descanso_sab, descanso_dom, horarios = generar_asignacion(...)
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+from config import DIAS_SEMANA, TURNOS, CODIGOS_TURNO
+from diferencias import matriz_codigos
+
+_DIA = {dia: i for i, dia in enumerate(DIAS_SEMANA)}
+_TURNO = {turno: j for j, turno in enumerate(TURNOS)}
+# Etiqueta de cada código; la última corresponde a `SIN_REGISTRO` (-1)
+_ETIQUETAS = (*CODIGOS_TURNO, "(sin registro)")
+
+
+def _solo_lectura(arreglo, dtype, copiar=True):
+    """Arreglo contiguo de solo lectura.
+
+    Un arreglo modificable se copia (salvo `copiar=False`, usado al
+    deserializar, cuando el arreglo es nuevo y nadie más lo referencia).
+    """
+    arreglo = np.ascontiguousarray(arreglo, dtype=dtype)
+    if arreglo.flags.writeable:
+        if copiar:
+            arreglo = arreglo.copy()
+        arreglo.flags.writeable = False
+    return arreglo
+
+
+def _valor(v):
+    """80.0 -> 80 (como se leyó del Excel); el resto queda como float."""
+    v = v.item()
+    return int(v) if float(v).is_integer() else v
+
+
+class _Inmutable:
+    """Base con `__slots__` que impide modificar atributos tras crear el objeto."""
+
+    __slots__ = ()
+
+    def __setattr__(self, nombre, valor):
+        raise AttributeError(f"{type(self).__name__} es inmutable")
+
+    def __delattr__(self, nombre):
+        raise AttributeError(f"{type(self).__name__} es inmutable")
+
+    def _fijar(self, **valores):
+        for nombre, valor in valores.items():
+            object.__setattr__(self, nombre, valor)
+
+
+# --- Vistas de solo lectura ---
+
+class _FilaDemanda(Mapping):
+    __slots__ = ("_fila",)
+
+    def __init__(self, fila):
+        self._fila = fila
+
+    def __getitem__(self, turno):
+        return _valor(self._fila[_TURNO[turno]])
+
+    def __iter__(self):
+        return iter(TURNOS)
+
+    def __len__(self):
+        return len(TURNOS)
+
+
+class VistaDemanda(Mapping):
+    """`{dia: {turno: afluencia}}` sobre la matriz 7x3, sin copiarla.
+
+    `np.asarray(vista)` devuelve la matriz original.
+    """
+
+    __slots__ = ("afluencias",)
+
+    def __init__(self, afluencias):
+        self.afluencias = afluencias
+
+    def __getitem__(self, dia):
+        return _FilaDemanda(self.afluencias[_DIA[dia]])
+
+    def __iter__(self):
+        return iter(DIAS_SEMANA)
+
+    def __len__(self):
+        return len(DIAS_SEMANA)
+
+    def __array__(self, dtype=None, copy=None):
+        return self.afluencias if dtype is None else self.afluencias.astype(dtype, copy=False)
+
+
+class _FilaHorario(Mapping):
+    __slots__ = ("_fila",)
+
+    def __init__(self, fila):
+        self._fila = fila
+
+    def __getitem__(self, dia):
+        return _ETIQUETAS[self._fila[_DIA[dia]]]
+
+    def __iter__(self):
+        return iter(DIAS_SEMANA)
+
+    def __len__(self):
+        return len(DIAS_SEMANA)
+
+
+class VistaHorarios(Mapping):
+    """`{trabajador: {dia: turno}}` sobre la matriz de códigos, sin copiarla.
+
+    `diferencias.matriz_codigos` reconoce la vista y usa directamente
+    `trabajadores` y `codigos`.
+    """
+
+    __slots__ = ("trabajadores", "codigos", "_indice")
+
+    def __init__(self, trabajadores, codigos):
+        self.trabajadores = trabajadores
+        self.codigos = codigos
+        self._indice = None
+
+    def __getitem__(self, trabajador):
+        if self._indice is None:
+            self._indice = {nombre: k for k, nombre in enumerate(self.trabajadores)}
+        return _FilaHorario(self.codigos[self._indice[trabajador]])
+
+    def __iter__(self):
+        return iter(self.trabajadores)
+
+    def __len__(self):
+        return len(self.trabajadores)
+
+    def items(self):
+        # Recorrido secuencial sin pasar por el índice de nombres
+        return zip(self.trabajadores, map(_FilaHorario, self.codigos))
+
+    def a_diccionario(self):
+        """Copia editable `{trabajador: {dia: turno}}` (p. ej. para `EditorHorarios`)."""
+        etiquetas = np.array(_ETIQUETAS, dtype=object)[self.codigos]
+        return {t: dict(zip(DIAS_SEMANA, fila)) for t, fila in zip(self.trabajadores, etiquetas.tolist())}
+
+
+# --- Modelo ---
+
+class Escenario(_Inmutable):
+    """Parámetros de una tienda y su afluencia (matriz float64 7x3 de solo lectura)."""
+
+    __slots__ = ("full_time", "part_time", "tipo", "afluencias", "_hash")
+
+    def __init__(self, full_time, part_time, tipo, afluencias, _copiar=True):
+        afluencias = _solo_lectura(afluencias, np.float64, _copiar)
+        if afluencias.shape != (7, 3):
+            raise ValueError("La afluencia debe ser una matriz de 7 días x 3 turnos.")
+        self._fijar(full_time=int(full_time), part_time=int(part_time),
+                    tipo=str(tipo).strip().upper(), afluencias=afluencias, _hash=None)
+
+    @classmethod
+    def desde_demanda(cls, full_time, part_time, tipo, demanda):
+        """Crea el escenario desde una demanda `{dia: {turno: valor}}` o una matriz 7x3."""
+        if isinstance(demanda, Mapping) and not isinstance(demanda, VistaDemanda):
+            demanda = [[demanda[dia][turno] for turno in TURNOS] for dia in DIAS_SEMANA]
+        return cls(full_time, part_time, tipo, np.asarray(demanda))
+
+    @property
+    def parametros(self):
+        return self.full_time, self.part_time, self.tipo
+
+    @property
+    def demanda(self):
+        return VistaDemanda(self.afluencias)
+
+    def __iter__(self):
+        return iter((self.full_time, self.part_time, self.tipo, self.demanda))
+
+    def __eq__(self, otro):
+        if not isinstance(otro, Escenario):
+            return NotImplemented
+        return self.parametros == otro.parametros and np.array_equal(self.afluencias, otro.afluencias)
+
+    def __hash__(self):
+        if self._hash is None:
+            self._fijar(_hash=hash((self.parametros, self.afluencias.tobytes())))
+        return self._hash
+
+    def __reduce__(self):
+        return Escenario, (self.full_time, self.part_time, self.tipo, self.afluencias, False)
+
+    def __repr__(self):
+        return f"Escenario(full_time={self.full_time}, part_time={self.part_time}, tipo={self.tipo!r})"
+
+
+class ResultadoAsignacion(_Inmutable):
+    """Resultado de `generar_asignacion`: matriz 7x3, descansos y horarios codificados."""
+
+    __slots__ = ("matriz", "descanso_sab", "descanso_dom", "trabajadores", "codigos", "_hash")
+
+    def __init__(self, matriz, descanso_sab, descanso_dom, trabajadores, codigos, _copiar=True):
+        codigos = _solo_lectura(codigos, np.int8, _copiar).reshape(-1, 7)
+        trabajadores = tuple(trabajadores)
+        if len(trabajadores) != len(codigos):
+            raise ValueError("Debe haber una fila de códigos por trabajador.")
+        self._fijar(matriz=_solo_lectura(matriz, np.int64, _copiar), descanso_sab=int(descanso_sab),
+                    descanso_dom=int(descanso_dom), trabajadores=trabajadores,
+                    codigos=codigos, _hash=None)
+
+    @classmethod
+    def desde_horarios(cls, matriz, descanso_sab, descanso_dom, horarios_trabajadores):
+        """Crea el resultado desde horarios `{trabajador: {dia: turno}}`."""
+        trabajadores, codigos = matriz_codigos(horarios_trabajadores)
+        return cls(matriz, descanso_sab, descanso_dom, trabajadores, codigos)
+
+    @property
+    def horarios(self):
+        return VistaHorarios(self.trabajadores, self.codigos)
+
+    def __iter__(self):
+        return iter((self.matriz, self.descanso_sab, self.descanso_dom, self.horarios))
+
+    def __eq__(self, otro):
+        if not isinstance(otro, ResultadoAsignacion):
+            return NotImplemented
+        return (self.descanso_sab == otro.descanso_sab and self.descanso_dom == otro.descanso_dom
+                and self.trabajadores == otro.trabajadores
+                and np.array_equal(self.matriz, otro.matriz)
+                and np.array_equal(self.codigos, otro.codigos))
+
+    def __hash__(self):
+        if self._hash is None:
+            self._fijar(_hash=hash((self.descanso_sab, self.descanso_dom, self.trabajadores,
+                                    self.matriz.tobytes(), self.codigos.tobytes())))
+        return self._hash
+
+    def __reduce__(self):
+        return ResultadoAsignacion, (self.matriz, self.descanso_sab, self.descanso_dom,
+                                     self.trabajadores, self.codigos, False)
+
+    def __repr__(self):
+        return (f"ResultadoAsignacion(trabajadores={len(self.trabajadores)}, "
+                f"descanso_sab={self.descanso_sab}, descanso_dom={self.descanso_dom})")
@@ -0,0 +1,234 @@
+"""Reparto exacto de turnos como problema de flujo de costo mínimo.
+
+La estrategia "optimo" reemplaza el redondeo por mayor resto de
+`repartir_proporcional` por una solución óptima del problema de
+transporte entre la plantilla disponible y los cupos día/turno:
+
+    origen -> FT del día i       (flujo fijo: todos los FT disponibles trabajan)
+    origen -> PT del sáb./dom.   (hasta `total_pt`, costo `costo_pt` por turno)
+    FT del día i -> cupo (i, turno)
+    PT del día d -> cupo (d, Intermedio | Tarde)
+    cupo (i, j) -> destino       (costo convexo de desviarse del requerimiento)
+    destino -> origen            (cierra la circulación)
+
+Los descansos ya fijan qué FT están disponibles cada día y, dentro de un
+día, los FT son intercambiables; por eso basta un nodo por día en lugar de
+uno por trabajador y la red tiene siempre 32 nodos, sin importar el tamaño
+de la plantilla. La etapa de horario luego reparte los cupos entre las
+personas (siempre es posible porque cada día se usan exactamente los FT
+disponibles).
+
+El costo de un cupo con requerimiento r y x personas es
+
+    peso * (x - r)² / r,   peso = peso_deficit si x < r, si no peso_exceso
+
+(desviación cuadrática relativa: sin pesos asimétricos su óptimo reparte
+cada día proporcionalmente a la afluencia). El requerimiento es la
+afluencia escalada a la capacidad, como en `requerimiento_personal`.
+
+Limitación: la red es agregada por día, así que no ve las transiciones
+entre días consecutivos de una misma persona. El descanso mínimo entre
+jornadas (p. ej. Tarde -> Mañana, ver `reglas_laborales.py`) depende de
+cómo la etapa de horario reparte los cupos entre trabajadores, y un
+reparto "optimo" puede terminar en horarios que no lo cumplen. El
+resultado debe revisarse con `reglas_laborales.verificar_horarios` (la
+interfaz y `benchmark.py estrategias` lo hacen).
+
+Se resuelve por cancelación de ciclos negativos partiendo del reparto
+proporcional: Bellman-Ford busca un ciclo de costo negativo en la red
+residual y por él se envían de una vez todas las unidades que siguen
+bajando el costo (búsqueda binaria sobre el costo marginal, que es
+creciente por ser convexo). Sin ciclos negativos el flujo es óptimo.
+"""
+
+import numpy as np
+from config import OPTIMIZACION
+from estrategias import registrar_reparto
+
+_EPS = 1e-9
+
+
+class RedFlujo:
+    """Circulación con arcos de costo lineal o convexo.
+
+    El costo de un arco es un número (costo por unidad) o una función
+    `marginal(x)` con el costo de la x-ésima unidad, creciente en x.
+    """
+
+    def __init__(self, nodos):
+        self.nodos = nodos
+        self.origen, self.destino = [], []
+        self.capacidad, self.costo, self.flujo = [], [], []
+
+    def agregar_arco(self, u, v, capacidad, costo, flujo=0):
+        """Agrega el arco u -> v con un flujo inicial. Devuelve su índice."""
+        self.origen.append(u)
+        self.destino.append(v)
+        self.capacidad.append(capacidad)
+        self.costo.append(costo)
+        self.flujo.append(flujo)
+        return len(self.origen) - 1
+
+    def _marginal(self, arco, unidad):
+        costo = self.costo[arco]
+        return costo(unidad) if callable(costo) else costo
+
+    def _residuales(self):
+        """Arcos residuales: (u, v, arco, sentido, costo de una unidad)."""
+        for a in range(len(self.origen)):
+            if self.flujo[a] < self.capacidad[a]:
+                yield self.origen[a], self.destino[a], a, 1, self._marginal(a, self.flujo[a] + 1)
+            if self.flujo[a] > 0:
+                yield self.destino[a], self.origen[a], a, -1, -self._marginal(a, self.flujo[a])
+
+    def _ciclo_negativo(self):
+        """Bellman-Ford desde todos los nodos a la vez. Devuelve [(arco, sentido)] o None."""
+        distancia = [0.0] * self.nodos
+        previo = [None] * self.nodos
+        residuales = list(self._residuales())
+        for _ in range(self.nodos):
+            actualizado = None
+            for u, v, arco, sentido, costo in residuales:
+                if distancia[u] + costo < distancia[v] - _EPS:
+                    distancia[v] = distancia[u] + costo
+                    previo[v] = (u, arco, sentido)
+                    actualizado = v
+            if actualizado is None:
+                return None
+
+        # Retroceder `nodos` pasos asegura estar dentro del ciclo
+        v = actualizado
+        for _ in range(self.nodos):
+            v = previo[v][0]
+        ciclo, u = [], v
+        while True:
+            anterior, arco, sentido = previo[u]
+            ciclo.append((arco, sentido))
+            u = anterior
+            if u == v:
+                return ciclo
+
+    def _costo_unidad(self, ciclo, k):
+        """Costo de enviar la k-ésima unidad adicional por el ciclo."""
+        return sum(
+            self._marginal(a, self.flujo[a] + k) if s == 1 else -self._marginal(a, self.flujo[a] - k + 1)
+            for a, s in ciclo
+        )
+
+    def cancelar_ciclos(self):
+        """Mejora el flujo actual hasta que no queden ciclos negativos.
+
+        Returns:
+            int: cantidad de ciclos cancelados
+        """
+        cancelados = 0
+        while True:
+            ciclo = self._ciclo_negativo()
+            if ciclo is None:
+                return cancelados
+
+            cuello = min(self.capacidad[a] - self.flujo[a] if s == 1 else self.flujo[a]
+                         for a, s in ciclo)
+            # Mayor k cuyo costo marginal sigue siendo negativo
+            bajo, alto = 1, cuello
+            while bajo < alto:
+                medio = (bajo + alto + 1) // 2
+                if self._costo_unidad(ciclo, medio) < -_EPS:
+                    bajo = medio
+                else:
+                    alto = medio - 1
+
+            for a, s in ciclo:
+                self.flujo[a] += s * bajo
+            cancelados += 1
+
+
+def costo_desviacion(objetivo, peso_deficit, peso_exceso):
+    """Función de costo marginal de un cupo con requerimiento `objetivo`.
+
+    Returns:
+        callable: x -> costo(x) - costo(x - 1)
+    """
+    r = max(float(objetivo), 1e-3)
+
+    def costo(x):
+        peso = peso_deficit if x < r else peso_exceso
+        return peso * (x - r) ** 2 / r
+
+    return lambda x: costo(x) - costo(x - 1)
+
+
+def _reparto_inicial(objetivo, ft_por_dia):
+    """FT de cada día proporcionales al requerimiento (mayor resto), como punto de partida."""
+    totales = objetivo.sum(axis=1, keepdims=True)
+    proporciones = np.divide(objetivo, totales, out=np.full_like(objetivo, 1 / 3), where=totales > 0)
+    raw = proporciones * ft_por_dia[:, None]
+    base = np.floor(raw).astype(int)
+    orden = np.argsort(-(raw - base), axis=1, kind="stable")
+    faltan = ft_por_dia - base.sum(axis=1)
+    for i in range(7):
+        base[i, orden[i, :faltan[i]]] += 1
+    return base
+
+
+@registrar_reparto("optimo")
+def repartir_optimo(afluencias, ft_por_dia, total_pt, peso_deficit=None, peso_exceso=None,
+                    costo_pt=None):
+    """Reparto que minimiza la desviación ponderada respecto de la demanda.
+
+    Todos los FT disponibles de cada día trabajan; los PT (solo sábado y
+    domingo, en Intermedio o Tarde) se usan únicamente donde reducen la
+    desviación más que `costo_pt`. El óptimo es por día: no considera el
+    descanso entre jornadas (ver la limitación en la documentación del
+    módulo).
+
+    Returns:
+        tuple: (asignacion_ft, refuerzo_pt), matrices 7x3 de enteros
+    """
+    peso_deficit = OPTIMIZACION['peso_deficit'] if peso_deficit is None else peso_deficit
+    peso_exceso = OPTIMIZACION['peso_exceso'] if peso_exceso is None else peso_exceso
+    costo_pt = OPTIMIZACION['costo_pt'] if costo_pt is None else costo_pt
+
+    afluencias = np.asarray(afluencias, dtype=float)
+    ft_por_dia = np.asarray(ft_por_dia, dtype=int)
+    total_pt = int(total_pt)
+
+    # Requerimiento en personas (misma escala que `requerimiento_personal`)
+    capacidad = int(ft_por_dia.sum()) + 2 * total_pt
+    total = afluencias.sum()
+    objetivo = afluencias * (capacidad / total) if total else np.zeros_like(afluencias)
+    inicial = _reparto_inicial(objetivo, ft_por_dia)
+
+    # Nodos: 0 origen, 1 destino, 2-8 FT por día, 9-10 PT sáb./dom., 11-31 cupos
+    ORIGEN, DESTINO = 0, 1
+    red = RedFlujo(32)
+    cupo = lambda i, j: 11 + 3 * i + j  # noqa: E731
+    sin_limite = max(capacidad, 1)
+
+    # Los arcos origen -> FT tienen flujo fijo, así que no forman parte de la
+    # red residual: basta con que los arcos FT -> cupo partan de un reparto
+    # que use todos los FT de cada día
+    arcos_ft = np.zeros((7, 3), dtype=int)
+    for i in range(7):
+        for j in range(3):
+            arcos_ft[i, j] = red.agregar_arco(2 + i, cupo(i, j), sin_limite, 0.0, int(inicial[i, j]))
+            red.agregar_arco(cupo(i, j), DESTINO, sin_limite,
+                             costo_desviacion(objetivo[i, j], peso_deficit, peso_exceso),
+                             int(inicial[i, j]))
+
+    arcos_pt = {}
+    if total_pt:
+        for k, dia in enumerate((5, 6)):
+            red.agregar_arco(ORIGEN, 9 + k, total_pt, costo_pt)
+            for j in (1, 2):
+                arcos_pt[dia, j] = red.agregar_arco(9 + k, cupo(dia, j), total_pt, 0.0)
+    red.agregar_arco(DESTINO, ORIGEN, sin_limite, 0.0, int(ft_por_dia.sum()))
+
+    red.cancelar_ciclos()
+
+    asignacion_ft = np.array([[red.flujo[a] for a in fila] for fila in arcos_ft], dtype=int)
+    refuerzo_pt = np.zeros((7, 3), dtype=int)
+    for (dia, j), arco in arcos_pt.items():
+        refuerzo_pt[dia, j] = red.flujo[arco]
+
+    return asignacion_ft, refuerzo_pt
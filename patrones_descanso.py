@@ -0,0 +1,141 @@
+"""Patrones de descanso semanales representados como máscaras de 7 bits.
+
+Cada trabajador Full-Time tiene asociado un entero de 0 a 127 en el que el
+bit `i` indica si descansa el día `i` de la semana (bit 0 = Lunes,
+bit 6 = Domingo). Por ejemplo:
+- Descanso solo el sábado: 0b0100000
+- Descanso sábado y domingo: 0b1100000
+- Descanso martes y miércoles: 0b0000110
+
+Trabajar con máscaras permite describir cualquier patrón (dos días
+consecutivos, descansos partidos, días fijos por trabajador) y calcular
+la disponibilidad por día con operaciones vectorizadas de NumPy, incluso
+para miles de trabajadores.
+"""
+
+import numpy as np
+from config import DIAS_SEMANA
+
+# Máscara con los 7 días activos
+SEMANA_COMPLETA = 0b1111111
+
+# Tabla 128x7: fila `m` indica con 1 los días de descanso de la máscara `m`.
+# Permite pasar de "cuántos trabajadores tienen cada máscara" a
+# "cuántos descansan cada día" con un solo producto matricial.
+_TABLA_BITS = (
+    (np.arange(SEMANA_COMPLETA + 1)[:, None] >> np.arange(7)) & 1
+).astype(np.int64)
+
+
+def mascara_desde_dias(dias):
+    """Convierte una lista de días (nombres o índices 0-6) en una máscara.
+
+    Args:
+        dias (iterable): p. ej. ["Sábado", "Domingo"] o [5, 6]
+
+    Returns:
+        int: máscara de 7 bits con los días de descanso
+
+    Raises:
+        ValueError: si algún día no es válido.
+    """
+    mascara = 0
+    for dia in dias:
+        if isinstance(dia, str):
+            if dia not in DIAS_SEMANA:
+                raise ValueError(f"Día no válido: {dia}")
+            idx = DIAS_SEMANA.index(dia)
+        else:
+            idx = int(dia)
+            if not 0 <= idx < 7:
+                raise ValueError(f"Índice de día fuera de rango: {dia}")
+        mascara |= 1 << idx
+    return mascara
+
+
+def dias_desde_mascara(mascara):
+    """Devuelve la lista de nombres de día marcados como descanso."""
+    return [dia for i, dia in enumerate(DIAS_SEMANA) if (int(mascara) >> i) & 1]
+
+
+def patron_consecutivo(inicio, largo=2):
+    """Máscara con `largo` días de descanso consecutivos desde `inicio`.
+
+    El patrón da la vuelta a la semana: inicio=6 y largo=2 corresponde a
+    Domingo + Lunes.
+    """
+    mascara = 0
+    for k in range(largo):
+        mascara |= 1 << ((inicio + k) % 7)
+    return mascara
+
+
+def patrones_fin_de_semana(total_ft, tipo):
+    """Reproduce el modelo clásico: la plantilla FT se divide en dos mitades.
+
+    Una mitad descansa el sábado y la otra el domingo. El `tipo` ("A"/"B")
+    solo decide qué mitad es la más grande cuando `total_ft` es impar.
+
+    Returns:
+        np.ndarray: vector `uint8` de largo `total_ft` con una máscara por FT
+    """
+    mitad1 = total_ft // 2
+    mitad2 = total_ft - mitad1
+    descanso_sabado = mitad1 if tipo == "A" else mitad2
+
+    patrones = np.full(total_ft, 1 << 6, dtype=np.uint8)  # Domingo
+    patrones[:descanso_sabado] = 1 << 5  # Sábado
+    return patrones
+
+
+def patrones_rotativos(total_ft, largo=2):
+    """Reparte bloques de `largo` días consecutivos de descanso por la semana.
+
+    El trabajador `k` comienza su descanso el día `k % 7`, de modo que los
+    descansos quedan repartidos de forma uniforme entre todos los días.
+    """
+    inicios = np.arange(total_ft) % 7
+    patrones = np.zeros(total_ft, dtype=np.uint8)
+    for k in range(largo):
+        patrones |= (1 << ((inicios + k) % 7)).astype(np.uint8)
+    return patrones
+
+
+def descansos_por_dia(patrones):
+    """Cuenta cuántos trabajadores descansan cada día de la semana.
+
+    Se agrupan primero las máscaras con `bincount` (como mucho 128 valores
+    distintos) y después se multiplican por la tabla de bits, de modo que el
+    coste es lineal en el número de trabajadores y sin bucles en Python.
+
+    Returns:
+        np.ndarray: vector de 7 enteros
+    """
+    patrones = np.asarray(patrones, dtype=np.int64) & SEMANA_COMPLETA
+    frecuencias = np.bincount(patrones.ravel(), minlength=SEMANA_COMPLETA + 1)
+    return frecuencias @ _TABLA_BITS
+
+
+def disponibilidad_por_dia(patrones):
+    """Número de trabajadores disponibles (no descansan) en cada día."""
+    return np.asarray(patrones).size - descansos_por_dia(patrones)
+
+
+def verificar_cobertura(patrones, matriz):
+    """Comprueba si los patrones permiten cubrir una matriz 7x3 de turnos.
+
+    Cada trabajador cubre como máximo un turno por día, así que la matriz
+    es cubrible si y solo si en cada día los disponibles alcanzan para la
+    suma de los turnos de ese día.
+
+    Args:
+        patrones (array-like): máscaras de descanso de los FT
+        matriz (array-like): matriz 7x3 con los FT requeridos por día/turno
+
+    Returns:
+        tuple: (es_cubrible, faltantes) donde `faltantes` es un vector de 7
+        enteros con los trabajadores que faltan cada día (0 si alcanza).
+    """
+    requeridos = np.asarray(matriz).sum(axis=1)
+    faltantes = np.maximum(requeridos - disponibilidad_por_dia(patrones), 0)
+    return not faltantes.any(), faltantes
@@ -0,0 +1,312 @@
+"""Perfilado integrado para la interfaz y el procesamiento por lotes.
+
+Dos modos:
+- "determinista": `cProfile` registra cada llamada (tiempos exactos, más
+  sobrecarga).
+- "muestreo": un hilo lee la pila del hilo perfilado cada
+  `PERFILADO['intervalo_muestreo']` segundos con `sys._current_frames`;
+  la sobrecarga es mínima y no depende de cuántas funciones se llamen.
+
+Cada perfil se guarda como:
+- `<prefijo>.pstats`: estadísticas de `cProfile` (solo modo determinista),
+  legibles con `pstats` o `snakeviz`
+- `<prefijo>.folded`: pilas colapsadas (`a;b;c cantidad`), el formato de
+  `flamegraph.pl`, `inferno` o speedscope. En modo determinista la cantidad
+  son microsegundos, reconstruidos desde el grafo de llamadas; en modo
+  muestreo, cantidad de muestras.
+
+En un lote cada tarea guarda su propio perfil (los procesos no comparten
+memoria) y `agregar_perfiles` los combina en un único informe
+(`perfil.pstats`, `perfil.folded` y `perfil.txt`) con el tiempo de las
+etapas del pipeline (`FUNCIONES`).
+
+Uso:
+    python app.py --perfil muestreo
+    python lote.py procesar entradas/ salidas/ --procesos 4 --perfil determinista
+    python perfilado.py salidas/perfil/              # volver a agregar un directorio
+"""
+
+import argparse
+import cProfile
+import glob
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+
+from config import PERFILADO
+
+MODOS = ("determinista", "muestreo")
+
+# Etapas del pipeline que se resumen en el informe
+FUNCIONES = (
+    "leer_parametros",
+    "generar_asignacion",
+    "horario_primer_ajuste",
+    "generar_horario_por_trabajador",
+    "exportar_informe_completo",
+)
+
+
+def _etiqueta(archivo, linea, funcion):
+    """Nombre de un marco en las pilas colapsadas (sin ';', que separa marcos)."""
+    return f"{funcion} ({os.path.basename(archivo)}:{linea})".replace(";", ",")
+
+
+class _Muestreador(threading.Thread):
+    """Hilo que cuenta las pilas observadas de otro hilo."""
+
+    def __init__(self, hilo, intervalo):
+        super().__init__(name="perfilado-muestreo", daemon=True)
+        self.hilo = hilo
+        self.intervalo = intervalo
+        self.pilas = Counter()
+        self._detener = threading.Event()
+        self._etiquetas = {}
+
+    def run(self):
+        etiquetas = self._etiquetas
+        while not self._detener.wait(self.intervalo):
+            marco = sys._current_frames().get(self.hilo)
+            pila = []
+            while marco is not None:
+                codigo = marco.f_code
+                etiqueta = etiquetas.get(codigo)
+                if etiqueta is None:
+                    etiqueta = etiquetas[codigo] = _etiqueta(
+                        codigo.co_filename, codigo.co_firstlineno, codigo.co_name)
+                pila.append(etiqueta)
+                marco = marco.f_back
+            if pila:
+                self.pilas[";".join(reversed(pila))] += 1
+
+    def detener(self):
+        self._detener.set()
+        self.join()
+
+
+class Perfilador:
+    """Perfila el bloque `with` en el modo indicado.
+
+    Ejemplo:
+        with Perfilador("muestreo") as perfil:
+            generar_asignacion(...)
+        perfil.guardar("perfiles/tienda_01")
+    """
+
+    def __init__(self, modo="determinista", intervalo=None):
+        if modo not in MODOS:
+            raise ValueError(f"Modo de perfilado desconocido: {modo} (disponibles: {', '.join(MODOS)})")
+        self.modo = modo
+        self.intervalo = PERFILADO['intervalo_muestreo'] if intervalo is None else intervalo
+        self._perfil = None
+        self._muestreador = None
+
+    def __enter__(self):
+        if self.modo == "determinista":
+            self._perfil = cProfile.Profile()
+            self._perfil.enable()
+        else:
+            self._muestreador = _Muestreador(threading.get_ident(), self.intervalo)
+            self._muestreador.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self._perfil is not None:
+            self._perfil.disable()
+        if self._muestreador is not None:
+            self._muestreador.detener()
+        return False
+
+    def pilas(self):
+        """Pilas colapsadas {pila: cantidad} del perfil."""
+        if self._muestreador is not None:
+            return Counter(self._muestreador.pilas)
+        return pilas_desde_estadisticas(pstats.Stats(self._perfil))
+
+    def guardar(self, prefijo):
+        """Escribe `<prefijo>.pstats` (si corresponde) y `<prefijo>.folded`.
+
+        Returns:
+            list: rutas escritas
+        """
+        directorio = os.path.dirname(prefijo)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        rutas = []
+        if self._perfil is not None:
+            self._perfil.dump_stats(prefijo + ".pstats")
+            rutas.append(prefijo + ".pstats")
+        escribir_pilas(prefijo + ".folded", self.pilas())
+        rutas.append(prefijo + ".folded")
+        return rutas
+
+
+# --- Pilas colapsadas ---
+
+def pilas_desde_estadisticas(estadisticas, minimo_us=1):
+    """Reconstruye pilas colapsadas (en microsegundos) desde un perfil de `cProfile`.
+
+    `cProfile` solo guarda aristas llamador -> llamado, no pilas completas.
+    Se recorre el grafo desde las funciones raíz repartiendo el tiempo de
+    cada función entre sus caminos según el tiempo acumulado que llega por
+    cada uno; las ramas de menos de `minimo_us` se descartan.
+
+    Returns:
+        Counter: {pila: microsegundos}
+    """
+    datos = estadisticas.stats
+    hijos = {}
+    for funcion, (_, _, _, _, llamadores) in datos.items():
+        for llamador, arista in llamadores.items():
+            hijos.setdefault(llamador, []).append((funcion, arista[3]))
+
+    pilas = Counter()
+    raices = [f for f, (_, _, _, _, llamadores) in datos.items() if not llamadores]
+    pendientes = [((f,), datos[f][3]) for f in raices]
+    while pendientes:
+        camino, tiempo = pendientes.pop()
+        funcion = camino[-1]
+        total = datos[funcion][3]
+        fraccion = tiempo / total if total else 0.0
+
+        propio = int(datos[funcion][2] * fraccion * 1e6)
+        if propio >= minimo_us:
+            pilas[";".join(_etiqueta(*f) for f in camino)] += propio
+        for hijo, acumulado in hijos.get(funcion, ()):
+            if hijo not in camino and acumulado * fraccion * 1e6 >= minimo_us:
+                pendientes.append((camino + (hijo,), acumulado * fraccion))
+    return pilas
+
+
+def escribir_pilas(ruta, pilas):
+    """Guarda pilas colapsadas, una por línea: `marco;marco;... cantidad`."""
+    with open(ruta, "w", encoding="utf-8") as f:
+        for pila, cantidad in sorted(pilas.items()):
+            f.write(f"{pila} {cantidad}\n")
+
+
+def leer_pilas(ruta):
+    """Lee un archivo de pilas colapsadas."""
+    pilas = Counter()
+    with open(ruta, encoding="utf-8") as f:
+        for linea in f:
+            pila, _, cantidad = linea.rstrip("\n").rpartition(" ")
+            if pila and cantidad.isdigit():
+                pilas[pila] += int(cantidad)
+    return pilas
+
+
+# --- Agregación e informe ---
+
+def _tiempos_por_funcion(pilas, escala):
+    """Tiempo inclusivo y propio (s) de cada función de `FUNCIONES` según las pilas."""
+    inclusivo, propio = Counter(), Counter()
+    for pila, cantidad in pilas.items():
+        marcos = [m.split(" (", 1)[0] for m in pila.split(";")]
+        for funcion in set(marcos) & set(FUNCIONES):
+            inclusivo[funcion] += cantidad * escala
+        if marcos[-1] in FUNCIONES:
+            propio[marcos[-1]] += cantidad * escala
+    return inclusivo, propio
+
+
+def resumen_perfil(pilas, estadisticas=None, modo="muestreo", intervalo=None):
+    """Resume un perfil (pilas y, si hay, estadísticas de `cProfile`).
+
+    Returns:
+        dict: {'modo', 'total_s', 'funciones': [(funcion, llamadas, total_s, propio_s)],
+               'propias': [(marco, segundos)] con los 15 marcos de mayor tiempo propio}
+    """
+    intervalo = PERFILADO['intervalo_muestreo'] if intervalo is None else intervalo
+    escala = 1e-6 if modo == "determinista" else intervalo
+
+    funciones = []
+    if estadisticas is not None:
+        por_nombre = {}
+        for (_, _, nombre), (_, llamadas, propio, acumulado, _) in estadisticas.stats.items():
+            if nombre in FUNCIONES:
+                previo = por_nombre.get(nombre, (0, 0.0, 0.0))
+                por_nombre[nombre] = (previo[0] + llamadas, previo[1] + acumulado, previo[2] + propio)
+        funciones = [(f, *por_nombre.get(f, (0, 0.0, 0.0))) for f in FUNCIONES]
+    else:
+        inclusivo, propio = _tiempos_por_funcion(pilas, escala)
+        funciones = [(f, None, inclusivo[f], propio[f]) for f in FUNCIONES]
+
+    propias = Counter()
+    for pila, cantidad in pilas.items():
+        propias[pila.rsplit(";", 1)[-1]] += cantidad * escala
+
+    return {
+        'modo': modo,
+        'total_s': sum(pilas.values()) * escala,
+        'funciones': funciones,
+        'propias': propias.most_common(15),
+    }
+
+
+def formatear_resumen(resumen, tareas=None):
+    """Texto del informe de perfilado."""
+    lineas = [f"Perfil ({resumen['modo']})"
+              + (f" — {tareas} tareas" if tareas is not None else "")
+              + f" — tiempo registrado: {resumen['total_s']:.3f} s", ""]
+    lineas.append(f"{'Etapa':<34}{'llamadas':>10}{'total_s':>12}{'propio_s':>12}")
+    for funcion, llamadas, total, propio in resumen['funciones']:
+        texto = "-" if llamadas is None else str(llamadas)
+        lineas.append(f"{funcion:<34}{texto:>10}{total:>12.3f}{propio:>12.3f}")
+    lineas += ["", "Mayor tiempo propio:"]
+    for marco, segundos in resumen['propias']:
+        lineas.append(f"  {segundos:>10.3f} s  {marco}")
+    return "\n".join(lineas) + "\n"
+
+
+def agregar_perfiles(directorio, destino=None, modo=None):
+    """Combina los perfiles por tarea de un directorio en un único informe.
+
+    Suma todas las pilas `*.folded` y, en modo determinista, une los
+    `*.pstats` con `pstats.Stats.add`. Escribe `perfil.folded`,
+    `perfil.pstats` (si hay) y `perfil.txt` en `destino` (por defecto el
+    mismo directorio); los agregados anteriores no se vuelven a sumar.
+
+    Returns:
+        dict: resumen (ver `resumen_perfil`) con la clave adicional 'tareas'
+    """
+    destino = destino or directorio
+    os.makedirs(destino, exist_ok=True)
+    agregados = {os.path.join(destino, f"perfil.{ext}") for ext in ("folded", "pstats")}
+
+    rutas_pilas = sorted(r for r in glob.glob(os.path.join(directorio, "*.folded")) if r not in agregados)
+    rutas_stats = sorted(r for r in glob.glob(os.path.join(directorio, "*.pstats")) if r not in agregados)
+
+    pilas = Counter()
+    for ruta in rutas_pilas:
+        pilas.update(leer_pilas(ruta))
+    estadisticas = None
+    if rutas_stats:
+        estadisticas = pstats.Stats(rutas_stats[0])
+        for ruta in rutas_stats[1:]:
+            estadisticas.add(ruta)
+        estadisticas.dump_stats(os.path.join(destino, "perfil.pstats"))
+    escribir_pilas(os.path.join(destino, "perfil.folded"), pilas)
+
+    modo = modo or ("determinista" if rutas_stats else "muestreo")
+    resumen = resumen_perfil(pilas, estadisticas, modo)
+    resumen['tareas'] = len(rutas_pilas)
+    with open(os.path.join(destino, "perfil.txt"), "w", encoding="utf-8") as f:
+        f.write(formatear_resumen(resumen, len(rutas_pilas)))
+    return resumen
+
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Agrega los perfiles por tarea de un directorio")
+    parser.add_argument("directorio", help="Directorio con los *.folded / *.pstats de cada tarea")
+    parser.add_argument("--destino", help="Directorio del informe (por defecto el mismo)")
+    args = parser.parse_args(argv)
+
+    resumen = agregar_perfiles(args.directorio, args.destino)
+    print(formatear_resumen(resumen, resumen['tareas']))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,308 @@
+"""Pestañas del espacio de trabajo: una por tienda (libro cargado).
+
+Cada `PestanaTienda` guarda el estado de una tienda (parámetros, demanda,
+resultado, ediciones, comparación, normativa y riesgo) y, por separado,
+sus widgets. Los widgets se construyen recién cuando la pestaña se muestra
+por primera vez (`construir`) y se destruyen al desalojarla (`liberar`);
+el estado se conserva, así que volver a mostrarla solo reconstruye la
+vista a partir de los datos (`refrescar`).
+
+Los widgets usan únicamente los estilos ttk configurados una vez por
+`App._configurar_estilos`, por lo que crear o destruir pestañas no toca
+la configuración de estilos.
+"""
+
+import os
+from tkinter import ttk
+
+from config import SHIFT_HORARIOS, SIMULACION
+from ediciones import opciones_turno
+from ui_components import (
+    DemandaTreeview, TurnosTreeview, HorarioTrabajadoresTreeview, RiesgoTreeview, NormativaTreeview,
+)
+
+
+class PestanaTienda:
+    """Estado de una tienda más sus widgets (construidos bajo demanda).
+
+    Args:
+        notebook (ttk.Notebook): contenedor de pestañas
+        al_editar (callable): se llama con (trabajador, dia, turno) al
+            elegir un turno nuevo en la tabla de horarios
+        al_deshacer, al_rehacer (callable): acciones de los botones de edición
+    """
+
+    # Atributos de widgets que se crean en `construir` y se sueltan en `liberar`
+    WIDGETS = (
+        "label_fulltime", "label_parttime", "label_turno", "demanda_tree",
+        "turnos_tree", "label_descanso_sab", "label_descanso_dom",
+        "label_cobertura", "horario_trabajadores_tree",
+        "label_normativa", "normativa_tree", "label_riesgo", "riesgo_tree",
+    )
+
+    def __init__(self, notebook, al_editar, al_deshacer, al_rehacer):
+        self.notebook = notebook
+        self.al_editar = al_editar
+        self.al_deshacer = al_deshacer
+        self.al_rehacer = al_rehacer
+        self.frame = ttk.Frame(notebook, padding=10)
+        self.contenido = None
+        for nombre in self.WIDGETS:
+            setattr(self, nombre, None)
+
+        # Estado de la tienda
+        self.path_excel = None
+        self.parametros = None
+        self.demanda = None
+        self.matriz_turnos = None
+        self.descanso_sab = None
+        self.descanso_dom = None
+        self.horarios_trabajadores = None
+        self.riesgo = None
+        self.editor = None
+        self.cambios = None
+        self.incumplimientos = None
+
+    @property
+    def titulo(self):
+        """Texto de la pestaña: nombre del archivo cargado."""
+        if not self.path_excel:
+            return "Nueva tienda"
+        nombre = os.path.splitext(os.path.basename(self.path_excel))[0]
+        return nombre if len(nombre) <= 24 else nombre[:23] + "…"
+
+    @property
+    def construida(self):
+        return self.contenido is not None
+
+    @property
+    def vacia(self):
+        return self.parametros is None
+
+    # --- Ciclo de vida de los widgets ---
+
+    def construir(self):
+        """Crea los widgets de la pestaña y los llena con el estado actual."""
+        if self.construida:
+            return
+        self.contenido = ttk.Frame(self.frame)
+        self.contenido.pack(fill="both", expand=True)
+
+        self._crear_paneles(self.contenido)
+        self._crear_seccion_trabajadores(self.contenido)
+        self._crear_seccion_normativa(self.contenido)
+        self._crear_seccion_riesgo(self.contenido)
+        self.refrescar()
+
+    def liberar(self):
+        """Destruye los widgets (el estado de la tienda se mantiene)."""
+        if not self.construida:
+            return
+        self.contenido.destroy()
+        self.contenido = None
+        for nombre in self.WIDGETS:
+            setattr(self, nombre, None)
+
+    def refrescar(self):
+        """Vuelca todo el estado en los widgets (si están construidos)."""
+        if not self.construida:
+            return
+        if self.parametros:
+            full, part, turno = self.parametros
+            self.label_fulltime.config(text=f"Full-time: {full}")
+            self.label_parttime.config(text=f"Part-time: {part}")
+            self.label_turno.config(text=f"Turno: {turno}")
+        if self.demanda:
+            self.demanda_tree.actualizar(self.demanda)
+
+        if self.horarios_trabajadores is not None:
+            self.turnos_tree.actualizar(self.matriz_turnos)
+            self.horario_trabajadores_tree.actualizar(self.horarios_trabajadores)
+            self.label_descanso_sab.config(text=f"✅ Descansan Sábado: {self.descanso_sab}")
+            self.label_descanso_dom.config(text=f"✅ Descansan Domingo: {self.descanso_dom}")
+            self.normativa_tree.actualizar(self.incumplimientos)
+            self.mostrar_total_normativa()
+        if self.cambios is not None:
+            self.horario_trabajadores_tree.resaltar_cambios(self.cambios, self.horarios_trabajadores)
+        if self.riesgo is not None:
+            self.mostrar_riesgo()
+
+    # --- Construcción de secciones ---
+
+    def _crear_paneles(self, parent):
+        """Crea los paneles izquierdo (datos) y derecho (resultado)."""
+        # Frame contenedor centrado
+        outer = ttk.Frame(parent)
+        outer.pack(fill="x", pady=10)
+
+        container = ttk.Frame(outer)
+        container.pack(anchor="center", padx=50)
+
+        # Panel izquierdo: datos del Excel y tabla de demanda
+        left_frame = ttk.Frame(container)
+        left_frame.pack(side="left", fill="both", expand=True, padx=(0, 5))
+        self._crear_panel_izquierdo(left_frame)
+
+        # Panel derecho: turnos generados y resumen
+        right_frame = ttk.Frame(container)
+        right_frame.pack(side="right", fill="both", expand=True, padx=(5, 0))
+        self._crear_panel_derecho(right_frame)
+
+    def _crear_panel_izquierdo(self, parent):
+        """Sección para mostrar parámetros cargados y la demanda por día."""
+        ttk.Label(parent, text="📊 Datos del Excel",
+                 style="Title.TLabel").pack(pady=(0, 5))
+
+        # Labels que muestran los parámetros leídos
+        params_frame = ttk.Frame(parent)
+        params_frame.pack(fill="x", pady=(0, 10))
+
+        self.label_fulltime = ttk.Label(params_frame, text="Full-time: -")
+        self.label_fulltime.pack(anchor="w", padx=10, pady=2)
+
+        self.label_parttime = ttk.Label(params_frame, text="Part-time: -")
+        self.label_parttime.pack(anchor="w", padx=10, pady=2)
+
+        self.label_turno = ttk.Label(params_frame, text="Turno: -")
+        self.label_turno.pack(anchor="w", padx=10, pady=2)
+
+        ttk.Separator(parent, orient="horizontal").pack(fill="x", pady=5)
+
+        # Demanda: tabla con scrollbar (componente reutilizable)
+        ttk.Label(parent, text="Demanda por Día:",
+                 style="Title.TLabel").pack(pady=(5, 5))
+
+        self.demanda_tree = DemandaTreeview(parent)
+        self.demanda_tree.frame.pack(fill="both", expand=True)
+
+    def _crear_panel_derecho(self, parent):
+        """Sección para mostrar los turnos generados y datos de descanso."""
+        ttk.Label(parent, text="⚙️ Turnos Generados",
+                 style="Title.TLabel").pack(pady=(0, 5))
+
+        self.turnos_tree = TurnosTreeview(parent)
+        self.turnos_tree.frame.pack(fill="both", expand=True)
+
+        # Información adicional sobre descansos en fin de semana
+        info_frame = ttk.Frame(parent)
+        info_frame.pack(fill="x", pady=(10, 0))
+
+        self.label_descanso_sab = ttk.Label(info_frame, text="Descansan Sábado: -")
+        self.label_descanso_sab.pack(anchor="w", padx=10, pady=2)
+
+        self.label_descanso_dom = ttk.Label(info_frame, text="Descansan Domingo: -")
+        self.label_descanso_dom.pack(anchor="w", padx=10, pady=2)
+
+    def _crear_seccion_trabajadores(self, parent):
+        """Sección inferior que muestra el horario semanal por trabajador."""
+        ttk.Separator(parent, orient="horizontal").pack(fill="x", pady=20)
+
+        # Contenedor centrado para el título y la tabla
+        outer = ttk.Frame(parent)
+        outer.pack(fill="x")
+
+        container = ttk.Frame(outer)
+        container.pack(anchor="center", padx=50)
+
+        ttk.Label(container, text="📅 Horario Semanal de Trabajadores",
+                 style="Title.TLabel").pack(pady=(0, 10))
+
+        # Frame con los horarios de turnos en dos columnas
+        horarios_frame = ttk.Frame(container)
+        horarios_frame.pack(pady=(0, 10))
+
+        # Columna izquierda
+        col_izq = ttk.Frame(horarios_frame)
+        col_izq.pack(side="left", padx=15)
+        ttk.Label(col_izq, text=f"Mañana: {SHIFT_HORARIOS['Mañana']}").pack(anchor="w")
+        ttk.Label(col_izq, text=f"Tarde: {SHIFT_HORARIOS['Tarde']}").pack(anchor="w")
+
+        # Columna derecha
+        col_der = ttk.Frame(horarios_frame)
+        col_der.pack(side="right", padx=15)
+        ttk.Label(col_der, text=f"Intermedio: {SHIFT_HORARIOS['Intermedio']}").pack(anchor="w")
+        ttk.Label(col_der, text=f"Part-Time: {SHIFT_HORARIOS['Part-Time']}").pack(anchor="w")
+
+        # Edición manual: doble clic en una celda, con deshacer/rehacer
+        edicion_frame = ttk.Frame(container)
+        edicion_frame.pack(fill="x")
+
+        ttk.Button(edicion_frame, text="↶ Deshacer",
+                  command=self.al_deshacer).pack(side="left", padx=5)
+        ttk.Button(edicion_frame, text="↷ Rehacer",
+                  command=self.al_rehacer).pack(side="left", padx=5)
+
+        self.label_cobertura = ttk.Label(edicion_frame,
+            text="Doble clic en una celda para cambiar el turno")
+        self.label_cobertura.pack(side="left", padx=15)
+
+        self.horario_trabajadores_tree = HorarioTrabajadoresTreeview(container)
+        self.horario_trabajadores_tree.frame.pack(fill="both", expand=True, pady=10)
+        self.horario_trabajadores_tree.habilitar_edicion(opciones_turno, self.al_editar)
+
+    def _crear_seccion_normativa(self, parent):
+        """Sección con los incumplimientos de reglas laborales del horario."""
+        ttk.Separator(parent, orient="horizontal").pack(fill="x", pady=20)
+
+        outer = ttk.Frame(parent)
+        outer.pack(fill="x")
+
+        container = ttk.Frame(outer)
+        container.pack(anchor="center", padx=50)
+
+        ttk.Label(container, text="⚖️ Normativa Laboral",
+                 style="Title.TLabel").pack(pady=(0, 5))
+
+        self.label_normativa = ttk.Label(container, text="Incumplimientos: -")
+        self.label_normativa.pack(pady=(0, 5))
+
+        self.normativa_tree = NormativaTreeview(container)
+        self.normativa_tree.frame.pack(fill="both", expand=True, pady=10)
+
+    def _crear_seccion_riesgo(self, parent):
+        """Sección con el déficit esperado por día/turno según la simulación."""
+        ttk.Separator(parent, orient="horizontal").pack(fill="x", pady=20)
+
+        outer = ttk.Frame(parent)
+        outer.pack(fill="x")
+
+        container = ttk.Frame(outer)
+        container.pack(anchor="center", padx=50)
+
+        ttk.Label(container, text="🎲 Riesgo ante Variación de Demanda",
+                 style="Title.TLabel").pack(pady=(0, 5))
+
+        self.label_riesgo = ttk.Label(container,
+            text=f"Déficit P{SIMULACION['percentil']} (probabilidad de déficit): -")
+        self.label_riesgo.pack(pady=(0, 5))
+
+        self.riesgo_tree = RiesgoTreeview(container)
+        self.riesgo_tree.frame.pack(fill="both", expand=True, pady=10)
+
+    # --- Actualizaciones parciales ---
+
+    def mostrar_total_normativa(self):
+        """Actualiza el texto con la cantidad de incumplimientos."""
+        if self.incumplimientos:
+            trabajadores = len({fila[0] for fila in self.incumplimientos})
+            self.label_normativa.config(
+                text=f"⚠️ Incumplimientos: {len(self.incumplimientos)} ({trabajadores} trabajadores)")
+        else:
+            self.label_normativa.config(text="✅ Sin incumplimientos")
+
+    def limpiar_riesgo(self):
+        """Descarta la simulación de riesgo, que ya no corresponde a la asignación."""
+        self.riesgo = None
+        if self.construida:
+            self.riesgo_tree.limpiar()
+            self.label_riesgo.config(
+                text=f"Déficit P{SIMULACION['percentil']} (probabilidad de déficit): -")
+
+    def mostrar_riesgo(self):
+        """Muestra el resultado de la última simulación de riesgo."""
+        percentil = SIMULACION['percentil']
+        self.riesgo_tree.actualizar(self.riesgo, percentil)
+        self.label_riesgo.config(
+            text=f"Déficit P{percentil} (probabilidad de déficit) — "
+                 f"{self.riesgo['muestras']:,} muestras, total semanal P{percentil}: "
+                 f"{self.riesgo['deficit_semanal'][percentil]:.1f}")
@@ -0,0 +1,338 @@
+"""Pronóstico de la demanda semanal a partir de libros históricos.
+
+Permite cargar en bloque la demanda de semanas anteriores desde un
+directorio con libros de parámetros (`parametros_*.xlsx`, demanda en
+C8:E14) o informes exportados (`Informe_Turnos_*.xlsx`), y estimar la
+demanda de la próxima semana.
+
+Flujo típico:
+    rutas, historico = cargar_historico("historico/tienda_01")
+    matriz = pronosticar(historico, metodo="estacional")
+    demanda = a_demanda(matriz)          # listo para `generar_asignacion`
+    escribir_plantilla("semana.xlsx", 21, 10, "A", demanda)
+
+Rendimiento:
+- Cada libro se abre con `read_only=True` y solo se iteran las filas
+  necesarias.
+- Los libros se leen en paralelo con un pool de procesos; `cargar_tiendas`
+  reutiliza el mismo pool para todas las tiendas.
+- Opcionalmente, lo leído se guarda en un caché .npz fuera del directorio
+  histórico (`cache=` / `directorio_cache=`). En cargas posteriores solo se
+  leen los archivos nuevos o modificados, de modo que años de historia de
+  cientos de tiendas se cargan en segundos.
+- Un libro ilegible o con formato inesperado no detiene la carga: se omite
+  y se informa en `fallidos` como `(ruta, error)`, igual que `lote.py`.
+
+Todos los métodos de pronóstico trabajan sobre el eje de semanas (-3), por
+lo que aceptan tanto un arreglo (semanas, 7, 3) como (tiendas, semanas, 7, 3).
+"""
+
+import os
+import glob
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import openpyxl
+from openpyxl import load_workbook
+from openpyxl.styles import Font
+from config import DIAS_SEMANA, TURNOS
+
+
+def leer_demanda_archivo(ruta):
+    """Lee la matriz 7x3 de demanda de un libro de parámetros o de un informe.
+
+    - Libro de parámetros: demanda en C8:E14 de la hoja activa.
+    - Informe exportado: bloque "AFLUENCIA ESTIMADA" (J6:L12) de la hoja
+      "Resumen General".
+
+    Returns:
+        np.ndarray: matriz float 7x3 (valores vacíos como 0)
+
+    Raises:
+        ValueError: si el informe es antiguo y no tiene el bloque de
+            afluencia. Su matriz de turnos cuenta personas por turno, no
+            clientes, por lo que no sirve como histórico de demanda.
+    """
+    wb = load_workbook(ruta, read_only=True, data_only=True)
+    try:
+        if "Resumen General" in wb.sheetnames:
+            ws = wb["Resumen General"]
+            valores = list(ws.iter_rows(min_row=6, max_row=12, min_col=10, max_col=12,
+                                        values_only=True))
+            if all(valor is None for fila in valores for valor in fila):
+                raise ValueError("El informe no tiene el bloque de afluencia estimada (J6:L12).")
+        else:
+            ws = wb.active
+            valores = list(ws.iter_rows(min_row=8, max_row=14, min_col=3, max_col=5,
+                                        values_only=True))
+    finally:
+        wb.close()
+
+    matriz = np.zeros((7, 3), dtype=float)
+    for i, fila in enumerate(valores[:7]):
+        for j, valor in enumerate(fila[:3]):
+            matriz[i, j] = valor if isinstance(valor, (int, float)) else 0
+    return matriz
+
+
+def _leer_lote(rutas):
+    """Lee varias rutas en un mismo proceso (unidad de trabajo del pool).
+
+    Returns:
+        list: (matriz, None) por cada ruta leída o (None, error) si falló
+    """
+    resultados = []
+    for ruta in rutas:
+        try:
+            resultados.append((leer_demanda_archivo(ruta), None))
+        except Exception as e:
+            resultados.append((None, f"{type(e).__name__}: {e}"))
+    return resultados
+
+
+def _leer_en_paralelo(rutas, procesos, pool=None):
+    """Lee las rutas repartidas en bloques entre `procesos` procesos.
+
+    Args:
+        pool (ProcessPoolExecutor | None): pool a reutilizar; si se omite se
+            crea uno solo para esta lectura
+
+    Returns:
+        list: (matriz, error) por ruta, ver `_leer_lote`
+    """
+    if not rutas:
+        return []
+    if procesos == 1 or len(rutas) < 8:
+        return _leer_lote(rutas)
+
+    procesos = procesos or os.cpu_count() or 1
+    tam_bloque = max(1, len(rutas) // (procesos * 4))
+    bloques = [rutas[k:k + tam_bloque] for k in range(0, len(rutas), tam_bloque)]
+    if pool is not None:
+        return [r for bloque in pool.map(_leer_lote, bloques) for r in bloque]
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        return [r for bloque in pool.map(_leer_lote, bloques) for r in bloque]
+
+
+def cargar_historico(directorio, patron="*.xlsx", procesos=None, cache=None, fallidos=None,
+                     pool=None):
+    """Carga la demanda de todos los libros de un directorio.
+
+    Los archivos se ordenan por nombre, que en los informes exportados
+    incluye la fecha (`Informe_Turnos_AAAAMMDD_HHMMSS.xlsx`).
+
+    Args:
+        directorio (str): carpeta con los libros históricos de una tienda
+        patron (str): patrón glob de los archivos a considerar
+        procesos (int | None): procesos para la lectura (None = todos los núcleos)
+        cache (str | None): ruta del .npz a reutilizar/actualizar (None = sin caché)
+        fallidos (list | None): recibe `(ruta, error)` por cada libro omitido.
+            Si se omite, los libros fallidos se informan con `warnings.warn`.
+            Los informes sin bloque de afluencia también se omiten aquí.
+        pool (ProcessPoolExecutor | None): pool de procesos a reutilizar
+            (None = se crea uno para esta carga si hace falta)
+
+    Returns:
+        tuple: (rutas, historico) con `historico` de forma (semanas, 7, 3);
+        `rutas` solo incluye los libros leídos
+    """
+    rutas = sorted(
+        r for r in glob.glob(os.path.join(directorio, patron))
+        if not os.path.basename(r).startswith("~$")
+    )
+    firmas = np.array([(os.stat(r).st_mtime_ns, os.stat(r).st_size) for r in rutas],
+                      dtype=np.int64).reshape(-1, 2)
+    nombres = np.array([os.path.basename(r) for r in rutas], dtype=str)
+    historico = np.zeros((len(rutas), 7, 3))
+    validos = np.ones(len(rutas), dtype=bool)
+
+    # Reutilizar las entradas del caché cuyo nombre, fecha y tamaño coinciden
+    pendientes = np.ones(len(rutas), dtype=bool)
+    if cache and os.path.exists(cache) and len(rutas):
+        with np.load(cache) as datos:
+            indice = {(n, int(a), int(b)): k for k, (n, (a, b))
+                      in enumerate(zip(datos["nombres"], datos["firmas"]))}
+            previos = datos["historico"]
+        for i, (nombre, (mtime, tam)) in enumerate(zip(nombres, firmas)):
+            k = indice.get((nombre, int(mtime), int(tam)))
+            if k is not None:
+                historico[i] = previos[k]
+                pendientes[i] = False
+
+    if pendientes.any():
+        idx = np.flatnonzero(pendientes)
+        errores = []
+        leidos = _leer_en_paralelo([rutas[i] for i in idx], procesos, pool)
+        for i, (matriz, error) in zip(idx, leidos):
+            if error is None:
+                historico[i] = matriz
+            else:
+                validos[i] = False
+                errores.append((rutas[i], error))
+        if errores:
+            if fallidos is None:
+                warnings.warn("Libros omitidos en el histórico:\n"
+                              + "\n".join(f"{ruta}: {error}" for ruta, error in errores))
+            else:
+                fallidos.extend(errores)
+
+        # Los libros fallidos no se guardan: se reintentan en la próxima carga
+        if cache:
+            os.makedirs(os.path.dirname(os.path.abspath(cache)), exist_ok=True)
+            np.savez(cache, nombres=nombres[validos], firmas=firmas[validos],
+                     historico=historico[validos])
+
+    return [r for r, valido in zip(rutas, validos) if valido], historico[validos]
+
+
+def cargar_tiendas(directorio_raiz, patron="*.xlsx", procesos=None, directorio_cache=None,
+                   fallidos=None):
+    """Carga el histórico de cada subdirectorio (una tienda por carpeta).
+
+    Args:
+        directorio_cache (str | None): carpeta donde guardar un caché
+            `<tienda>.npz` por tienda (None = sin caché)
+        fallidos (list | None): ver `cargar_historico`
+
+    Returns:
+        dict: {nombre_tienda: arreglo (semanas, 7, 3)}
+    """
+    # Un único pool para todas las tiendas: arrancar procesos por tienda
+    # cuesta más que leer los pocos libros nuevos de cada una
+    pool = None
+    if procesos != 1:
+        pool = ProcessPoolExecutor(max_workers=procesos or os.cpu_count() or 1)
+    try:
+        tiendas = {}
+        for nombre in sorted(os.listdir(directorio_raiz)):
+            ruta = os.path.join(directorio_raiz, nombre)
+            if os.path.isdir(ruta):
+                cache = os.path.join(directorio_cache, f"{nombre}.npz") if directorio_cache else None
+                _, historico = cargar_historico(ruta, patron, procesos, cache, fallidos, pool)
+                tiendas[nombre] = historico
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return tiendas
+
+
+def apilar_tiendas(tiendas, semanas=None):
+    """Apila los históricos de varias tiendas en un arreglo (tiendas, semanas, 7, 3).
+
+    Se conservan las últimas `semanas` de cada tienda (por defecto, las de
+    la tienda con menos historia) para que todas tengan el mismo largo.
+    """
+    largo = min(h.shape[0] for h in tiendas.values()) if semanas is None else semanas
+    return np.stack([h[-largo:] for h in tiendas.values()]) if largo else np.zeros((len(tiendas), 0, 7, 3))
+
+
+def media_movil(historico, ventana=4):
+    """Promedio de las últimas `ventana` semanas."""
+    historico = np.asarray(historico, dtype=float)
+    return historico[..., -ventana:, :, :].mean(axis=-3)
+
+
+def suavizado_exponencial(historico, alfa=0.3):
+    """Suavizado exponencial simple calculado como una suma ponderada.
+
+    El nivel final de la recursión `s_t = alfa*x_t + (1-alfa)*s_{t-1}` (con
+    `s_0 = x_0`) equivale a ponderar la semana de antigüedad `k` con
+    `alfa*(1-alfa)**k` y la primera semana con `(1-alfa)**(n-1)`, lo que
+    permite resolverlo con un único `einsum` en vez de un bucle.
+    """
+    historico = np.asarray(historico, dtype=float)
+    n = historico.shape[-3]
+    antiguedad = np.arange(n - 1, -1, -1)
+    pesos = alfa * (1 - alfa) ** antiguedad
+    pesos[0] = (1 - alfa) ** (n - 1)
+    return np.einsum("w,...wdt->...dt", pesos, historico)
+
+
+def estacionalidad_semanal(historico, ventana=4):
+    """Pronóstico nivel x perfil estacional por día de la semana y turno.
+
+    - Perfil: participación media de cada celda día/turno en el total de su
+      semana, considerando toda la historia.
+    - Nivel: total semanal promedio de las últimas `ventana` semanas.
+    """
+    historico = np.asarray(historico, dtype=float)
+    totales = historico.sum(axis=(-2, -1), keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        participaciones = np.where(totales > 0, historico / totales, np.nan)
+    perfil = np.nan_to_num(np.nanmean(participaciones, axis=-3))
+    nivel = totales[..., -ventana:, :, :].mean(axis=-3)
+    return nivel * perfil
+
+
+METODOS = {
+    "media_movil": media_movil,
+    "suavizado": suavizado_exponencial,
+    "estacional": estacionalidad_semanal,
+}
+
+
+def pronosticar(historico, metodo="estacional", **kwargs):
+    """Pronostica la demanda de la próxima semana con el método indicado.
+
+    Args:
+        historico (array-like): arreglo (..., semanas, 7, 3)
+        metodo (str): "media_movil", "suavizado" o "estacional"
+        **kwargs: parámetros del método (`ventana`, `alfa`)
+
+    Returns:
+        np.ndarray: arreglo (..., 7, 3) con la demanda pronosticada
+    """
+    historico = np.asarray(historico, dtype=float)
+    if historico.shape[-3] == 0:
+        raise ValueError("No hay semanas históricas para pronosticar.")
+    if metodo not in METODOS:
+        raise ValueError(f"Método de pronóstico no soportado: {metodo}")
+    return METODOS[metodo](historico, **kwargs)
+
+
+def a_demanda(matriz):
+    """Convierte una matriz 7x3 en el diccionario que usa `generar_asignacion`."""
+    matriz = np.rint(np.asarray(matriz, dtype=float)).astype(int)
+    return {
+        dia: {turno: int(matriz[i][j]) for j, turno in enumerate(TURNOS)}
+        for i, dia in enumerate(DIAS_SEMANA)
+    }
+
+
+def escribir_plantilla(ruta, full_time, part_time, tipo, demanda):
+    """Crea un libro de parámetros con el mismo formato que lee `leer_parametros`.
+
+    Args:
+        ruta (str): archivo .xlsx de destino
+        full_time (int): trabajadores Full-Time (C3)
+        part_time (int): trabajadores Part-Time (C4)
+        tipo (str): tipo de turno "A" o "B" (C5)
+        demanda (dict): demanda por día (C8:E14), p. ej. la salida de `a_demanda`
+    """
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Parámetros"
+
+    ws['B2'] = "Parámetro"
+    ws['C2'] = "Valor"
+    ws['B3'] = "Número de trabajadores Full-Time"
+    ws['C3'] = full_time
+    ws['B4'] = "Número de trabajadores Part-Time"
+    ws['C4'] = part_time
+    ws['B5'] = "Turno (A o B)"
+    ws['C5'] = tipo
+
+    ws['B7'] = "Estimación de clientes por Día/Turno"
+    for j, turno in enumerate(TURNOS):
+        ws.cell(row=7, column=j + 3, value=turno)
+    for i, dia in enumerate(DIAS_SEMANA):
+        ws.cell(row=8 + i, column=2, value=dia)
+        for j, turno in enumerate(TURNOS):
+            ws.cell(row=8 + i, column=j + 3, value=demanda[dia][turno])
+
+    for celda in ("B2", "C2", "B7"):
+        ws[celda].font = Font(bold=True)
+    ws.column_dimensions['B'].width = 38
+
+    wb.save(ruta)
@@ -0,0 +1,171 @@
+"""Verificación de reglas laborales sobre los horarios generados.
+
+Los horarios se convierten a matrices de códigos (trabajadores x 7, ver
+`diferencias.matriz_codigos`) y de ahí, con una tabla de búsqueda, a
+matrices de hora de inicio, hora de término y horas trabajadas por día
+según `config.SHIFT_HORARIOS`. Cada regla es una función que recibe esas
+matrices y devuelve, con operaciones de NumPy sobre toda la plantilla, una
+máscara con los trabajadores (o celdas) que la incumplen.
+
+Como las reglas operan sobre el último eje (días), se puede verificar un
+lote completo de tiendas concatenando sus matrices de códigos.
+"""
+
+import numpy as np
+from config import SHIFT_HORARIOS, CODIGOS_TURNO, REGLAS_LABORALES
+from diferencias import matriz_codigos
+
+
+def _horas_turno(texto):
+    """Convierte "08 - 16 hrs" en (8, 16)."""
+    inicio, fin = texto.replace("hrs", "").split("-")
+    return float(inicio), float(fin)
+
+
+# Tablas indexadas por código de turno: inicio, término y duración.
+# Los días sin trabajo ("-", "Libre") quedan con NaN y 0 horas. La posición
+# extra del final corresponde a `SIN_REGISTRO` (-1) y tampoco cuenta horas.
+INICIO = np.full(len(CODIGOS_TURNO) + 1, np.nan)
+FIN = np.full(len(CODIGOS_TURNO) + 1, np.nan)
+for _codigo, _turno in enumerate(CODIGOS_TURNO):
+    if _turno in SHIFT_HORARIOS:
+        INICIO[_codigo], FIN[_codigo] = _horas_turno(SHIFT_HORARIOS[_turno])
+HORAS = np.nan_to_num(FIN - INICIO)
+
+
+def _dias_consecutivos_max(trabaja):
+    """Racha más larga de días trabajados seguidos (vectorizado por trabajador)."""
+    racha = np.zeros(trabaja.shape[:-1], dtype=int)
+    maximo = np.zeros_like(racha)
+    for d in range(trabaja.shape[-1]):
+        racha = (racha + 1) * trabaja[..., d]
+        np.maximum(maximo, racha, out=maximo)
+    return maximo
+
+
+def regla_horas_semanales(datos, limites):
+    """Horas totales de la semana frente al máximo FT o PT."""
+    horas = datos['horas'].sum(axis=-1)
+    limite = np.where(datos['es_pt'], limites['pt_horas_semanales_max'],
+                      limites['horas_semanales_max'])
+    return horas > limite, horas
+
+
+def regla_horas_diarias(datos, limites):
+    """Ninguna jornada puede superar `horas_diarias_max`."""
+    exceso = datos['horas'] > limites['horas_diarias_max']
+    return exceso.any(axis=-1), datos['horas'].max(axis=-1)
+
+
+def regla_descanso_entre_jornadas(datos, limites):
+    """Horas entre el término de un día y el inicio del siguiente."""
+    # Horas entre el término del día d y el inicio del día d+1
+    with np.errstate(invalid="ignore"):
+        descanso = datos['inicio'][..., 1:] + 24 - datos['fin'][..., :-1]
+        corto = descanso < limites['descanso_minimo_horas']  # NaN (día libre) -> False
+    return corto.any(axis=-1), np.nanmin(np.where(corto, descanso, np.inf), axis=-1)
+
+
+def regla_dias_consecutivos(datos, limites):
+    """Racha máxima de días trabajados sin descanso."""
+    consecutivos = _dias_consecutivos_max(datos['trabaja'])
+    return consecutivos > limites['max_dias_consecutivos'], consecutivos
+
+
+def regla_part_time_fin_de_semana(datos, limites):
+    """Los PT solo trabajan sábado/domingo y hasta `pt_max_dias_fin_semana` días."""
+    trabaja = datos['trabaja']
+    entre_semana = trabaja[..., :5].sum(axis=-1)
+    fin_de_semana = trabaja[..., 5:].sum(axis=-1)
+    incumple = datos['es_pt'] & ((entre_semana > 0) | (fin_de_semana > limites['pt_max_dias_fin_semana']))
+    return incumple, entre_semana + fin_de_semana
+
+
+# Regla -> (función, descripción del valor informado)
+REGLAS = {
+    "Horas semanales": (regla_horas_semanales, "{:.0f} h en la semana"),
+    "Jornada diaria": (regla_horas_diarias, "jornada de {:.0f} h"),
+    "Descanso entre jornadas": (regla_descanso_entre_jornadas, "descanso de {:.0f} h"),
+    "Días consecutivos": (regla_dias_consecutivos, "{:.0f} días seguidos"),
+    "Part-Time fin de semana": (regla_part_time_fin_de_semana, "{:.0f} días trabajados"),
+}
+
+
+def preparar_datos(codigos, es_pt):
+    """Calcula las matrices de horas a partir de los códigos de turno.
+
+    Args:
+        codigos (np.ndarray): matriz (..., 7) de códigos (`CODIGOS_TURNO`)
+        es_pt (np.ndarray): vector booleano (...) que indica los Part-Time
+    """
+    codigos = np.asarray(codigos)
+    return {
+        'inicio': INICIO[codigos],
+        'fin': FIN[codigos],
+        'horas': HORAS[codigos],
+        'trabaja': HORAS[codigos] > 0,
+        'es_pt': np.asarray(es_pt, dtype=bool),
+    }
+
+
+def evaluar_reglas(codigos, es_pt, limites=None):
+    """Evalúa todas las reglas sobre una plantilla o un lote completo.
+
+    Returns:
+        dict: {regla: (incumple, valor)} con máscaras/valores por trabajador
+    """
+    limites = {**REGLAS_LABORALES, **(limites or {})}
+    datos = preparar_datos(codigos, es_pt)
+    return {nombre: funcion(datos, limites) for nombre, (funcion, _) in REGLAS.items()}
+
+
+def verificar_horarios(horarios_trabajadores, limites=None):
+    """Devuelve los incumplimientos de los horarios de una tienda.
+
+    Returns:
+        list: tuplas (trabajador, regla, detalle), ordenadas por trabajador
+    """
+    trabajadores, codigos = matriz_codigos(horarios_trabajadores)
+    es_pt = np.array([t.startswith("Part-Time") for t in trabajadores], dtype=bool)
+    resultados = evaluar_reglas(codigos, es_pt, limites)
+
+    incumplimientos = []
+    for nombre, (incumple, valor) in resultados.items():
+        formato = REGLAS[nombre][1]
+        for k in np.flatnonzero(incumple):
+            incumplimientos.append((trabajadores[k], nombre, formato.format(valor[k])))
+    incumplimientos.sort(key=lambda fila: fila[0])
+    return incumplimientos
+
+
+def verificar_lote(lista_horarios, limites=None):
+    """Evalúa las reglas de muchas tiendas en una sola pasada.
+
+    Concatena las matrices de códigos de todas las tiendas, evalúa las
+    reglas una vez y reparte los resultados con `np.add.reduceat`.
+
+    Args:
+        lista_horarios (list): horarios_trabajadores de cada tienda
+
+    Returns:
+        np.ndarray: matriz (tiendas x reglas) con la cantidad de trabajadores
+        que incumplen cada regla, en el orden de `REGLAS`
+    """
+    bloques, es_pt, inicios = [], [], []
+    total = 0
+    for horarios in lista_horarios:
+        trabajadores, codigos = matriz_codigos(horarios)
+        inicios.append(total)
+        total += len(trabajadores)
+        bloques.append(codigos)
+        es_pt.extend(t.startswith("Part-Time") for t in trabajadores)
+
+    if not total:
+        return np.zeros((len(inicios), len(REGLAS)), dtype=int)
+
+    resultados = evaluar_reglas(np.concatenate(bloques), np.array(es_pt, dtype=bool), limites)
+    incumple = np.stack([mascara for mascara, _ in resultados.values()], axis=1).astype(int)
+    conteo = np.zeros((len(inicios), len(REGLAS)), dtype=int)
+    con_filas = np.array([len(b) > 0 for b in bloques])
+    conteo[con_filas] = np.add.reduceat(incumple, np.array(inicios)[con_filas], axis=0)
+    return conteo
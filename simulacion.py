@@ -0,0 +1,150 @@
+"""Simulación Monte Carlo de la robustez de una asignación de turnos.
+
+La demanda leída del Excel (C8:E14) es una estimación puntual. Este módulo
+toma esa estimación, genera muchas muestras de demanda alrededor de ella y
+mide, para la `matriz_turnos` ya calculada, cuánto personal faltaría en
+cada muestra.
+
+Modelo utilizado:
+- La demanda son afluencias (clientes). Para compararlas con la matriz de
+  trabajadores se usa la razón `personal_por_cliente`, que por defecto es
+  la del plan puntual: total de turnos asignados / total de afluencia.
+- El déficit de una celda día/turno en una muestra es
+  `max(muestra * personal_por_cliente - matriz, 0)`.
+
+Todas las muestras se generan como un único arreglo NumPy de forma
+(n_muestras, 7, 3) y se evalúan sin bucles en Python, de modo que 100.000
+muestras se procesan en menos de un segundo en un solo núcleo.
+"""
+
+import numpy as np
+from config import DIAS_SEMANA, TURNOS, SIMULACION
+from modelo import Escenario, VistaDemanda
+
+# Percentiles que se calculan siempre; se añade el configurado para la UI
+PERCENTILES = (50, 90, 95, 99)
+
+
+def _afluencias(demanda):
+    """Convierte la demanda en un arreglo 7x3.
+
+    Acepta un `Escenario` o su `VistaDemanda`, un dict por día o una matriz.
+    """
+    if isinstance(demanda, (Escenario, VistaDemanda)):
+        return demanda.afluencias
+    if isinstance(demanda, dict):
+        return np.array([[demanda[dia][turno] for turno in TURNOS] for dia in DIAS_SEMANA],
+                        dtype=float)
+    return np.asarray(demanda, dtype=float)
+
+
+def muestrear_demanda(demanda, n_muestras=None, ruido=None, distribucion="normal",
+                      semilla=None):
+    """Genera `n_muestras` escenarios de demanda en un solo arreglo.
+
+    Args:
+        demanda (dict | array-like): demanda base 7x3
+        n_muestras (int): cantidad de muestras (por defecto `SIMULACION['muestras']`)
+        ruido (float | array-like): coeficiente de variación global o por celda (7x3)
+        distribucion (str): "normal", "lognormal" o "poisson"
+        semilla (int | None): semilla del generador para resultados reproducibles
+
+    Returns:
+        np.ndarray: arreglo float32 de forma (n_muestras, 7, 3) sin valores negativos
+    """
+    n_muestras = SIMULACION['muestras'] if n_muestras is None else n_muestras
+    ruido = SIMULACION['ruido'] if ruido is None else ruido
+
+    base = _afluencias(demanda).astype(np.float32)
+    cv = np.broadcast_to(np.asarray(ruido, dtype=np.float32), base.shape)
+    rng = np.random.default_rng(semilla)
+    forma = (n_muestras, *base.shape)
+
+    if distribucion == "normal":
+        muestras = rng.standard_normal(forma, dtype=np.float32)
+        muestras *= cv
+        muestras += 1.0
+        muestras *= base
+        np.maximum(muestras, 0.0, out=muestras)
+    elif distribucion == "lognormal":
+        # Parámetros de la lognormal con media `base` y coeficiente de variación `cv`
+        sigma = np.sqrt(np.log1p(cv ** 2))
+        muestras = rng.standard_normal(forma, dtype=np.float32)
+        muestras *= sigma
+        muestras -= sigma ** 2 / 2
+        np.exp(muestras, out=muestras)
+        muestras *= base
+    elif distribucion == "poisson":
+        muestras = rng.poisson(base, size=forma).astype(np.float32)
+    else:
+        raise ValueError(f"Distribución no soportada: {distribucion}")
+
+    return muestras
+
+
+def evaluar_deficit(matriz_turnos, muestras, personal_por_cliente):
+    """Calcula el déficit de personal de la matriz fija en cada muestra.
+
+    Returns:
+        np.ndarray: arreglo float32 (n_muestras, 7, 3) con el personal faltante
+    """
+    capacidad = np.asarray(matriz_turnos, dtype=np.float32)
+    deficit = muestras * np.float32(personal_por_cliente)
+    deficit -= capacidad
+    np.maximum(deficit, 0.0, out=deficit)
+    return deficit
+
+
+def simular_robustez(matriz_turnos, demanda, n_muestras=None, ruido=None,
+                     distribucion="normal", semilla=None, percentiles=None,
+                     personal_por_cliente=None):
+    """Evalúa la fragilidad de `matriz_turnos` ante incertidumbre en la demanda.
+
+    Args:
+        matriz_turnos (array-like): matriz 7x3 generada por `generar_asignacion`
+        demanda (dict | array-like): demanda puntual usada como centro de las muestras
+        percentiles (iterable, opcional): percentiles de déficit a calcular. Por
+            defecto `PERCENTILES` más `SIMULACION['percentil']`.
+        personal_por_cliente (float, opcional): trabajadores necesarios por unidad
+            de afluencia. Si se omite se deduce del plan puntual.
+
+    Returns:
+        dict: {
+            'muestras': n,
+            'semilla': semilla,
+            'percentiles': {p: matriz 7x3 con el déficit en el percentil p},
+            'prob_deficit': matriz 7x3 con la probabilidad de que falte personal,
+            'deficit_medio': matriz 7x3 con el déficit esperado,
+            'deficit_semanal': {p: déficit total semanal en el percentil p},
+        }
+    """
+    semilla = SIMULACION['semilla'] if semilla is None else semilla
+    if percentiles is None:
+        percentiles = sorted({*PERCENTILES, SIMULACION['percentil']})
+    percentiles = tuple(percentiles)
+    if not all(0 <= p <= 100 for p in percentiles):
+        raise ValueError(f"Los percentiles deben estar entre 0 y 100: {percentiles}")
+    matriz = np.asarray(matriz_turnos, dtype=float)
+    base = _afluencias(demanda)
+
+    if personal_por_cliente is None:
+        total = base.sum()
+        personal_por_cliente = matriz.sum() / total if total else 0.0
+
+    muestras = muestrear_demanda(base, n_muestras, ruido, distribucion, semilla)
+    deficit = evaluar_deficit(matriz, muestras, personal_por_cliente)
+
+    # Una sola llamada a percentile sobre todas las celdas (y el total semanal)
+    planos = deficit.reshape(deficit.shape[0], -1)
+    semanal = planos.sum(axis=1)
+    valores = np.percentile(planos, percentiles, axis=0)
+    valores_semanal = np.percentile(semanal, percentiles)
+
+    return {
+        'muestras': int(deficit.shape[0]),
+        'semilla': semilla,
+        'percentiles': {p: valores[k].reshape(7, 3) for k, p in enumerate(percentiles)},
+        'prob_deficit': (deficit > 0).mean(axis=0),
+        'deficit_medio': deficit.mean(axis=0),
+        'deficit_semanal': {p: float(valores_semanal[k]) for k, p in enumerate(percentiles)},
+    }
@@ -0,0 +1,19 @@
+import os
+import sys
+
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+
+@pytest.fixture
+def libro_ejemplo():
+    """Ruta del libro de parámetros de ejemplo incluido en el repositorio."""
+    return os.path.join(RAIZ, "parametros_turnos_semana-new.xlsx")
+
+
+@pytest.fixture
+def escenario_ejemplo(libro_ejemplo):
+    from leer_excel import leer_parametros
+    return leer_parametros(libro_ejemplo)
@@ -0,0 +1,123 @@
+import tkinter as tk
+
+import pytest
+
+import app
+from config import SIMULACION
+from ediciones import EditorHorarios, opciones_turno
+from main import resolver
+from pestanas import PestanaTienda
+
+
+@pytest.fixture
+def aplicacion(monkeypatch, libro_ejemplo):
+    """`App` sobre una ventana oculta; se omite si no hay pantalla disponible."""
+    try:
+        raiz = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"Tk no disponible: {e}")
+    raiz.withdraw()
+
+    def error(titulo, mensaje, **kwargs):
+        raise AssertionError(mensaje)
+
+    monkeypatch.setattr(app.messagebox, "showinfo", lambda *a, **k: None)
+    monkeypatch.setattr(app.messagebox, "showwarning", error)
+    monkeypatch.setattr(app.messagebox, "showerror", error)
+    monkeypatch.setattr(app.filedialog, "askopenfilenames", lambda **k: (libro_ejemplo,))
+    monkeypatch.setattr(app, "PESTANAS_CONSTRUIDAS", 1)
+    monkeypatch.setitem(SIMULACION, "muestras", 2000)
+
+    yield app.App(raiz)
+    raiz.destroy()
+
+
+def _seleccionar(aplicacion, pestana):
+    aplicacion.notebook.select(pestana.frame)
+    aplicacion.root.update()
+    aplicacion._al_cambiar_pestana()  # idempotente si el evento ya se procesó
+
+
+def test_desalojar_y_reconstruir_restaura_la_vista(aplicacion, monkeypatch):
+    aplicacion.cargar_excel()
+    aplicacion.generar_turnos()
+    tienda = aplicacion._pestana_actual()
+    horarios = tienda.horarios_trabajadores
+
+    # Edición manual, comparación con un informe anterior y simulación de riesgo
+    editado = next(t for t, h in horarios.items() if h["Lunes"] == "Mañana")
+    aplicacion.editar_turno(editado, "Lunes", "Libre")
+
+    comparado = next(t for t, h in horarios.items() if t != editado and h["Martes"] != "Libre")
+    anterior = {t: dict(h) for t, h in horarios.items()}
+    anterior[comparado]["Martes"] = "Libre"
+    monkeypatch.setattr(app.filedialog, "askopenfilename", lambda **k: "anterior.xlsx")
+    monkeypatch.setattr(app, "leer_informe", lambda ruta: (None,) * 5 + (anterior,))
+    aplicacion.comparar_informe()
+    aplicacion.simular_riesgo()
+
+    # Otra pestaña desaloja los widgets de la primera
+    otra = aplicacion.nueva_pestana()
+    _seleccionar(aplicacion, otra)
+    assert otra.construida and not tienda.construida
+    assert tienda.horario_trabajadores_tree is None
+
+    # Al volver se reconstruye con el mismo estado
+    _seleccionar(aplicacion, tienda)
+    assert tienda.construida and not otra.construida
+
+    tabla = tienda.horario_trabajadores_tree
+    assert tabla.tree.set(editado, "Lunes") == "Libre"
+    assert tabla.tree.bind("<Double-1>")
+    assert tabla._opciones is opciones_turno
+    assert tabla._al_editar == aplicacion.editar_turno
+
+    assert tabla.tree.tag_has("cambiado") == (comparado,)
+    assert tabla.tree.set(comparado, "Martes") == f"{horarios[comparado]['Martes']} ← Libre"
+
+    assert len(tienda.riesgo_tree.tree.get_children()) == 7
+    assert "2,000 muestras" in str(tienda.label_riesgo.cget("text"))
+
+    # La edición desde la tabla reconstruida llega al editor y limpia la comparación
+    tabla._al_editar(editado, "Lunes", "Mañana")
+    assert horarios[editado]["Lunes"] == "Mañana"
+    assert tienda.cambios is None and tienda.riesgo is None
+    assert tienda.riesgo_tree.tree.get_children() == ()
+    assert str(tienda.label_riesgo.cget("text")).endswith(": -")
+    assert tabla.tree.tag_has("cambiado") == ()
+    assert tabla.tree.set(comparado, "Martes") == horarios[comparado]["Martes"]
+    assert "cobertura completa" in str(tienda.label_cobertura.cget("text"))
+
+
+class _Widget:
+    """Reemplazo de un widget que solo registra las llamadas recibidas."""
+
+    def __init__(self):
+        self.llamadas = []
+
+    def __getattr__(self, nombre):
+        return lambda *args, **kwargs: self.llamadas.append((nombre, args, kwargs))
+
+
+def test_edicion_descarta_el_riesgo_sin_tk(escenario_ejemplo):
+    matriz, _, _, horarios = resolver(escenario_ejemplo)
+    horarios = horarios.a_diccionario()
+
+    # Pestaña construida con widgets de registro, sin crear una ventana
+    pestana = PestanaTienda.__new__(PestanaTienda)
+    for nombre in PestanaTienda.WIDGETS:
+        setattr(pestana, nombre, _Widget())
+    pestana.contenido = _Widget()
+    pestana.horarios_trabajadores = horarios
+    pestana.editor = EditorHorarios(horarios, matriz)
+    pestana.incumplimientos, pestana.cambios = [], None
+    pestana.riesgo = {"muestras": 2000}
+
+    trabajador = next(t for t, h in horarios.items() if h["Lunes"] == "Mañana")
+    pestana.editor.editar(trabajador, "Lunes", "Libre")
+    app.App._reflejar_edicion(None, pestana, trabajador, "Lunes", "Libre")
+
+    assert pestana.riesgo is None
+    assert [n for n, _, _ in pestana.riesgo_tree.llamadas] == ["limpiar"]
+    (_, _, kwargs), = pestana.label_riesgo.llamadas
+    assert kwargs["text"].endswith(": -")
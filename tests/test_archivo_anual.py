@@ -0,0 +1,29 @@
+import numpy as np
+import openpyxl
+
+import archivo_anual
+from main import resolver
+
+
+def test_demanda_no_finita_queda_vacia(tmp_path, escenario_ejemplo):
+    matriz, descanso_sab, descanso_dom, horarios = resolver(escenario_ejemplo)
+    demanda = {dia: dict(fila) for dia, fila in escenario_ejemplo.demanda.items()}
+    demanda["Lunes"]["Mañana"], demanda["Martes"]["Intermedio"] = float("nan"), float("inf")
+    parametros = escenario_ejemplo.parametros
+    ruta = str(tmp_path / "archivo_2026.xlsx")
+
+    archivo_anual.anexar_semana(ruta, 12, parametros, demanda, matriz, descanso_sab, descanso_dom,
+                                horarios.a_diccionario())
+
+    # openpyxl rechaza el libro si alguna celda tiene <v>nan</v> o <v>inf</v>
+    wb = openpyxl.load_workbook(ruta)
+    valores = [c for fila in wb[archivo_anual.nombres_hojas(12)[0]].iter_rows(values_only=True)
+               for c in fila if isinstance(c, float)]
+    assert all(np.isfinite(valores))
+    assert archivo_anual.semanas_archivadas(ruta) == [12]
+
+
+def test_celda_no_finita():
+    assert archivo_anual._celda("A1", float("nan"), 0) == '<c r="A1"/>'
+    assert archivo_anual._celda("B2", float("-inf"), 6) == '<c r="B2" s="6"/>'
+    assert archivo_anual._celda("C3", 1.5, 0) == '<c r="C3"><v>1.5</v></c>'
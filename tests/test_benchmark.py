@@ -0,0 +1,23 @@
+import benchmark
+from benchmark import PERFIL_DEMANDA, comparar_estrategias
+from estrategias import ESTRATEGIAS_HORARIO, ESTRATEGIAS_REPARTO
+from pronostico import a_demanda
+
+
+def test_todas_las_estrategias_reportan_resultado(escenario_ejemplo):
+    escenarios = [tuple(escenario_ejemplo), (40, 8, "B", a_demanda(PERFIL_DEMANDA * 2))]
+    filas = comparar_estrategias(escenarios)
+
+    assert {(f['reparto'], f['horario']) for f in filas} == \
+        {(r, h) for r in ESTRATEGIAS_REPARTO for h in ESTRATEGIAS_HORARIO}
+    for fila in filas:
+        assert (fila['escenarios'], fila['errores']) == (2, 0), fila
+        assert fila['tiempo_ms'] > 0 and fila['sin_cubrir'] >= 0
+
+
+def test_cli_estrategias(capsys):
+    benchmark.main_cli(["estrategias", "--escenarios", "3", "--semilla", "1"])
+    salida = capsys.readouterr().out
+    assert salida.startswith("3 escenarios")
+    for reparto in ESTRATEGIAS_REPARTO:
+        assert reparto in salida
@@ -0,0 +1,34 @@
+import numpy as np
+
+from archivo_anual import filas_horario
+from config import DIAS_SEMANA
+from diferencias import SIN_REGISTRO, diferenciar, matriz_codigos
+from reglas_laborales import verificar_horarios
+
+
+def _semana(turno):
+    return {dia: turno for dia in DIAS_SEMANA}
+
+
+def test_turnos_y_dias_desconocidos_quedan_sin_registro():
+    horarios = {"T1": {"Lunes": "Mañana", "Martes": "Vacaciones"}}
+    _, codigos = matriz_codigos(horarios)
+    assert codigos.tolist() == [[2] + [SIN_REGISTRO] * 6]
+
+
+def test_diferenciar_informe_parcial():
+    anterior = {"T1": {"Lunes": "Mañana", "Martes": "Vacaciones"}}
+    nuevo = {"T1": _semana("Mañana"), "T2": _semana("Tarde")}
+    cambios = diferenciar(anterior, nuevo)
+
+    assert cambios['cambios_por_trabajador'] == {"T1": 6, "T2": 7}
+    assert ("T1", "Martes", "(sin registro)", "Mañana") in cambios['celdas']
+    assert cambios['altas'] == ["T2"]
+    # Los días sin registro no cuentan en la variación de personas
+    assert np.array_equal(cambios['delta'][1:, 0], [1] * 6)
+
+
+def test_consumidores_toleran_sin_registro():
+    horarios = {"Trabajador 01": {**_semana("Libre"), "Lunes": "Vacaciones"}}
+    assert verificar_horarios(horarios) == []
+    assert filas_horario(horarios)[3][1][0] == "(sin registro)"
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from benchmark import generar_escenarios
+from ediciones import EditorHorarios
+from main import generar_asignacion, resolver
+
+
+def _editor(resultado):
+    return EditorHorarios(resultado.horarios.a_diccionario(), resultado.matriz)
+
+
+def test_horario_sin_editar_no_tiene_deficit(escenario_ejemplo):
+    editor = _editor(resolver(escenario_ejemplo))
+    assert [editor.deficit_dia(i).tolist() for i in range(7)] == [[0, 0, 0]] * 7
+
+
+@pytest.mark.parametrize("escenario", generar_escenarios(10, semilla=3, max_ft=300))
+@pytest.mark.parametrize("reparto", ["proporcional", "optimo"])
+def test_sin_deficit_en_escenarios_sinteticos(escenario, reparto):
+    editor = _editor(generar_asignacion(*escenario, reparto=reparto))
+    assert not any(editor.deficit_dia(i).any() for i in range(7))
+
+
+def test_deficit_tras_editar_y_deshacer(escenario_ejemplo):
+    editor = _editor(resolver(escenario_ejemplo))
+
+    # Un FT de Mañana del lunes pasa a Libre: falta una persona de Mañana
+    trabajador = next(t for t, h in editor.horarios.items() if h["Lunes"] == "Mañana")
+    assert editor.editar(trabajador, "Lunes", "Libre").tolist() == [1, 0, 0]
+    editor.deshacer()
+    assert editor.deficit_dia(0).tolist() == [0, 0, 0]
+
+
+def test_pt_de_menos_se_suple_con_ft_de_mas(escenario_ejemplo):
+    editor = _editor(resolver(escenario_ejemplo))
+    sabado = 5
+    pt = next(t for t, h in editor.horarios.items() if h["Sábado"] == "Part-Time")
+
+    # Sin el PT falta una persona de Intermedio/Tarde
+    assert editor.editar(pt, "Sábado", "Libre").tolist() == [0, 1, 0]
+
+    # Un FT libre ese día que pasa a Tarde la cubre
+    libre = next(t for t, h in editor.horarios.items()
+                 if t.startswith("Trabajador") and h["Sábado"] == "Libre")
+    assert editor.editar(libre, "Sábado", "Tarde").tolist() == [0, 0, 0]
+    assert np.array_equal(editor.deficit_dia(sabado), [0, 0, 0])
+
+
+def test_editar_celda_con_etiqueta_desconocida(escenario_ejemplo):
+    resultado = resolver(escenario_ejemplo)
+    horarios = resultado.horarios.a_diccionario()
+    trabajador = next(t for t, h in horarios.items() if h["Lunes"] == "Mañana")
+    horarios[trabajador]["Lunes"] = "Vacaciones"  # etiqueta de un informe importado
+    editor = EditorHorarios(horarios, resultado.matriz)
+
+    with pytest.raises(ValueError, match=f"{trabajador} el Lunes: 'Vacaciones'"):
+        editor.editar(trabajador, "Lunes", "Libre")
+    assert horarios[trabajador]["Lunes"] == "Vacaciones" and not editor.puede_deshacer
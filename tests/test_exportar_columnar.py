@@ -0,0 +1,55 @@
+import csv
+
+import numpy as np
+import pytest
+
+from exportar_columnar import EscritorColumnar, leer_columnar
+from main import generar_asignacion
+from benchmark import PERFIL_DEMANDA
+
+
+def _resultado(full_time):
+    return generar_asignacion(full_time, 4, "A", PERFIL_DEMANDA)
+
+
+def _diccionario(directorio, nombre):
+    with open(directorio / f"diccionario_{nombre}.csv", newline="", encoding="utf-8") as f:
+        return {fila["nombre"]: int(fila["id"]) for fila in csv.DictReader(f)}
+
+
+def _escribir(directorio, formato, tiendas, semana):
+    with EscritorColumnar(str(directorio), formato, filas_por_bloque=100, semana=semana) as escritor:
+        return [escritor.agregar(nombre, r.matriz, r.horarios) for nombre, r in tiendas]
+
+
+@pytest.mark.parametrize("formato", ["csv", "npz"])
+def test_dos_ejecuciones_sin_duplicados(tmp_path, formato):
+    norte, sur, este = _resultado(10), _resultado(14), _resultado(8)
+
+    assert _escribir(tmp_path, formato, [("Norte", norte), ("Sur", sur)], 202641) == [True, True]
+    tiendas = _diccionario(tmp_path, "tiendas")
+    trabajadores = _diccionario(tmp_path, "trabajadores")
+
+    # Segunda corrida: se repite la semana 41 (reanudación) y se agrega la 42
+    agregados = _escribir(tmp_path, formato,
+                          [("Sur", sur), ("Este", este), ("Norte", norte)], 202641)
+    agregados += _escribir(tmp_path, formato, [("Norte", norte)], 202642)
+    assert agregados == [False, True, False, True]
+
+    # Los ids ya asignados no cambian; los nuevos se anexan
+    nuevos = _diccionario(tmp_path, "tiendas")
+    assert {k: nuevos[k] for k in tiendas} == tiendas and nuevos["Este"] == 2
+    assert {k: v for k, v in _diccionario(tmp_path, "trabajadores").items() if k in trabajadores} \
+        == trabajadores
+
+    horarios = leer_columnar(str(tmp_path), "horarios")
+    matriz = leer_columnar(str(tmp_path), "matriz")
+    filas = 7 * (2 * len(norte.trabajadores) + len(sur.trabajadores) + len(este.trabajadores))
+    assert len(horarios["tienda"]) == filas
+    assert len(matriz["tienda"]) == 21 * 4
+
+    # Las filas se decodifican al mismo resultado
+    sur_41 = (horarios["tienda"] == nuevos["Sur"]) & (horarios["semana"] == 202641)
+    assert np.array_equal(horarios["turno"][sur_41].reshape(-1, 7), sur.codigos)
+    norte_42 = (matriz["tienda"] == nuevos["Norte"]) & (matriz["semana"] == 202642)
+    assert np.array_equal(matriz["personas"][norte_42].reshape(7, 3), norte.matriz)
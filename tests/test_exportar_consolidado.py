@@ -0,0 +1,51 @@
+import numpy as np
+import openpyxl
+
+from config import DIAS_SEMANA
+from exportar_consolidado import exportar_consolidado, resultados_desde_directorio
+from leer_excel import leer_parametros
+from main import resolver
+from pronostico import a_demanda, escribir_plantilla
+
+
+def _bloque(ws, titulo):
+    """Filas (día, Mañana, Intermedio, Tarde, Total) bajo el encabezado `titulo`."""
+    filas = list(ws.iter_rows(values_only=True))
+    inicio = next(k for k, fila in enumerate(filas) if fila[0] == titulo) + 2
+    return filas[inicio:inicio + 7]
+
+
+def test_resumen_regional_suma_las_tiendas(tmp_path, libro_ejemplo):
+    entradas = tmp_path / "entradas"
+    entradas.mkdir()
+    rng = np.random.default_rng(0)
+    for k, full_time in enumerate((12, 21, 40)):
+        demanda = a_demanda(rng.integers(20, 300, size=(7, 3)).astype(float))
+        escribir_plantilla(str(entradas / f"tienda_{k}.xlsx"), full_time, 6, "AB"[k % 2], demanda)
+    (entradas / "tienda_rota.xlsx").write_bytes(b"no es un libro")
+
+    fallidos = []
+    ruta = str(tmp_path / "regional.xlsx")
+    total = exportar_consolidado(ruta, resultados_desde_directorio(str(entradas), fallidos=fallidos))
+
+    assert total == 3
+    assert [r.endswith("tienda_rota.xlsx") for r, _ in fallidos] == [True]
+
+    matrices = [resolver(leer_parametros(str(entradas / f"tienda_{k}.xlsx"))).matriz
+                for k in range(3)]
+    esperado = np.sum(matrices, axis=0)
+
+    wb = openpyxl.load_workbook(ruta)
+    assert wb.sheetnames == ["Resumen Regional", "tienda_0", "tienda_1", "tienda_2", "Leyenda"]
+    ws = wb["Resumen Regional"]
+    filas = _bloque(ws, "TOTAL POR DÍA / TURNO")
+    assert [fila[0] for fila in filas] == DIAS_SEMANA
+    assert np.array_equal([fila[1:4] for fila in filas], esperado)
+    assert [fila[4] for fila in filas] == esperado.sum(axis=1).tolist()
+
+    maximos = _bloque(ws, "MÁXIMO ENTRE TIENDAS")
+    assert np.array_equal([fila[1:4] for fila in maximos], np.max(matrices, axis=0))
+
+    # Estilos con nombre asignados a las celdas
+    assert ws["A1"].style == "titulo"
+    assert wb["tienda_0"]["B15"].style.startswith("turno ")
@@ -0,0 +1,32 @@
+import numpy as np
+
+from exportar_excel import exportar_informe_completo
+from importar_informe import escanear_informes, leer_informe
+from main import resolver
+from reglas_laborales import verificar_horarios
+
+
+def test_exportar_y_leer_conserva_el_informe(tmp_path, escenario_ejemplo):
+    matriz, sab, dom, horarios = resolver(escenario_ejemplo)
+    parametros = escenario_ejemplo.parametros
+    demanda = {dia: dict(fila) for dia, fila in escenario_ejemplo.demanda.items()}
+    horarios = horarios.a_diccionario()
+
+    ruta = str(tmp_path / "Informe_Turnos_prueba.xlsx")
+    exportar_informe_completo(ruta, parametros, demanda, matriz, sab, dom, horarios,
+                              incumplimientos=verificar_horarios(horarios))
+
+    leido = leer_informe(ruta)
+    assert leido[0] == parametros
+    assert leido[1] == demanda
+    assert np.array_equal(leido[2], matriz)
+    assert leido[3:5] == (sab, dom)
+    assert leido[5] == horarios
+
+    # El escaneo en bloque devuelve lo mismo y reporta los archivos no válidos
+    (tmp_path / "Informe_Turnos_roto.xlsx").write_bytes(b"no es un libro")
+    escaneo = {ruta: (resultado, error) for ruta, resultado, error
+               in escanear_informes(str(tmp_path), procesos=1)}
+    assert escaneo[ruta][0][5] == horarios and escaneo[ruta][1] is None
+    roto = escaneo[str(tmp_path / "Informe_Turnos_roto.xlsx")]
+    assert roto[0] is None and roto[1] is not None
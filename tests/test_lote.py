@@ -0,0 +1,62 @@
+import json
+import os
+import shutil
+
+import lote
+
+
+def _registros(ruta):
+    with open(ruta, encoding="utf-8") as f:
+        return [(r["etapa"], r["estado"]) for r in map(json.loads, f)]
+
+
+def test_etapas_en_curso_antes_de_exportar(tmp_path, libro_ejemplo, monkeypatch):
+    entradas, salidas = tmp_path / "entradas", tmp_path / "salidas"
+    entradas.mkdir()
+    shutil.copy(libro_ejemplo, entradas / "tienda_01.xlsx")
+    manifiesto = str(salidas / lote.MANIFIESTO)
+    vistos = []
+
+    def exportar_interrumpido(*args, **kwargs):
+        vistos.append(lote.leer_manifiesto(manifiesto))
+        raise MemoryError("corte durante la exportación")
+
+    monkeypatch.setattr(lote, "exportar_informe_completo", exportar_interrumpido)
+    conteo = lote.procesar_lote(str(entradas), str(salidas))
+
+    # Al empezar la exportación el manifiesto ya registra la etapa "generado"
+    (registro,) = vistos[0].values()
+    assert (registro["etapa"], registro["estado"]) == ("generado", "en_curso")
+    assert _registros(manifiesto) == [("pendiente", "en_curso"), ("leido", "en_curso"),
+                                      ("generado", "en_curso"), ("generado", "fallido")]
+    assert conteo["fallido"] == 1
+
+    # Al reanudar se completa y la entrada queda como completada
+    monkeypatch.undo()
+    assert lote.procesar_lote(str(entradas), str(salidas))["completado"] == 1
+    assert _registros(manifiesto)[-1] == ("exportado", "completado")
+    assert os.path.exists(lote.ruta_salida(str(entradas / "tienda_01.xlsx"), str(salidas)))
+
+
+def test_misma_entrada_por_otra_ruta_y_estado(tmp_path, libro_ejemplo, monkeypatch, capsys):
+    entradas, salidas = tmp_path / "entradas", tmp_path / "salidas"
+    entradas.mkdir()
+    shutil.copy(libro_ejemplo, entradas / "tienda_01.xlsx")
+    shutil.copy(libro_ejemplo, entradas / "tienda_02.xlsx")
+    (entradas / "tienda_03.xlsx").write_bytes(b"no es un libro")
+    monkeypatch.chdir(tmp_path)
+
+    conteo = lote.procesar_lote("entradas", str(salidas))
+    assert (conteo["completado"], conteo["fallido"]) == (2, 1)
+
+    # Otra ruta relativa al mismo directorio no vuelve a procesar los libros
+    monkeypatch.chdir(entradas)
+    conteo = lote.procesar_lote(os.path.join("..", "entradas"), str(salidas),
+                                reintentar_fallidos=False)
+    assert conteo == {"omitido": 3}
+
+    lote.main_cli(["estado", str(salidas / lote.MANIFIESTO)])
+    salida = capsys.readouterr().out
+    por_etapa = salida.split("Por etapa:")[1].split("Fallidos:")[0].split()
+    assert por_etapa == ["pendiente", "1", "exportado", "2"]
+    assert "tienda_03.xlsx (etapa: pendiente)" in salida
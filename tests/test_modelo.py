@@ -0,0 +1,72 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from config import DIAS_SEMANA
+from main import resolver
+from modelo import Escenario, ResultadoAsignacion, VistaDemanda
+
+
+def test_leer_parametros_devuelve_escenario(escenario_ejemplo):
+    assert isinstance(escenario_ejemplo, Escenario)
+    assert escenario_ejemplo.afluencias.shape == (7, 3)
+    assert escenario_ejemplo.demanda["Lunes"]["Mañana"] == escenario_ejemplo.afluencias[0, 0]
+    assert isinstance(escenario_ejemplo.demanda, VistaDemanda)
+
+
+def test_inmutables(escenario_ejemplo):
+    resultado = resolver(escenario_ejemplo)
+    with pytest.raises(AttributeError):
+        escenario_ejemplo.full_time = 1
+    with pytest.raises(AttributeError):
+        resultado.descanso_sab = 0
+    with pytest.raises(ValueError):
+        escenario_ejemplo.afluencias[0, 0] = 1
+    with pytest.raises(ValueError):
+        resultado.codigos[0, 0] = 0
+
+
+def test_igualdad_y_hash_por_contenido(escenario_ejemplo):
+    copia = Escenario(*escenario_ejemplo.parametros, escenario_ejemplo.afluencias.copy())
+    assert copia == escenario_ejemplo and hash(copia) == hash(escenario_ejemplo)
+    assert len({copia, escenario_ejemplo}) == 1
+
+    otra = Escenario(escenario_ejemplo.full_time + 1, escenario_ejemplo.part_time,
+                     escenario_ejemplo.tipo, escenario_ejemplo.afluencias)
+    assert otra != escenario_ejemplo
+
+    resultado = resolver(escenario_ejemplo)
+    assert resolver(copia) == resultado and hash(resolver(copia)) == hash(resultado)
+
+
+def test_pickle(escenario_ejemplo):
+    resultado = resolver(escenario_ejemplo)
+    for objeto in (escenario_ejemplo, resultado):
+        recuperado = pickle.loads(pickle.dumps(objeto))
+        assert recuperado == objeto and hash(recuperado) == hash(objeto)
+
+    recuperado = pickle.loads(pickle.dumps(resultado))
+    assert not recuperado.codigos.flags.writeable
+    assert recuperado.trabajadores == resultado.trabajadores
+
+
+def test_a_diccionario_es_copia_editable(escenario_ejemplo):
+    resultado = resolver(escenario_ejemplo)
+    horarios = resultado.horarios.a_diccionario()
+
+    assert list(horarios) == list(resultado.trabajadores)
+    for trabajador, horario in resultado.horarios.items():
+        assert horarios[trabajador] == dict(horario)
+        assert list(horarios[trabajador]) == DIAS_SEMANA
+
+    primero = resultado.trabajadores[0]
+    horarios[primero]["Lunes"] = "Libre"
+    assert ResultadoAsignacion.desde_horarios(
+        resultado.matriz, resultado.descanso_sab, resultado.descanso_dom, horarios) != resultado
+
+
+def test_sin_registro_en_la_vista():
+    resultado = ResultadoAsignacion(np.zeros((7, 3)), 0, 0, ["T1"], [[2, -1, 2, 2, 2, 1, 1]])
+    assert resultado.horarios["T1"]["Martes"] == "(sin registro)"
+    assert resultado.horarios.a_diccionario()["T1"]["Martes"] == "(sin registro)"
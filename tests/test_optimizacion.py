@@ -0,0 +1,62 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from config import OPTIMIZACION
+from optimizacion import repartir_optimo
+
+
+def _costo_cupo(x, objetivo):
+    r = max(float(objetivo), 1e-3)
+    peso = OPTIMIZACION['peso_deficit'] if x < r else OPTIMIZACION['peso_exceso']
+    return peso * (x - r) ** 2 / r
+
+
+def _objetivo(afluencias, ft_por_dia, total_pt):
+    capacidad = ft_por_dia.sum() + 2 * total_pt
+    return afluencias * (capacidad / afluencias.sum())
+
+
+def _costo(asignacion_ft, refuerzo_pt, objetivo):
+    total = asignacion_ft + refuerzo_pt
+    desviacion = sum(_costo_cupo(total[i, j], objetivo[i, j]) for i in range(7) for j in range(3))
+    return desviacion + OPTIMIZACION['costo_pt'] * refuerzo_pt.sum()
+
+
+def _fuerza_bruta(afluencias, ft_por_dia, total_pt):
+    """Mínimo costo enumerando cada reparto posible (el costo se separa por día)."""
+    objetivo = _objetivo(afluencias, ft_por_dia, total_pt)
+    minimo = 0.0
+    for i in range(7):
+        opciones_pt = [(0, 0)]
+        if i >= 5:
+            opciones_pt = [(a, b) for a in range(total_pt + 1) for b in range(total_pt + 1 - a)]
+        mejor = np.inf
+        for m, t in itertools.product(range(ft_por_dia[i] + 1), repeat=2):
+            intermedio = ft_por_dia[i] - m - t
+            if intermedio < 0:
+                continue
+            for a, b in opciones_pt:
+                fila = [m, intermedio + a, t + b]
+                costo = sum(_costo_cupo(x, objetivo[i, j]) for j, x in enumerate(fila))
+                mejor = min(mejor, costo + OPTIMIZACION['costo_pt'] * (a + b))
+        minimo += mejor
+    return minimo
+
+
+@pytest.mark.parametrize("semilla", range(8))
+def test_optimo_coincide_con_fuerza_bruta(semilla):
+    rng = np.random.default_rng(semilla)
+    afluencias = rng.integers(10, 300, size=(7, 3)).astype(float)
+    ft_por_dia = rng.integers(3, 9, size=7)
+    total_pt = int(rng.integers(0, 4))
+
+    asignacion_ft, refuerzo_pt = repartir_optimo(afluencias, ft_por_dia, total_pt)
+
+    assert asignacion_ft.sum(axis=1).tolist() == ft_por_dia.tolist()
+    assert refuerzo_pt[:5].sum() == 0 and refuerzo_pt[:, 0].sum() == 0
+    assert refuerzo_pt[5:].sum(axis=1).max() <= total_pt
+    objetivo = _objetivo(afluencias, ft_por_dia, total_pt)
+    assert _costo(asignacion_ft, refuerzo_pt, objetivo) == pytest.approx(
+        _fuerza_bruta(afluencias, ft_por_dia, total_pt))
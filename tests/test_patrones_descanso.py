@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+import estrategias
+from estrategias import registrar_reparto
+from main import generar_asignacion, repartir_proporcional
+from patrones_descanso import (
+    disponibilidad_por_dia, patrones_rotativos, verificar_cobertura,
+)
+
+
+def test_verificar_cobertura_con_patrones_rotativos():
+    # 14 FT con dos días seguidos de descanso: 10 disponibles cada día
+    patrones = patrones_rotativos(14)
+    assert disponibilidad_por_dia(patrones).tolist() == [10] * 7
+
+    matriz = np.full((7, 3), 3)
+    assert verificar_cobertura(patrones, matriz)[0]
+
+    matriz[2] = [4, 4, 4]
+    cubrible, faltantes = verificar_cobertura(patrones, matriz)
+    assert not cubrible
+    assert faltantes.tolist() == [0, 0, 2, 0, 0, 0, 0]
+
+
+@pytest.fixture
+def reparto_excedido(monkeypatch):
+    """Estrategia que ignora la disponibilidad del domingo."""
+    monkeypatch.setattr(estrategias, "ESTRATEGIAS_REPARTO", dict(estrategias.ESTRATEGIAS_REPARTO))
+
+    @registrar_reparto("excedido")
+    def excedido(afluencias, ft_por_dia, total_pt):
+        asignacion_ft, refuerzo_pt = repartir_proporcional(afluencias, ft_por_dia, total_pt)
+        asignacion_ft[6, 0] += 1
+        return asignacion_ft, refuerzo_pt
+
+    return "excedido"
+
+
+def test_reparto_que_excede_los_patrones_falla(escenario_ejemplo, reparto_excedido):
+    full, part, tipo, demanda = escenario_ejemplo
+    with pytest.raises(ValueError, match="no cubren la asignación"):
+        generar_asignacion(full, part, tipo, demanda, reparto=reparto_excedido)
@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from benchmark import PERFIL_DEMANDA
+from main import generar_asignacion
+from perfilado import Perfilador, agregar_perfiles, escribir_pilas, leer_pilas
+
+
+def _ocupado(segundos):
+    fin = time.perf_counter() + segundos
+    while time.perf_counter() < fin:
+        pass
+
+
+def c():
+    _ocupado(0.05)
+
+
+def b():
+    c()
+
+
+def a():
+    b()
+
+
+def _nombres(pila):
+    return [marco.split(" (", 1)[0] for marco in pila.split(";")]
+
+
+@pytest.mark.parametrize("modo", ["determinista", "muestreo"])
+def test_pilas_colapsadas(tmp_path, modo):
+    with Perfilador(modo, intervalo=0.001) as perfil:
+        a()
+    pilas = perfil.pilas()
+
+    # Las pilas que pasan por a;b;c suman el tiempo de c (µs o muestras)
+    abc = {p: n for p, n in pilas.items() if ";a;b;c;" in ";" + ";".join(_nombres(p)) + ";"}
+    assert abc and all(n > 0 for n in abc.values())
+    assert all("c (test_perfilado.py:" in p for p in abc)
+    if modo == "determinista":
+        assert sum(abc.values()) >= 40_000
+
+    # Formato `a;b;c N` al escribir y leer
+    ruta = str(tmp_path / "perfil.folded")
+    escribir_pilas(ruta, pilas)
+    with open(ruta, encoding="utf-8") as f:
+        for linea in f:
+            pila, cantidad = linea.rstrip("\n").rsplit(" ", 1)
+            assert pilas[pila] == int(cantidad)
+    assert leer_pilas(ruta) == pilas
+
+
+def test_agregar_perfiles(tmp_path):
+    pilas = []
+    for k, full_time in enumerate((10, 14)):
+        with Perfilador("determinista") as perfil:
+            generar_asignacion(full_time, 4, "A", PERFIL_DEMANDA)
+        perfil.guardar(str(tmp_path / f"tarea_{k}"))
+        pilas.append(perfil.pilas())
+
+    resumen = agregar_perfiles(str(tmp_path))
+    assert resumen['tareas'] == 2 and resumen['modo'] == "determinista"
+    assert leer_pilas(str(tmp_path / "perfil.folded")) == pilas[0] + pilas[1]
+    assert (tmp_path / "perfil.pstats").exists()
+    llamadas = {f: n for f, n, _, _ in resumen['funciones']}
+    assert llamadas["generar_asignacion"] == 2
+    assert "generar_asignacion" in (tmp_path / "perfil.txt").read_text(encoding="utf-8")
+
+    # Volver a agregar no suma el agregado anterior
+    assert agregar_perfiles(str(tmp_path))['total_s'] == pytest.approx(resumen['total_s'])
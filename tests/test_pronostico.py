@@ -0,0 +1,83 @@
+import os
+
+import numpy as np
+import openpyxl
+import pytest
+
+from pronostico import a_demanda, cargar_historico, cargar_tiendas, escribir_plantilla
+
+
+@pytest.fixture
+def directorio_historico(tmp_path):
+    directorio = tmp_path / "tienda_01"
+    directorio.mkdir()
+    for semana in range(9):
+        demanda = a_demanda(np.full((7, 3), 10.0 * (semana + 1)))
+        escribir_plantilla(str(directorio / f"semana_{semana:02d}.xlsx"), 21, 10, "A", demanda)
+    (directorio / "semana_04b.xlsx").write_bytes(b"no es un libro")
+    return directorio
+
+
+@pytest.mark.parametrize("procesos", [1, 2])
+def test_libro_invalido_se_omite_y_se_informa(directorio_historico, procesos):
+    fallidos = []
+    rutas, historico = cargar_historico(str(directorio_historico), procesos=procesos,
+                                        fallidos=fallidos)
+
+    assert len(rutas) == historico.shape[0] == 9
+    assert historico[:, 0, 0].tolist() == [10.0 * (k + 1) for k in range(9)]
+    assert [os.path.basename(r) for r, _ in fallidos] == ["semana_04b.xlsx"]
+
+
+def test_sin_fallidos_se_avisa(directorio_historico):
+    with pytest.warns(UserWarning, match="semana_04b.xlsx"):
+        cargar_historico(str(directorio_historico), procesos=1)
+
+
+def test_cache_fuera_del_directorio(directorio_historico, tmp_path):
+    cache = str(tmp_path / "cache" / "tienda_01.npz")
+    contenido = sorted(os.listdir(directorio_historico))
+
+    _, primero = cargar_historico(str(directorio_historico), procesos=1, cache=cache, fallidos=[])
+    assert os.path.exists(cache)
+    assert sorted(os.listdir(directorio_historico)) == contenido
+
+    # El libro fallido no queda en el caché: se vuelve a intentar y a informar
+    fallidos = []
+    _, segundo = cargar_historico(str(directorio_historico), procesos=1, cache=cache,
+                                  fallidos=fallidos)
+    assert np.array_equal(primero, segundo)
+    assert len(fallidos) == 1
+
+
+def test_informe_sin_afluencia_se_omite(directorio_historico):
+    # Informe antiguo: solo la matriz de turnos (personas) en E6:G12
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Resumen General"
+    for fila in ws.iter_rows(min_row=6, max_row=12, min_col=5, max_col=7):
+        for celda in fila:
+            celda.value = 3
+    wb.save(str(directorio_historico / "semana_09.xlsx"))
+
+    fallidos = []
+    rutas, historico = cargar_historico(str(directorio_historico), procesos=1, fallidos=fallidos)
+    assert historico.shape[0] == 9 and 3.0 not in historico
+    assert sorted(os.path.basename(r) for r, _ in fallidos) == ["semana_04b.xlsx", "semana_09.xlsx"]
+    assert "afluencia" in dict(fallidos)[str(directorio_historico / "semana_09.xlsx")]
+
+
+@pytest.mark.parametrize("procesos", [1, 2])
+def test_cargar_tiendas(directorio_historico, procesos):
+    otra = directorio_historico.parent / "tienda_02"
+    otra.mkdir()
+    for semana in range(8):
+        escribir_plantilla(str(otra / f"semana_{semana:02d}.xlsx"), 21, 10, "A",
+                           a_demanda(np.full((7, 3), 5.0)))
+
+    fallidos = []
+    tiendas = cargar_tiendas(str(directorio_historico.parent), procesos=procesos,
+                             fallidos=fallidos)
+    assert list(tiendas) == ["tienda_01", "tienda_02"]
+    assert tiendas["tienda_01"].shape == (9, 7, 3) and tiendas["tienda_02"].shape == (8, 7, 3)
+    assert len(fallidos) == 1
@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+import simulacion
+from main import resolver
+from simulacion import simular_robustez
+
+
+def test_incluye_percentil_configurado(monkeypatch, escenario_ejemplo):
+    resultado = resolver(escenario_ejemplo)
+    monkeypatch.setitem(simulacion.SIMULACION, 'percentil', 80)
+    riesgo = simular_robustez(resultado.matriz, escenario_ejemplo.demanda, n_muestras=1000)
+
+    assert list(riesgo['percentiles']) == [50, 80, 90, 95, 99]
+    assert riesgo['percentiles'][80].shape == (7, 3)
+    assert np.all(riesgo['percentiles'][80] <= riesgo['percentiles'][90])
+    assert 80 in riesgo['deficit_semanal']
+
+
+def test_percentil_fuera_de_rango():
+    with pytest.raises(ValueError):
+        simular_robustez(np.ones((7, 3)), np.ones((7, 3)), n_muestras=10, percentiles=(50, 120))
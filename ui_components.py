@@ -4,8 +4,9 @@ Cada clase encapsula un `ttk.Treeview` con su scrollbar y la lógica mínima
 para actualizar los datos. Esto permite mantener el código de la interfaz
 principal (`app.py`) limpio y centrado en la disposición de los componentes.
 """
+import tkinter as tk
 from tkinter import ttk
-from config import DIAS_SEMANA, TURNOS
+from config import DIAS_SEMANA, TURNOS, COLORS
 
 
 class DemandaTreeview:
@@ -112,7 +113,8 @@ class HorarioTrabajadoresTreeview:
     """Treeview que muestra el horario semanal de cada trabajador.
 
     Incluye scroll vertical y horizontal para navegar cuando hay muchos
-    trabajadores o cuando la ventana es estrecha.
+    trabajadores o cuando la ventana es estrecha. Con `habilitar_edicion`
+    un doble clic sobre una celda de día abre un menú para cambiar el turno.
     """
 
     def __init__(self, parent):
@@ -156,6 +158,160 @@ class HorarioTrabajadoresTreeview:
         for item in self.tree.get_children():
             self.tree.delete(item)
 
+        # El nombre del trabajador se usa como id de fila para actualizar
+        # celdas individuales sin buscar en la tabla
         for trabajador, horario in horarios_trabajadores.items():
             valores = [trabajador] + [horario[dia] for dia in DIAS_SEMANA]
+            self.tree.insert("", "end", iid=trabajador, values=valores)
+
+    def resaltar_cambios(self, diferencia, horarios_trabajadores):
+        """Marca las filas y celdas que cambiaron respecto a otra ejecución.
+
+        Recibe el dict de `diferencias.diferenciar` y los horarios actuales,
+        con los que se restauran las celdas de una comparación anterior. Solo
+        se tocan las filas con cambios; cada celda cambiada muestra
+        "nuevo ← anterior".
+        """
+        self.tree.tag_configure("cambiado", background=COLORS['bg_cambio'])
+        self.limpiar_cambios(horarios_trabajadores)
+
+        for trabajador, dia, antes, despues in diferencia['celdas']:
+            if self.tree.exists(trabajador):
+                self.tree.item(trabajador, tags=("cambiado",))
+                self.tree.set(trabajador, dia, f"{despues} ← {antes}")
+
+    def limpiar_cambios(self, horarios_trabajadores):
+        """Quita el resaltado y vuelve a mostrar los turnos actuales de esas filas."""
+        for trabajador in self.tree.tag_has("cambiado"):
+            horario = horarios_trabajadores.get(trabajador, {})
+            self.tree.item(trabajador, tags=(),
+                           values=[trabajador] + [horario.get(dia, "") for dia in DIAS_SEMANA])
+
+    def actualizar_celda(self, trabajador, dia, valor):
+        """Cambia el valor mostrado en una sola celda (O(1))."""
+        self.tree.set(trabajador, dia, valor)
+
+    def habilitar_edicion(self, opciones, al_editar):
+        """Activa la edición de celdas con doble clic.
+
+        Args:
+            opciones (callable): (trabajador, dia) -> lista de valores válidos
+            al_editar (callable): (trabajador, dia, valor) llamado al elegir un valor
+        """
+        self._opciones = opciones
+        self._al_editar = al_editar
+        self.tree.bind("<Double-1>", self._mostrar_menu_edicion)
+
+    def _mostrar_menu_edicion(self, event):
+        """Muestra un menú contextual con los turnos válidos para la celda."""
+        trabajador = self.tree.identify_row(event.y)
+        columna = self.tree.identify_column(event.x)
+        if not trabajador or columna in ("", "#1"):
+            return
+
+        dia = DIAS_SEMANA[int(columna[1:]) - 2]
+        actual = self.tree.set(trabajador, dia)
+
+        menu = tk.Menu(self.tree, tearoff=0)
+        for valor in self._opciones(trabajador, dia):
+            menu.add_command(
+                label=f"✔ {valor}" if valor == actual else valor,
+                command=lambda v=valor: self._al_editar(trabajador, dia, v)
+            )
+        menu.tk_popup(event.x_root, event.y_root)
+
+
+class RiesgoTreeview:
+    """Treeview que muestra el resultado de la simulación de robustez.
+
+    Cada celda contiene el déficit de personal en el percentil configurado
+    y, entre paréntesis, la probabilidad de que falte al menos una persona.
+    """
+
+    def __init__(self, parent):
+        self.frame = ttk.Frame(parent)
+
+        scrollbar = ttk.Scrollbar(self.frame, orient="vertical")
+        scrollbar.pack(side="right", fill="y")
+
+        cols = ["Día", *TURNOS]
+        self.tree = ttk.Treeview(
+            self.frame,
+            columns=cols,
+            show="headings",
+            yscrollcommand=scrollbar.set,
+            height=8
+        )
+        self.tree.pack(fill="both", expand=True)
+        scrollbar.config(command=self.tree.yview)
+
+        self.tree.heading("Día", text="Día")
+        self.tree.column("Día", width=120, anchor="w")
+
+        for turno in TURNOS:
+            self.tree.heading(turno, text=turno)
+            self.tree.column(turno, width=150, anchor="center")
+
+    def limpiar(self):
+        """Quita las filas de la simulación mostrada."""
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+
+    def actualizar(self, riesgo, percentil):
+        """Rellena la tabla con el dict devuelto por `simular_robustez`."""
+        self.limpiar()
+
+        deficit = riesgo['percentiles'][percentil]
+        prob = riesgo['prob_deficit']
+        for i, dia in enumerate(DIAS_SEMANA):
+            valores = [dia] + [f"{deficit[i][j]:.1f} ({prob[i][j]:.0%})" for j in range(len(TURNOS))]
             self.tree.insert("", "end", values=valores)
+
+
+class NormativaTreeview:
+    """Treeview con los incumplimientos de reglas laborales.
+
+    Cada fila es (Trabajador, Regla, Detalle). Las filas se identifican por
+    trabajador para poder reemplazar solo las de un trabajador tras una
+    edición manual.
+    """
+
+    def __init__(self, parent):
+        self.frame = ttk.Frame(parent)
+
+        scrollbar = ttk.Scrollbar(self.frame, orient="vertical")
+        scrollbar.pack(side="right", fill="y")
+
+        cols = ["Trabajador", "Regla", "Detalle"]
+        self.tree = ttk.Treeview(
+            self.frame,
+            columns=cols,
+            show="headings",
+            yscrollcommand=scrollbar.set,
+            height=6
+        )
+        self.tree.pack(fill="both", expand=True)
+        scrollbar.config(command=self.tree.yview)
+
+        for col, width in zip(cols, (150, 220, 200)):
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=width, anchor="w")
+
+    def actualizar(self, incumplimientos):
+        """Muestra la lista de tuplas (trabajador, regla, detalle)."""
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+
+        for trabajador, regla, detalle in incumplimientos:
+            self.tree.insert("", "end", iid=f"{trabajador}|{regla}",
+                             values=(trabajador, regla, detalle))
+
+    def actualizar_trabajador(self, trabajador, incumplimientos):
+        """Reemplaza solo las filas de `trabajador` con sus nuevos incumplimientos."""
+        for item in self.tree.get_children():
+            if item.startswith(f"{trabajador}|"):
+                self.tree.delete(item)
+
+        for _, regla, detalle in incumplimientos:
+            self.tree.insert("", 0, iid=f"{trabajador}|{regla}",
+                             values=(trabajador, regla, detalle))